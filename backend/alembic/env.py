@@ -8,7 +8,7 @@ from alembic import context
 # Import app config and models
 from app.config import get_settings
 from app.database import Base
-from app.models import User, Account, Stage
+from app.models import User, Account, Stage, StageMessage, CompanyResearch, LLMResponseCache, OrchestratorValidation
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,67 @@
+"""add_stage_messages_table
+
+Revision ID: 3f1a9c2b7d41
+Revises: de942d2cc5d0
+Create Date: 2026-10-17 10:12:03.418230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1a9c2b7d41'
+down_revision: Union[str, Sequence[str], None] = 'de942d2cc5d0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('stage_messages',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('stage_id', sa.UUID(), nullable=False),
+    sa.Column('seq', sa.Integer(), nullable=False),
+    sa.Column('role', sa.String(length=20), nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['stage_id'], ['stages.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('stage_id', 'seq', name='uq_stage_message_seq')
+    )
+    op.add_column('stages', sa.Column('message_count', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill: move Stage.state['messages'] into stage_messages
+    op.execute("""
+        INSERT INTO stage_messages (id, stage_id, seq, role, content, created_at)
+        SELECT gen_random_uuid(), s.id, (m.ord - 1)::int,
+               COALESCE(m.elem->>'role', 'user'), COALESCE(m.elem->>'content', ''), s.updated_at
+        FROM stages s
+        CROSS JOIN LATERAL jsonb_array_elements(s.state->'messages') WITH ORDINALITY AS m(elem, ord)
+        WHERE jsonb_typeof(s.state->'messages') = 'array'
+    """)
+    op.execute("""
+        UPDATE stages
+        SET message_count = jsonb_array_length(state->'messages'),
+            state = state - 'messages'
+        WHERE jsonb_typeof(state->'messages') = 'array'
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Fold the transcripts back into Stage.state['messages']
+    op.execute("""
+        UPDATE stages s
+        SET state = s.state || jsonb_build_object('messages', m.messages)
+        FROM (
+            SELECT stage_id,
+                   jsonb_agg(jsonb_build_object('role', role, 'content', content) ORDER BY seq) AS messages
+            FROM stage_messages
+            GROUP BY stage_id
+        ) m
+        WHERE m.stage_id = s.id
+    """)
+    op.drop_column('stages', 'message_count')
+    op.drop_table('stage_messages')
@@ -0,0 +1,40 @@
+"""add_company_research_cache
+
+Revision ID: 8c4e2d1f0a57
+Revises: 3f1a9c2b7d41
+Create Date: 2026-10-17 11:40:22.905114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '8c4e2d1f0a57'
+down_revision: Union[str, Sequence[str], None] = '3f1a9c2b7d41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('company_research',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('cache_key', sa.String(length=600), nullable=False),
+    sa.Column('domain', sa.String(length=255), nullable=True),
+    sa.Column('company_name', sa.String(length=255), nullable=False),
+    sa.Column('data', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('fetched_at', sa.DateTime(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_company_research_cache_key'), 'company_research', ['cache_key'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_company_research_cache_key'), table_name='company_research')
+    op.drop_table('company_research')
@@ -0,0 +1,32 @@
+"""add_stage_validation_id
+
+Revision ID: a9d3e5f71b28
+Revises: f4b8e2d61c37
+Create Date: 2026-10-17 18:05:12.431907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d3e5f71b28'
+down_revision: Union[str, Sequence[str], None] = 'f4b8e2d61c37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('stages', sa.Column('validation_id', sa.UUID(), nullable=True))
+    op.create_foreign_key(
+        'stages_validation_id_fkey', 'stages', 'orchestrator_validations',
+        ['validation_id'], ['id'], ondelete='SET NULL'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('stages_validation_id_fkey', 'stages', type_='foreignkey')
+    op.drop_column('stages', 'validation_id')
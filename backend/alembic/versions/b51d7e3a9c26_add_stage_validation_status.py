@@ -0,0 +1,29 @@
+"""add_stage_validation_status
+
+Revision ID: b51d7e3a9c26
+Revises: 8c4e2d1f0a57
+Create Date: 2026-10-17 13:05:47.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b51d7e3a9c26'
+down_revision: Union[str, Sequence[str], None] = '8c4e2d1f0a57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('stages', sa.Column('validation_status', sa.String(length=20), nullable=True))
+    # Stages validated before background validation existed
+    op.execute("UPDATE stages SET validation_status = 'completed' WHERE orchestrator_approved IS NOT NULL")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('stages', 'validation_status')
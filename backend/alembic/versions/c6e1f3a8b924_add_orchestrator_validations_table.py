@@ -0,0 +1,47 @@
+"""add_orchestrator_validations_table
+
+Revision ID: c6e1f3a8b924
+Revises: b51d7e3a9c26
+Create Date: 2026-10-17 18:40:12.331907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6e1f3a8b924'
+down_revision: Union[str, Sequence[str], None] = 'b51d7e3a9c26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Until now this table only came from create_all at startup; databases
+    # that already have it keep it as is
+    if not op.get_context().as_sql and sa.inspect(op.get_bind()).has_table('orchestrator_validations'):
+        return
+    op.create_table('orchestrator_validations',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('account_id', sa.UUID(), nullable=False),
+    sa.Column('stage_number', sa.Integer(), nullable=False),
+    sa.Column('approved', sa.Boolean(), nullable=False),
+    sa.Column('quality_score', sa.Float(), nullable=True),
+    sa.Column('coherence_score', sa.Float(), nullable=True),
+    sa.Column('issues', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('suggestions', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('validation_details', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('ai_model_used', sa.String(length=50), nullable=True),
+    sa.Column('validated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['account_id'], ['accounts.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('account_id', 'stage_number', 'validated_at', name='uq_account_stage_validation')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('orchestrator_validations')
@@ -0,0 +1,29 @@
+"""add_validation_token_counts
+
+Revision ID: d2a8f6c4e913
+Revises: c6e1f3a8b924
+Create Date: 2026-10-17 13:52:10.604418
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a8f6c4e913'
+down_revision: Union[str, Sequence[str], None] = 'c6e1f3a8b924'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('orchestrator_validations', sa.Column('prompt_tokens', sa.Integer(), nullable=True))
+    op.add_column('orchestrator_validations', sa.Column('completion_tokens', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('orchestrator_validations', 'completion_tokens')
+    op.drop_column('orchestrator_validations', 'prompt_tokens')
@@ -0,0 +1,29 @@
+"""add_validation_content_hash
+
+Revision ID: e7c3b9a15d08
+Revises: d2a8f6c4e913
+Create Date: 2026-10-17 14:31:26.771930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7c3b9a15d08'
+down_revision: Union[str, Sequence[str], None] = 'd2a8f6c4e913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('orchestrator_validations', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.create_index(op.f('ix_orchestrator_validations_content_hash'), 'orchestrator_validations', ['content_hash'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_orchestrator_validations_content_hash'), table_name='orchestrator_validations')
+    op.drop_column('orchestrator_validations', 'content_hash')
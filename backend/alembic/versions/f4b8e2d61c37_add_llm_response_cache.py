@@ -0,0 +1,39 @@
+"""add_llm_response_cache
+
+Revision ID: f4b8e2d61c37
+Revises: e7c3b9a15d08
+Create Date: 2026-10-17 15:12:44.208361
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4b8e2d61c37'
+down_revision: Union[str, Sequence[str], None] = 'e7c3b9a15d08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('llm_response_cache',
+    sa.Column('key', sa.String(length=64), nullable=False),
+    sa.Column('provider', sa.String(length=20), nullable=False),
+    sa.Column('model', sa.String(length=50), nullable=False),
+    sa.Column('response', sa.Text(), nullable=False),
+    sa.Column('size_bytes', sa.Integer(), nullable=False),
+    sa.Column('latency_seconds', sa.Float(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('key')
+    )
+    op.create_index(op.f('ix_llm_response_cache_expires_at'), 'llm_response_cache', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_llm_response_cache_expires_at'), table_name='llm_response_cache')
+    op.drop_table('llm_response_cache')
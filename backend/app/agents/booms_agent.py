@@ -6,8 +6,10 @@ Aligned with spec/prompts/agent-1-booms.md
 """
 
 import json
-from typing import Any, Dict, List, Optional
-from app.services import ai_provider_service
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from app.services import ai_provider_service, history_service
+from app.services.deadline import Deadline
+from app.services.llm_errors import LLMError
 
 SYSTEM_PROMPT = """# IDENTIDAD Y ROLE
 
@@ -168,7 +170,9 @@ async def process_message(
     state: Dict[str, Any],
     account_context: Optional[Dict[str, Any]] = None,
     research_context: Optional[Dict[str, Any]] = None,
-    ai_model: Optional[str] = None
+    ai_model: Optional[str] = None,
+    on_delta: Optional[Callable[[str], Awaitable[None]]] = None,
+    deadline: Optional[Deadline] = None
 ) -> Dict[str, Any]:
     history = state.get("messages", [])
     
@@ -186,9 +190,11 @@ async def process_message(
 
     try:
         response_text = await ai_provider_service.chat_completion(
-            messages=history,
+            messages=history_service.window_messages(history, collected_data=state.get("collectedData")),
             temperature=0.7,
-            model_override=ai_model
+            model_override=ai_model,
+            on_delta=on_delta,
+            deadline=deadline
         )
 
         try:
@@ -242,6 +248,8 @@ async def process_message(
                 "output": None
             }
 
+    except LLMError:
+        raise  # Classified provider errors reach the router as is
     except Exception as e:
         raise Exception(f"AI Agent Error: {str(e)}")
 
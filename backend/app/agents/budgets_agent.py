@@ -4,8 +4,10 @@ Budgets Agent (Media Planner)
 Stage 7 - Generates Media Plan and Investment Forecasting
 """
 
-from typing import Any
-from app.services import ai_provider_service
+from typing import Any, Awaitable, Callable
+from app.services import ai_provider_service, history_service
+from app.services.deadline import Deadline
+from app.services.llm_errors import LLMError
 
 SYSTEM_PROMPT_TEMPLATE = """
 # IDENTIDAD Y ROL
@@ -68,7 +70,9 @@ async def process_message(
     message: str,
     state: dict[str, Any],
     previous_stage_outputs: dict[str, Any] | None = None,
-    ai_model: str | None = None
+    ai_model: str | None = None,
+    on_delta: Callable[[str], Awaitable[None]] | None = None,
+    deadline: Deadline | None = None
 ) -> dict[str, Any]:
     """
     Process a user message through the Budgets agent
@@ -95,13 +99,13 @@ async def process_message(
              offer_price = str(s3.get("final_offer", {}).get("Price", "N/A"))
 
     # Initialize conversation
-    if not messages:
+    if not messages or messages[0]["role"] != "system":
         system_prompt = SYSTEM_PROMPT_TEMPLATE.format(
             budget_limit=budget_limit,
             channels_matrix=channels_matrix,
             offer_price=offer_price
         )
-        messages = [{"role": "system", "content": system_prompt}]
+        messages = [{"role": "system", "content": system_prompt}] + [m for m in messages if m["role"] != "system"]
 
     messages.append({"role": "user", "content": message})
 
@@ -109,9 +113,11 @@ async def process_message(
         selected_model = ai_model if ai_model else "gemini-2.0-flash"
         
         response = await ai_provider_service.chat_completion(
-            messages=messages,
+            messages=history_service.window_messages(messages, collected_data=state.get("agent_data")),
             model_override=selected_model,
-            temperature=0.7
+            temperature=0.7,
+            on_delta=on_delta,
+            deadline=deadline
         )
 
         messages.append({"role": "assistant", "content": response})
@@ -141,6 +147,8 @@ async def process_message(
             "output": output
         }
 
+    except LLMError:
+        raise  # Classified provider errors reach the router as is
     except Exception as e:
         raise Exception(f"Error in Budgets agent: {str(e)}")
 
@@ -5,9 +5,11 @@ Aligned with Agente2.md spec.
 Enforces strict sequential logic to avoid loops.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, Optional
 import json
-from app.services import ai_provider_service
+from app.services import ai_provider_service, history_service
+from app.services.deadline import Deadline
+from app.services.llm_errors import LLMError
 
 STAGES_ORDER = ["awareness", "consideration", "decision", "delight"]
 
@@ -61,7 +63,9 @@ async def process_message(
     message: str,
     state: Dict[str, Any],
     previous_stage_output: Optional[Dict[str, Any]] = None,
-    ai_model: Optional[str] = None
+    ai_model: Optional[str] = None,
+    on_delta: Optional[Callable[[str], Awaitable[None]]] = None,
+    deadline: Optional[Deadline] = None
 ) -> Dict[str, Any]:
     
     # 1. State Recovery & Management
@@ -79,8 +83,8 @@ async def process_message(
         stage_idx = 0
         current_stage = "awareness"
 
-    # 2. Initialize history if empty
-    if not history:
+    # 2. Add the system prompt on the first turn (the transcript may already hold the greeting)
+    if not history or history[0]["role"] != "system":
         # Inject Stage 1 Context
         persona_context = ""
         if previous_stage_output:
@@ -91,7 +95,7 @@ async def process_message(
                 persona_context = f"BUYER PERSONA (STAGE 1):\nNombre: {name}\nResumen: {narrative}\n"
         
         full_system_prompt = SYSTEM_PROMPT + "\n\nCONTEXTO INICIAL:\n" + persona_context
-        history = [{"role": "system", "content": full_system_prompt}]
+        history = [{"role": "system", "content": full_system_prompt}] + [m for m in history if m["role"] != "system"]
         turn_count_in_stage = 0
 
     # 3. User Message Handling
@@ -114,9 +118,11 @@ async def process_message(
     # 5. Call LLM
     try:
         response_text = await ai_provider_service.chat_completion(
-            messages=history,
+            messages=history_service.window_messages(history, collected_data=journey_state),
             temperature=0.7,
-            model_override=ai_model
+            model_override=ai_model,
+            on_delta=on_delta,
+            deadline=deadline
         )
         
         # 6. Parse JSON
@@ -171,7 +177,9 @@ async def process_message(
                 "output": None
             }
 
-    except Exception as e:
+    except LLMError:
+        raise  # Classified provider errors reach the router as is
+    except Exception:
         return {
             "response": "Error procesando. Intenta de nuevo.",
             "state": state,
@@ -4,8 +4,13 @@ Ofertas Agent (100M Offers & StoryBrand)
 Stage 3 - Creates irresistible offers using Hormozi and StoryBrand frameworks via RAG
 """
 
-from typing import Any
-from app.services import ai_provider_service, rag_service
+from typing import Any, Awaitable, Callable
+from app.services import ai_provider_service, history_service, rag_service
+from app.services.deadline import Deadline
+from app.services.llm_errors import LLMError
+
+# Knowledge base documents injected into the system prompt (RAG)
+KNOWLEDGE_DOCUMENTS = ["100m_offers.txt", "storybrand.txt"]
 
 SYSTEM_PROMPT_TEMPLATE = """
 # IDENTIDAD Y ROL
@@ -84,7 +89,9 @@ async def process_message(
     message: str,
     state: dict[str, Any],
     previous_stage_outputs: dict[str, Any] | None = None,
-    ai_model: str | None = None
+    ai_model: str | None = None,
+    on_delta: Callable[[str], Awaitable[None]] | None = None,
+    deadline: Deadline | None = None
 ) -> dict[str, Any]:
     """
     Process a user message through the Ofertas agent
@@ -92,10 +99,6 @@ async def process_message(
     # Get message history from state
     messages = state.get("messages", [])
     
-    # Get RAG context if not already loaded (or reload it)
-    # Ideally we'd cache this or pass it in system prompt once
-    rag_context = await rag_service.get_knowledge_context(["100m_offers.txt", "storybrand.txt"])
-
     # Prepare context summaries
     buyer_persona_summary = "N/A"
     industry_context = "N/A"
@@ -107,26 +110,39 @@ async def process_message(
         buyer_persona_summary = f"Audience: {s1.get('target_audience', 'Unknown')}\nPain Points: {s1.get('pain_points', 'Unknown')}" # Adapt based on actual output structure
         industry_context = f"Brand: {s1.get('brand_name', 'Unknown')}\nIndustry: {s1.get('industry', 'Unknown')}"
 
-    # Add system prompt if first message
-    if not messages:
+    # Add system prompt on the first turn (the transcript may already hold the greeting)
+    if not messages or messages[0]["role"] != "system":
+        # Relevant knowledge is retrieved per turn and attached to the prompt (see below)
         system_prompt = SYSTEM_PROMPT_TEMPLATE.format(
             buyer_persona_summary=buyer_persona_summary,
             industry_context=industry_context,
-            rag_context=rag_context
+            rag_context="Se adjunta en cada turno como CONOCIMIENTO RELEVANTE."
         )
-        messages = [{"role": "system", "content": system_prompt}]
+        messages = [{"role": "system", "content": system_prompt}] + [m for m in messages if m["role"] != "system"]
 
     # Add user message
     messages.append({"role": "user", "content": message})
 
+    # Retrieve the knowledge chunks relevant to this turn (top-k under a token budget)
+    rag_context = await rag_service.retrieve_context(
+        f"{message}\n{buyer_persona_summary}\n{industry_context}",
+        KNOWLEDGE_DOCUMENTS
+    )
+
     try:
         # Use AI Provider (Use account model or fallback to gemini for large RAG context)
         selected_model = ai_model if ai_model else "gemini-2.0-flash"
         
         response = await ai_provider_service.chat_completion(
-            messages=messages,
+            messages=history_service.window_messages(
+                messages,
+                collected_data=state.get("agent_data"),
+                extra_context=f"CONOCIMIENTO RELEVANTE (RAG):\n{rag_context}" if rag_context else None
+            ),
             model_override=selected_model,
-            temperature=0.7
+            temperature=0.7,
+            on_delta=on_delta,
+            deadline=deadline
         )
 
         messages.append({"role": "assistant", "content": response})
@@ -169,6 +185,8 @@ async def process_message(
             "output": output
         }
 
+    except LLMError:
+        raise  # Classified provider errors reach the router as is
     except Exception as e:
         raise Exception(f"Error in Ofertas agent: {str(e)}")
 
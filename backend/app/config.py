@@ -9,15 +9,116 @@ class Settings(BaseSettings):
     # Database
     database_url: str
 
+    # Connection pool and Postgres session settings
+    db_pool_size: int = 10
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 10.0  # Seconds to wait for a free connection
+    db_pool_recycle: int = 1800  # Reconnect connections older than this (seconds)
+    db_pool_pre_ping: bool = True
+    db_statement_cache_size: int = 500  # asyncpg prepared statements per connection
+    db_statement_timeout_ms: int = 15000
+    db_echo: bool = False  # Log every SQL statement
+    require_schema_at_head: bool = False  # Refuse to start unless migrations are applied
+
     # JWT
     jwt_secret: str
     jwt_algorithm: str = "HS256"
     jwt_expiration_days: int = 7
 
+    # Authenticated principal cache (per process); stateless trusts the token's identity claims
+    auth_principal_cache_ttl_seconds: float = 60.0  # 0 disables the cache
+    auth_principal_cache_max_entries: int = 1024
+    auth_stateless: bool = False
+
+    # Password hashing (argon2id); changing the cost rehashes each user at their next login
+    argon2_time_cost: int = 3
+    argon2_memory_cost: int = 65536  # KiB
+    argon2_parallelism: int = 4
+    password_hash_workers: int = 2
+
     # AI
     openai_api_key: str
     google_ai_api_key: str | None = None
     perplexity_api_key: str | None = None
+    gemini_max_concurrency: int = 8
+
+    # Perplexity HTTP client pool
+    perplexity_http2: bool = True
+    perplexity_max_connections: int = 20
+    perplexity_max_keepalive_connections: int = 10
+    perplexity_keepalive_expiry: float = 30.0
+    perplexity_timeout: float = 60.0
+    perplexity_connect_timeout: float = 10.0
+
+    # Company research cache (fresh for ttl, served stale while refreshing until stale limit)
+    research_cache_ttl_hours: float = 168.0
+    research_cache_stale_hours: float = 720.0
+
+    # Background research jobs (started at account creation)
+    research_workers: int = 2
+    research_queue_size: int = 100
+
+    # Background orchestrator validation of completed stages
+    validation_workers: int = 2
+    validation_queue_size: int = 100
+    orchestrator_memoize: bool = True  # Reuse stored verdicts for identical content
+
+    # Hedged research: the fallback LLM starts after the delay (0 = immediately) and the
+    # first valid JSON wins; disable to run Perplexity then the fallback sequentially
+    research_hedged: bool = True
+    research_hedge_delay_seconds: float = 4.0
+    research_perplexity_timeout: float = 45.0
+    research_fallback_timeout: float = 45.0
+
+    # LLM response cache (opt-in per call site via cache_ttl)
+    llm_cache_enabled: bool = True
+    llm_cache_db_enabled: bool = True
+    llm_cache_memory_max_entries: int = 512
+    llm_cache_memory_max_bytes: int = 16 * 1024 * 1024
+    llm_cache_db_max_rows: int = 20000
+    orchestrator_cache_ttl_seconds: float = 7 * 24 * 3600
+    research_llm_cache_ttl_seconds: float = 7 * 24 * 3600
+
+    # OpenAI client pool (shared client from the LLM client registry)
+    openai_max_connections: int = 50
+    openai_max_keepalive_connections: int = 20
+    openai_keepalive_expiry: float = 30.0
+    openai_timeout: float = 120.0
+    openai_connect_timeout: float = 10.0
+    gemini_model_cache_size: int = 64  # GenerativeModel objects kept per (model, system prompt)
+
+    # LLM admission control (per provider; concurrency adapts between 1 and the max)
+    openai_max_concurrency: int = 16
+    openai_rpm: float = 500
+    openai_tpm: float = 300000
+    gemini_rpm: float = 1000
+    gemini_tpm: float = 1000000
+    llm_slow_response_seconds: float = 30.0  # Slower successes shrink the concurrency limit
+
+    # LLM resilience: retries with jittered backoff, circuit breakers, Gemini <-> OpenAI failover
+    llm_max_retries: int = 2
+    llm_retry_base_delay: float = 0.5
+    llm_retry_max_delay: float = 8.0
+    llm_latency_budget_seconds: float = 90.0
+    llm_breaker_failure_threshold: int = 5
+    llm_breaker_cooldown_seconds: float = 30.0
+    llm_failover_enabled: bool = True
+
+    # Per-request deadlines for agent chat; the LLM calls of a turn share what is left
+    chat_deadline_seconds: float = 60.0
+    chat_stream_deadline_seconds: float = 120.0
+
+    # Conversation window sent to the LLM (full history stays in stage_messages)
+    history_max_turns: int = 12
+    history_max_prompt_tokens: int = 24000
+
+    # RAG knowledge index: seconds between knowledge file (mtime, size) checks
+    knowledge_refresh_seconds: float = 30.0
+
+    # RAG retrieval: chunk size, chunks per prompt and their token budget
+    rag_chunk_tokens: int = 300
+    rag_top_k: int = 6
+    rag_max_context_tokens: int = 2000
 
     # CORS
     cors_origins: str = '["http://localhost:5173"]'
@@ -1,16 +1,60 @@
 # /backend/app/database.py
 
+import time
+from sqlalchemy import exc
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.config import get_settings
 
 settings = get_settings()
 
+# Connection checkout metrics (exposed on /health via pool_snapshot)
+pool_metrics = {
+    "checkouts": 0,
+    "timeouts": 0,
+    "wait_seconds_total": 0.0,
+    "wait_seconds_max": 0.0
+}
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waited for a connection"""
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:  # Pool exhausted for pool_timeout seconds
+            pool_metrics["timeouts"] += 1
+            raise
+        waited = time.perf_counter() - started
+        pool_metrics["checkouts"] += 1
+        pool_metrics["wait_seconds_total"] += waited
+        pool_metrics["wait_seconds_max"] = max(pool_metrics["wait_seconds_max"], waited)
+        return connection
+
+
 # Create async engine
 engine = create_async_engine(
     settings.database_url,
-    echo=settings.debug_mode,  # Log SQL queries in debug mode
-    future=True
+    echo=settings.db_echo,  # Log SQL queries (opt-in, independent of debug_mode)
+    future=True,
+    poolclass=InstrumentedPool,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=settings.db_pool_pre_ping,
+    connect_args={
+        # Prepared statements cached per connection (0 disables, e.g. behind pgbouncer in transaction mode)
+        "prepared_statement_cache_size": settings.db_statement_cache_size,
+        # Applied to every session on the connection
+        "server_settings": {
+            "statement_timeout": str(settings.db_statement_timeout_ms),
+            "application_name": "booms-backend"
+        }
+    }
 )
 
 # Create session factory
@@ -24,6 +68,23 @@ AsyncSessionLocal = async_sessionmaker(
 Base = declarative_base()
 
 
+def pool_snapshot() -> dict:
+    """Pool occupancy plus checkout wait metrics"""
+    pool = engine.pool
+    checkouts = pool_metrics["checkouts"]
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(0, pool.overflow()),
+        "max_overflow": settings.db_max_overflow,
+        **pool_metrics,
+        "wait_seconds_total": round(pool_metrics["wait_seconds_total"], 3),
+        "wait_seconds_avg": round(pool_metrics["wait_seconds_total"] / checkouts, 4) if checkouts else 0.0,
+        "wait_seconds_max": round(pool_metrics["wait_seconds_max"], 3)
+    }
+
+
 # Dependency for FastAPI
 async def get_db():
     async with AsyncSessionLocal() as session:
@@ -6,10 +6,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from uuid import UUID
 
+from app.config import get_settings
 from app.database import get_db
 from app.models.user import User
+from app.services import principal_cache
 from app.utils.security import decode_access_token
 
+settings = get_settings()
+
 # HTTP Bearer token scheme
 security = HTTPBearer()
 
@@ -21,6 +25,10 @@ async def get_current_user(
     """
     Get the current authenticated user from JWT token
 
+    The user may come from the principal cache or, with auth_stateless, from
+    the token claims: a detached User carrying id, email and full_name. Load
+    the row if you need anything else.
+
     Raises:
         HTTPException: If token is invalid or user not found
     """
@@ -47,6 +55,17 @@ async def get_current_user(
     except ValueError:
         raise credentials_exception
 
+    # Stateless mode: trust the signed identity claims, no lookup at all
+    if settings.auth_stateless:
+        principal = principal_cache.from_claims(payload, user_uuid)
+        if principal is not None:
+            return principal
+
+    # Recently seen principal (short TTL, dropped on user update/delete)
+    principal = principal_cache.get(user_uuid)
+    if principal is not None:
+        return principal
+
     result = await db.execute(
         select(User).where(User.id == user_uuid)
     )
@@ -55,4 +74,5 @@ async def get_current_user(
     if user is None:
         raise credentials_exception
 
+    principal_cache.put(user)
     return user
@@ -5,7 +5,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.config import get_settings
-from app.database import get_db
+from app.database import get_db, pool_snapshot
 
 settings = get_settings()
 
@@ -13,13 +13,29 @@ from contextlib import asynccontextmanager
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Create tables on startup
-    from app.database import engine, Base
-    from app.models import user, account, stage
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    # Schema is managed by Alembic (`python migrate.py`, once per deploy): only check it is at head
+    from app.services import schema_check
+    await schema_check.check()
+
+    # Long-lived provider clients (pooled connections, reused Gemini models)
+    from app.services import llm_clients
+    await llm_clients.registry.start()
+
+    # Load the RAG index so the first agent turn doesn't hit the disk
+    from app.services import rag_service
+    await rag_service.warm_up()
+
+    # Background workers: company research and orchestrator validation
+    from app.services import research_jobs, validation_jobs
+    research_jobs.start()
+    validation_jobs.start()
     yield
 
+    # Shutdown: stop background workers and close pooled provider connections
+    await research_jobs.stop()
+    await validation_jobs.stop()
+    await llm_clients.registry.close()
+
 app = FastAPI(
     title="BOOMS Platform API",
     description="AI-powered marketing onboarding platform",
@@ -90,11 +106,26 @@ async def health(db: AsyncSession = Depends(get_db)):
     except Exception as e:
         db_status = f"error: {str(e)}"
         
+    from app.services import research_service, orchestrator_service, validation_jobs, llm_cache, llm_clients, llm_limiter, llm_resilience, principal_cache, schema_check
+
     return {
         "status": "healthy",
         "database": db_status,
         "tables": tables,
-        "openai": "configured" if settings.openai_api_key != "your-openai-api-key-here" else "not configured"
+        "openai": "configured" if settings.openai_api_key != "your-openai-api-key-here" else "not configured",
+        "research_cache": research_service.cache_metrics,
+        "orchestrator_rules": {
+            **orchestrator_service.rule_stats,
+            "llm_calls_saved": orchestrator_service.rule_stats["rule_rejected"]
+        },
+        "orchestrator_memo": validation_jobs.memo_stats,
+        "llm_cache": llm_cache.snapshot(),
+        "llm_clients": llm_clients.registry.stats,
+        "llm_limiter": llm_limiter.snapshot(),
+        "llm_breakers": llm_resilience.snapshot(),
+        "auth_principal_cache": principal_cache.snapshot(),
+        "db_pool": pool_snapshot(),
+        "schema": schema_check.state
     }
 
 
@@ -3,5 +3,9 @@
 from app.models.user import User
 from app.models.account import Account
 from app.models.stage import Stage
+from app.models.stage_message import StageMessage
+from app.models.company_research import CompanyResearch
+from app.models.llm_response_cache import LLMResponseCache
+from app.models.orchestrator_validation import OrchestratorValidation
 
-__all__ = ["User", "Account", "Stage"]
+__all__ = ["User", "Account", "Stage", "StageMessage", "CompanyResearch", "LLMResponseCache", "OrchestratorValidation"]
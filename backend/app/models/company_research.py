@@ -0,0 +1,25 @@
+# /backend/app/models/company_research.py
+
+from sqlalchemy import Column, String, DateTime
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from datetime import datetime
+import uuid
+
+from app.database import Base
+
+
+class CompanyResearch(Base):
+    """Cached company research, shared across accounts for the same company"""
+    __tablename__ = "company_research"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    cache_key = Column(String(600), unique=True, nullable=False, index=True)  # normalized domain|company name
+    domain = Column(String(255), nullable=True)
+    company_name = Column(String(255), nullable=False)
+    data = Column(JSONB, nullable=False)
+    fetched_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<CompanyResearch {self.cache_key}>"
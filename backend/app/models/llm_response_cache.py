@@ -0,0 +1,23 @@
+# /backend/app/models/llm_response_cache.py
+
+from sqlalchemy import Column, String, DateTime, Integer, Float, Text
+from datetime import datetime
+
+from app.database import Base
+
+
+class LLMResponseCache(Base):
+    """Persistent tier of the LLM response cache (see llm_cache service)"""
+    __tablename__ = "llm_response_cache"
+
+    key = Column(String(64), primary_key=True)  # sha256 of provider, model, messages and params
+    provider = Column(String(20), nullable=False)
+    model = Column(String(50), nullable=False)
+    response = Column(Text, nullable=False)
+    size_bytes = Column(Integer, nullable=False)
+    latency_seconds = Column(Float, nullable=False)  # Cost of the original call (saved on every hit)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<LLMResponseCache {self.provider}/{self.model} {self.key[:12]}>"
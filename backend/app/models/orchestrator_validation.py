@@ -25,6 +25,9 @@ class OrchestratorValidation(Base):
 
     # Metadata
     ai_model_used = Column(String(50), nullable=True)
+    prompt_tokens = Column(Integer, nullable=True) # Validation cost as reported by the provider (estimated if not)
+    completion_tokens = Column(Integer, nullable=True)
+    content_hash = Column(String(64), nullable=True, unique=True, index=True) # Memoization key (LLM verdicts only)
     validated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     # Relationships
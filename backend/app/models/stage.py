@@ -16,14 +16,17 @@ class Stage(Base):
     account_id = Column(UUID(as_uuid=True), ForeignKey("accounts.id", ondelete="CASCADE"), nullable=False)
     stage_number = Column(Integer, nullable=False)
     status = Column(String(50), nullable=False, default="locked")  # locked, in_progress, completed
-    state = Column(JSONB, default=dict, nullable=False)  # Estado actual de la conversación
+    state = Column(JSONB, default=dict, nullable=False)  # Estado compacto del agente (mensajes en stage_messages)
     output = Column(JSONB, nullable=True)  # Output final cuando se completa
     ai_model_used = Column(String(50), nullable=True)
+    message_count = Column(Integer, default=0, nullable=False)  # Rows in stage_messages (next seq)
     
     # Orchestrator Fields
     orchestrator_approved = Column(Boolean, nullable=True) # None = not validated, True/False
     orchestrator_score = Column(Float, nullable=True)
     orchestrator_feedback = Column(JSONB, nullable=True) # { issues: [], suggestions: [] }
+    validation_status = Column(String(20), nullable=True) # None, pending, completed, failed (background validation)
+    validation_id = Column(UUID(as_uuid=True), ForeignKey("orchestrator_validations.id", ondelete="SET NULL"), nullable=True) # Applied verdict (may be a memoized row)
 
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
@@ -31,6 +34,7 @@ class Stage(Base):
 
     # Relationships
     account = relationship("Account", back_populates="stages")
+    messages = relationship("StageMessage", back_populates="stage", cascade="all, delete-orphan", passive_deletes=True)
 
     # Constraints
     __table_args__ = (
@@ -0,0 +1,32 @@
+# /backend/app/models/stage_message.py
+
+from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+from datetime import datetime
+import uuid
+
+from app.database import Base
+
+
+class StageMessage(Base):
+    """Append-only chat transcript of a stage, one row per message"""
+    __tablename__ = "stage_messages"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    stage_id = Column(UUID(as_uuid=True), ForeignKey("stages.id", ondelete="CASCADE"), nullable=False)
+    seq = Column(Integer, nullable=False)  # 0-based position in the conversation
+    role = Column(String(20), nullable=False)  # system, user, assistant
+    content = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Relationships
+    stage = relationship("Stage", back_populates="messages")
+
+    # Constraints (the unique index also serves ordered reads by stage)
+    __table_args__ = (
+        UniqueConstraint('stage_id', 'seq', name='uq_stage_message_seq'),
+    )
+
+    def __repr__(self):
+        return f"<StageMessage {self.seq} - {self.role}>"
@@ -1,17 +1,19 @@
 # /backend/app/routers/accounts.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, or_, and_
 from sqlalchemy.orm import selectinload
 from uuid import UUID
+from datetime import datetime
 
 from app.database import get_db
 from app.models.user import User
 from app.models.account import Account
 from app.models.stage import Stage
-from app.schemas.account import AccountCreate, AccountUpdate, AccountResponse
+from app.schemas.account import AccountCreate, AccountUpdate, AccountResponse, AccountSummaryListResponse
 from app.dependencies import get_current_user
+from app.services import research_jobs
 
 router = APIRouter(prefix="/accounts", tags=["Accounts"])
 
@@ -25,7 +27,8 @@ async def create_account(
     """
     Create a new account (client company)
 
-    Also initializes all 7 stages in 'locked' status
+    Also initializes all 7 stages in 'locked' status and, when a website is
+    given, queues the company research for Stage 1 in the background
     """
     # Normalize website URL
     website = account_data.company_website
@@ -49,11 +52,14 @@ async def create_account(
             account_id=new_account.id,
             stage_number=stage_num,
             status="locked" if stage_num > 1 else "in_progress",  # Stage 1 starts unlocked
-            state={}
+            state={"research_status": research_jobs.RESEARCH_PENDING} if stage_num == 1 and website else {}
         )
         db.add(stage)
 
     await db.commit()
+
+    if website:
+        research_jobs.enqueue(new_account.id)
     
     # Reload with stages
     result = await db.execute(
@@ -81,6 +87,75 @@ async def get_accounts(
     return accounts
 
 
+def _encode_cursor(account: Account) -> str:
+    return f"{account.created_at.isoformat()}_{account.id}"
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        created_at, account_id = cursor.rsplit("_", 1)
+        return datetime.fromisoformat(created_at), UUID(account_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+@router.get("/summary", response_model=AccountSummaryListResponse)
+async def get_account_summaries(
+    cursor: str | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Lightweight account list for the dashboard
+
+    Stages only carry status, orchestrator score and timestamps; the state and
+    output JSONB columns are never loaded. Keyset-paginated (newest first):
+    pass the returned next_cursor as cursor to fetch the next page.
+    """
+    query = (
+        select(Account)
+        .options(
+            selectinload(Account.stages).load_only(
+                Stage.id,
+                Stage.stage_number,
+                Stage.status,
+                Stage.orchestrator_approved,
+                Stage.orchestrator_score,
+                Stage.created_at,
+                Stage.updated_at,
+                Stage.completed_at
+            )
+        )
+        .where(Account.user_id == current_user.id)
+        .order_by(Account.created_at.desc(), Account.id.desc())
+        .limit(limit + 1)
+    )
+
+    if cursor:
+        cursor_created_at, cursor_id = _decode_cursor(cursor)
+        query = query.where(
+            or_(
+                Account.created_at < cursor_created_at,
+                and_(Account.created_at == cursor_created_at, Account.id < cursor_id)
+            )
+        )
+
+    result = await db.execute(query)
+    accounts = result.scalars().all()
+
+    has_more = len(accounts) > limit
+    accounts = accounts[:limit]
+
+    return {
+        "accounts": accounts,
+        "next_cursor": _encode_cursor(accounts[-1]) if has_more else None
+    }
+
+
 @router.get("/{account_id}", response_model=AccountResponse)
 async def get_account(
     account_id: UUID,
@@ -1,11 +1,17 @@
 # /backend/app/routers/agents.py
 
+import asyncio
+import json
+from typing import Awaitable, Callable
+
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.orm import load_only
 from uuid import UUID
-from datetime import datetime
 
+from app.config import get_settings
 from app.database import get_db
 from app.models.user import User
 from app.models.account import Account
@@ -13,10 +19,15 @@ from app.models.stage import Stage
 from app.schemas.stage import StageMessageRequest
 from app.dependencies import get_current_user
 from app.agents import booms_agent, journey_agent, ofertas_agent, canales_agent, atlas_agent, planner_agent, budgets_agent
-from app.services import research_service
-from app.services.orchestrator_service import OrchestratorService
+from app.services import research_jobs, stage_message_service, validation_jobs
+from app.services.stream_parser import AgentMessageExtractor
+from app.services.deadline import Deadline
+from app.services.stage_context import StageContext, load_stage_context
+from app.services.llm_errors import LLMDeadlineError, LLMError
 from app.models.orchestrator_validation import OrchestratorValidation as OrchestratorValidationModel
 
+settings = get_settings()
+
 router = APIRouter(prefix="/agents", tags=["AI Agents"])
 
 
@@ -43,45 +54,45 @@ async def verify_account_ownership(
     return account
 
 
-@router.post("/accounts/{account_id}/stages/{stage_number}/chat")
-async def chat_with_agent(
+async def load_owned_stage_context(
     account_id: UUID,
-    stage_number: int,
-    request: StageMessageRequest,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
-):
-    """
-    Send a message to an agent for a specific stage
+    current_user: User,
+    db: AsyncSession
+) -> StageContext:
+    """Account (ownership checked) and all of its stages, in one query"""
+    context = await load_stage_context(db, account_id, current_user.id)
+    if not context:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Account not found"
+        )
+    return context
 
-    The agent processes the message and updates the stage state
-    """
-    # Verify ownership
-    account = await verify_account_ownership(account_id, current_user, db)
 
-    # Validate stage number
+def _check_stage_number(stage_number: int) -> None:
     if stage_number < 1 or stage_number > 7:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Stage number must be between 1 and 7"
         )
 
-    # Only stages 1-7 are implemented
-    if stage_number > 7:
-        raise HTTPException(
-            status_code=status.HTTP_501_NOT_IMPLEMENTED,
-            detail=f"Stage {stage_number} not yet implemented in MVP"
-        )
 
-    # Get stage
-    result = await db.execute(
-        select(Stage).where(
-            Stage.account_id == account_id,
-            Stage.stage_number == stage_number
-        )
-    )
-    stage = result.scalar_one_or_none()
+async def _load_chat_context(
+    account_id: UUID,
+    stage_number: int,
+    current_user: User,
+    db: AsyncSession
+) -> tuple[Account, Stage, dict | None, dict]:
+    """
+    Load and validate everything a chat turn needs (a single query)
 
+    Returns:
+        Tuple of (account, stage, previous_stage_output, previous_outputs)
+    """
+    _check_stage_number(stage_number)
+    context = await load_owned_stage_context(account_id, current_user, db)
+
+    stage = context.stage(stage_number)
     if not stage:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -102,31 +113,175 @@ async def chat_with_agent(
             detail="This stage is already completed. Cannot send more messages."
         )
 
-    # Get previous stage output if needed (for stage 2)
-    previous_stage_output = None
-    if stage_number > 1:
-        prev_result = await db.execute(
-            select(Stage).where(
-                Stage.account_id == account_id,
-                Stage.stage_number == stage_number - 1
-            )
+    # Previous stage output (stage 2) and all previous outputs (stages 3-7)
+    return (
+        context.account,
+        stage,
+        context.previous_stage_output(stage_number),
+        context.previous_outputs(stage_number)
+    )
+
+
+async def _run_agent(
+    stage_number: int,
+    message: str,
+    state: dict,
+    stage: Stage,
+    account: Account,
+    account_context: dict,
+    previous_stage_output: dict | None,
+    previous_outputs: dict,
+    on_delta: Callable[[str], Awaitable[None]] | None = None,
+    deadline: Deadline | None = None
+) -> dict:
+    """Route a message to the agent that owns the stage (deadline bounds its LLM calls)"""
+    if stage_number == 1:
+        # BOOMS agent
+        research_found = stage.state.get("research_data")
+        return await booms_agent.process_message(
+            message=message,
+            state=state,
+            account_context=account_context,
+            research_context=research_found,
+            ai_model=account.ai_model,
+            on_delta=on_delta,
+            deadline=deadline
+        )
+    elif stage_number == 2:
+        # Journey agent
+        return await journey_agent.process_message(
+            message=message,
+            state=state,
+            previous_stage_output=previous_stage_output,
+            ai_model=account.ai_model,
+            on_delta=on_delta,
+            deadline=deadline
         )
-        prev_stage = prev_result.scalar_one_or_none()
-        if prev_stage and prev_stage.output:
-            previous_stage_output = prev_stage.output
-
-    # Get outputs from all previous stages for context (especially for Stage 3-7)
-    previous_outputs = {}
-    if stage_number > 1:
-        # Fetch all previous stages
-        prev_stages_result = await db.execute(
-            select(Stage).where(
-                Stage.account_id == account_id,
-                Stage.stage_number < stage_number
-            )
+    elif stage_number == 3:
+        # Ofertas agent (Agent 3) - Uses RAG and outputs from 1 & 2
+        return await ofertas_agent.process_message(
+            message=message,
+            state=state,
+            previous_stage_outputs=previous_outputs,
+            ai_model=account.ai_model,
+            on_delta=on_delta,
+            deadline=deadline
         )
-        for p_stage in prev_stages_result.scalars().all():
-            previous_outputs[f"stage_{p_stage.stage_number}"] = p_stage.output
+    elif stage_number == 4:
+        # Canales agent (Agent 4) - Uses Perplexity (simulated)
+        return await canales_agent.process_message(
+            message=message,
+            state=state,
+            previous_stage_outputs=previous_outputs,
+            ai_model=account.ai_model,
+            on_delta=on_delta,
+            deadline=deadline
+        )
+    elif stage_number == 5:
+        # Atlas agent (Agent 5) - SEO/AEO Strategist
+        return await atlas_agent.process_message(
+            message=message,
+            state=state,
+            previous_stage_outputs=previous_outputs,
+            ai_model=account.ai_model,
+            on_delta=on_delta,
+            deadline=deadline
+        )
+    elif stage_number == 6:
+        # Planner agent (Agent 6) - Content Scheduler
+        return await planner_agent.process_message(
+            message=message,
+            state=state,
+            previous_stage_outputs=previous_outputs,
+            ai_model=account.ai_model,
+            on_delta=on_delta,
+            deadline=deadline
+        )
+    elif stage_number == 7:
+        # Budgets agent (Agent 7) - Media Planner
+        return await budgets_agent.process_message(
+            message=message,
+            state=state,
+            previous_stage_outputs=previous_outputs,
+            ai_model=account.ai_model,
+            on_delta=on_delta,
+            deadline=deadline
+        )
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail=f"Agent for stage {stage_number} not implemented"
+        )
+
+
+async def _apply_agent_response(
+    stage: Stage,
+    account: Account,
+    account_context: dict,
+    agent_response: dict,
+    history: list[dict],
+    db: AsyncSession
+) -> dict:
+    """Persist an agent turn (validating completions) and build the chat response"""
+    # Update stage state (new messages are appended to stage_messages)
+    await stage_message_service.save_state(db, stage, agent_response["state"], history)
+    stage.ai_model_used = account.ai_model
+
+    # If agent completed, store the draft and VALIDATE with ORCHESTRATOR in the background
+    if agent_response["completed"]:
+        stage.output = agent_response["output"]
+        stage.status = "in_progress"
+        stage.validation_status = validation_jobs.VALIDATION_PENDING
+
+    # Every field returned below is set in Python (expire_on_commit=False): no refresh round trip
+    await db.commit()
+
+    if agent_response["completed"]:
+        validation_jobs.enqueue(stage.id, account_context.get("consultant_name"))
+
+    return {
+        "response": agent_response["response"],
+        "completed": agent_response["completed"],
+        "buttons": agent_response.get("buttons", []),
+        "confidenceScore": agent_response.get("confidenceScore"),
+        "progressLabel": agent_response.get("progressLabel"),
+        "progressStep": agent_response.get("progressStep"),
+        "orchestratorValidation": None,  # Delivered via GET .../validation
+        "stage": {
+            "id": stage.id,
+            "stage_number": stage.stage_number,
+            "status": stage.status,
+            "state": stage.state,
+            "message_count": stage.message_count,
+            "output": stage.output,
+            "completed_at": stage.completed_at,
+            "orchestrator_approved": stage.orchestrator_approved,
+            "orchestrator_score": stage.orchestrator_score,
+            "orchestrator_feedback": stage.orchestrator_feedback,
+            "validation_status": stage.validation_status
+        }
+    }
+
+
+@router.post("/accounts/{account_id}/stages/{stage_number}/chat")
+async def chat_with_agent(
+    account_id: UUID,
+    stage_number: int,
+    request: StageMessageRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Send a message to an agent for a specific stage
+
+    The agent processes the message and updates the stage state
+    """
+    # Budget for the whole request; the agent's LLM calls get whatever is left
+    deadline = Deadline(settings.chat_deadline_seconds)
+
+    account, stage, previous_stage_output, previous_outputs = await _load_chat_context(
+        account_id, stage_number, current_user, db
+    )
 
     # Route to appropriate agent
     try:
@@ -137,188 +292,30 @@ async def chat_with_agent(
             "consultant_name": current_user.full_name or "Consultor"
         }
 
-        if stage_number == 1:
-            # BOOMS agent
-            research_found = stage.state.get("research_data")
-            agent_response = await booms_agent.process_message(
-                message=request.message,
-                state=request.state or stage.state,
-                account_context=account_context,
-                research_context=research_found,
-                ai_model=account.ai_model
-            )
-        elif stage_number == 2:
-            # Journey agent
-            agent_response = await journey_agent.process_message(
-                message=request.message,
-                state=request.state or stage.state,
-                previous_stage_output=previous_stage_output,
-                ai_model=account.ai_model
-            )
-        elif stage_number == 3:
-            # Ofertas agent (Agent 3) - Uses RAG and outputs from 1 & 2
-            agent_response = await ofertas_agent.process_message(
-                message=request.message,
-                state=request.state or stage.state,
-                previous_stage_outputs=previous_outputs,
-                ai_model=account.ai_model
-            )
-        elif stage_number == 4:
-            # Canales agent (Agent 4) - Uses Perplexity (simulated)
-            agent_response = await canales_agent.process_message(
-                message=request.message,
-                state=request.state or stage.state,
-                previous_stage_outputs=previous_outputs,
-                ai_model=account.ai_model
-            )
-        elif stage_number == 5:
-            # Atlas agent (Agent 5) - SEO/AEO Strategist
-            agent_response = await atlas_agent.process_message(
-                message=request.message,
-                state=request.state or stage.state,
-                previous_stage_outputs=previous_outputs,
-                ai_model=account.ai_model
-            )
-        elif stage_number == 6:
-            # Planner agent (Agent 6) - Content Scheduler
-            agent_response = await planner_agent.process_message(
-                message=request.message,
-                state=request.state or stage.state,
-                previous_stage_outputs=previous_outputs,
-                ai_model=account.ai_model
-            )
-        elif stage_number == 7:
-            # Budgets agent (Agent 7) - Media Planner
-            agent_response = await budgets_agent.process_message(
-                message=request.message,
-                state=request.state or stage.state,
-                previous_stage_outputs=previous_outputs,
-                ai_model=account.ai_model
-            )
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_501_NOT_IMPLEMENTED,
-                detail=f"Agent for stage {stage_number} not implemented"
-            )
-
-        # Update stage state
-        stage.state = agent_response["state"]
-        stage.ai_model_used = account.ai_model
-
-        stage.ai_model_used = account.ai_model
-
-        # If agent completed, update stage and VALIDATE with ORCHESTRATOR
-        orchestrator_validation_result = None
-        
-        if agent_response["completed"]:
-            # 1. Orchestrator Validation
-            try:
-                orchestrator = OrchestratorService()
-                
-                validation = await orchestrator.validate_stage_completion(
-                    account_id=str(account_id),
-                    stage_number=stage_number,
-                    stage_output=agent_response["output"],
-                    previous_outputs=previous_outputs,
-                    account_context=account_context
-                )
-                orchestrator_validation_result = validation.dict()
-
-                # 2. Save Validation to DB
-                db_validation = OrchestratorValidationModel(
-                    account_id=account_id,
-                    stage_number=stage_number,
-                    approved=validation.approved,
-                    quality_score=validation.qualityScore,
-                    coherence_score=validation.coherenceScore,
-                    issues=[i.dict() for i in validation.issues],
-                    suggestions=[s.dict() for s in validation.suggestions],
-                    validation_details=validation.validationDetails,
-                    ai_model_used=validation.metadata.get("modelUsed")
-                )
-                db.add(db_validation)
-                
-                # 3. Update Stage with Orchestrator Feedback
-                stage.orchestrator_approved = validation.approved
-                stage.orchestrator_score = validation.overallScore
-                stage.orchestrator_feedback = {
-                    "issues": [i.dict() for i in validation.issues],
-                    "suggestions": [s.dict() for s in validation.suggestions]
-                }
-
-                # 4. Decide on Status
-                if validation.canProceed:
-                     stage.status = "completed"
-                     stage.output = agent_response["output"]
-                     stage.completed_at = datetime.utcnow()
-                     
-                     # Unlock next stage
-                     if stage_number < 7:
-                        next_result = await db.execute(
-                            select(Stage).where(
-                                Stage.account_id == account_id,
-                                Stage.stage_number == stage_number + 1
-                            )
-                        )
-                        next_stage = next_result.scalar_one_or_none()
-                        if next_stage and next_stage.status == "locked":
-                            next_stage.status = "in_progress"
-                else:
-                    # Logic: If rejected, we keep it 'in_progress' so user can continue chatting
-                    # We might want to append a message from the Orchestrator?
-                    # For now, just keeping status as is (which is 'in_progress' usually)
-                    stage.status = "in_progress" 
-                    # We DO NOT save output if rejected, or maybe we do? 
-                    # Let's save output so user can see it, but status is not completed.
-                    # Actually, if we save output, frontend might show it as final?
-                    # Let's invalid output => output = None or partial?
-                    # Safe bet: Update output so we see the latest draft, but status is NOT completed.
-                    stage.output = agent_response["output"]
-
-            except Exception as e:
-                print(f"Orchestrator Failed: {e}")
-                # Fallback: Mark as completed if orchestrator fails? Or Block?
-                # MVP: Fail open (allow completion) but log error
-                stage.status = "completed" 
-                stage.output = agent_response["output"]
-                stage.completed_at = datetime.utcnow()
-                stage.orchestrator_approved = True # Default to true on error
-                
-                if stage_number < 7:
-                    next_result = await db.execute(
-                        select(Stage).where(
-                            Stage.account_id == account_id,
-                            Stage.stage_number == stage_number + 1
-                        )
-                    )
-                    next_stage = next_result.scalar_one_or_none()
-                    if next_stage and next_stage.status == "locked":
-                        next_stage.status = "in_progress"
-
-        await db.commit()
-        await db.refresh(stage)
+        history = await stage_message_service.load_messages(db, stage)
+        agent_response = await _run_agent(
+            stage_number, request.message,
+            request.state or stage_message_service.build_state(stage, history),
+            stage, account, account_context,
+            previous_stage_output, previous_outputs, deadline=deadline
+        )
 
-        return {
-            "response": agent_response["response"],
-            "completed": agent_response["completed"],
-            "buttons": agent_response.get("buttons", []),
-            "confidenceScore": agent_response.get("confidenceScore"),
-            "progressLabel": agent_response.get("progressLabel"),
-            "progressStep": agent_response.get("progressStep"),
-            "orchestratorValidation": orchestrator_validation_result,
-            "stage": {
-                "id": stage.id,
-                "stage_number": stage.stage_number,
-                "status": stage.status,
-                "state": stage.state,
-                "output": stage.output,
-                "completed_at": stage.completed_at,
-                "orchestrator_approved": stage.orchestrator_approved,
-                "orchestrator_score": stage.orchestrator_score,
-                "orchestrator_feedback": stage.orchestrator_feedback
-            }
-        }
+        return await _apply_agent_response(
+            stage, account, account_context, agent_response, history, db
+        )
 
+    except LLMDeadlineError as e:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=f"AI provider did not answer in time: {str(e)}"
+        )
+    except LLMError as e:
+        # Provider trouble that survived retries and failover: tell the client to retry later
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"AI provider unavailable: {str(e)}",
+            headers={"Retry-After": str(int(settings.llm_breaker_cooldown_seconds))}
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -326,40 +323,105 @@ async def chat_with_agent(
         )
 
 
-@router.get("/accounts/{account_id}/stages/{stage_number}/init")
-async def get_agent_initial_message(
+@router.post("/accounts/{account_id}/stages/{stage_number}/chat/stream")
+async def chat_with_agent_stream(
     account_id: UUID,
     stage_number: int,
+    request: StageMessageRequest,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    print(f"DEBUG: Initializing agent message for stage {stage_number}, account {account_id}")
-    # Verify ownership
-    account = await verify_account_ownership(account_id, current_user, db)
-
-    # Validate stage number
-    if stage_number < 1 or stage_number > 7:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Stage number must be between 1 and 7"
-        )
+    """
+    Streaming variant of the chat endpoint
 
-    # Only stages 1-7 are implemented in MVP
-    if stage_number > 7:
-        raise HTTPException(
-            status_code=status.HTTP_501_NOT_IMPLEMENTED,
-            detail=f"Stage {stage_number} not yet implemented in MVP"
-        )
+    Server-sent events: each event is a `data: {json}` line followed by a blank line:
+    - {"type": "token", "content": "..."} for each piece of agentMessage text
+    - {"type": "complete", ...} with the same payload as the chat endpoint, sent
+      after the stage has been persisted
+    - {"type": "error", "detail": "..."} if the turn fails (nothing is persisted)
+    """
+    deadline = Deadline(settings.chat_stream_deadline_seconds)
 
-    # Get stage
-    result = await db.execute(
-        select(Stage).where(
-            Stage.account_id == account_id,
-            Stage.stage_number == stage_number
-        )
+    account, stage, previous_stage_output, previous_outputs = await _load_chat_context(
+        account_id, stage_number, current_user, db
     )
-    stage = result.scalar_one_or_none()
 
+    account_context = {
+        "company_name": account.client_name,
+        "company_website": account.company_website,
+        "consultant_name": current_user.full_name or "Consultor"
+    }
+
+    history = await stage_message_service.load_messages(db, stage)
+
+    async def event_stream():
+        queue: asyncio.Queue = asyncio.Queue()
+        extractor = AgentMessageExtractor()
+
+        async def on_delta(delta: str):
+            text = extractor.feed(delta)
+            if text:
+                await queue.put({"type": "token", "content": text})
+
+        async def run_turn():
+            try:
+                agent_response = await _run_agent(
+                    stage_number, request.message,
+                    request.state or stage_message_service.build_state(stage, history),
+                    stage, account, account_context,
+                    previous_stage_output, previous_outputs,
+                    on_delta=on_delta, deadline=deadline
+                )
+                payload = await _apply_agent_response(
+                    stage, account, account_context, agent_response, history, db
+                )
+                await queue.put({"type": "complete", **payload})
+            except LLMDeadlineError as e:
+                await db.rollback()
+                await queue.put({"type": "error", "detail": f"AI provider did not answer in time: {str(e)}", "retryable": True})
+            except LLMError as e:
+                await db.rollback()
+                await queue.put({"type": "error", "detail": f"AI provider unavailable: {str(e)}", "retryable": True})
+            except asyncio.CancelledError:
+                # Client went away: drop the half-done turn before the session is closed
+                await db.rollback()
+                raise
+            except Exception as e:
+                await db.rollback()
+                await queue.put({"type": "error", "detail": f"Agent error: {str(e)}"})
+            finally:
+                await queue.put(None)
+
+        task = asyncio.create_task(run_turn())
+        try:
+            while True:
+                event = await queue.get()
+                if event is None:
+                    break
+                yield f"data: {json.dumps(event, default=str)}\n\n"
+        finally:
+            # Client disconnected mid-stream: stop the turn without persisting, and wait
+            # for it to unwind (provider stream closed, limiter slot released, rollback)
+            if not task.done():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+@router.get("/accounts/{account_id}/stages/{stage_number}/init")
+async def get_agent_initial_message(
+    account_id: UUID,
+    stage_number: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    print(f"DEBUG: Initializing agent message for stage {stage_number}, account {account_id}")
+    _check_stage_number(stage_number)
+    context = await load_owned_stage_context(account_id, current_user, db)
+    account = context.account
+
+    stage = context.stage(stage_number)
     if not stage:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -373,30 +435,9 @@ async def get_agent_initial_message(
             detail="This stage is locked. Complete previous stages first."
         )
 
-    # Get previous stage output if needed
-    previous_stage_output = None
-    if stage_number > 1:
-        prev_result = await db.execute(
-            select(Stage).where(
-                Stage.account_id == account_id,
-                Stage.stage_number == stage_number - 1
-            )
-        )
-        prev_stage = prev_result.scalar_one_or_none()
-        if prev_stage and prev_stage.output:
-            previous_stage_output = prev_stage.output
-
-    # Get all previous outputs for Stage 3 context
-    previous_outputs = {}
-    if stage_number > 1:
-        prev_stages_result = await db.execute(
-            select(Stage).where(
-                Stage.account_id == account_id,
-                Stage.stage_number < stage_number
-            )
-        )
-        for p_stage in prev_stages_result.scalars().all():
-            previous_outputs[f"stage_{p_stage.stage_number}"] = p_stage.output
+    # Previous stage output and all previous outputs (Stage 3+ context)
+    previous_stage_output = context.previous_stage_output(stage_number)
+    previous_outputs = context.previous_outputs(stage_number)
 
     # Prepare account context
     account_context = {
@@ -405,6 +446,9 @@ async def get_agent_initial_message(
         "consultant_name": current_user.full_name or "Consultor"
     }
 
+    # Stage 1 only: "pending" tells the client to poll /research and reload this message
+    research_status = None
+
     # Get initial message from appropriate agent
     try:
         print(f"DEBUG: Starting initial message logic for stage {stage_number}")
@@ -413,20 +457,21 @@ async def get_agent_initial_message(
             if stage.state is None:
                 stage.state = {}
                 
-            # Check if research already exists
+            # Research runs in the background (queued at account creation); never wait for it here
             research_data = stage.state.get("research_data")
-            if not research_data and account.company_website:
-                print(f"DEBUG: Triggering research for {account.client_name}")
-                try:
-                    # Perform one-time research
-                    research_data = await research_service.research_company(account.client_name, account.company_website)
-                    stage.state["research_data"] = research_data
+            research_status = stage.state.get("research_status")
+            if not research_data and account.company_website and research_status not in (
+                research_jobs.RESEARCH_READY, research_jobs.RESEARCH_FAILED
+            ):
+                # Accounts created before background research, or jobs lost on restart
+                if research_status is None:
+                    await stage_message_service.merge_state(
+                        db, stage, {"research_status": research_jobs.RESEARCH_PENDING}
+                    )
                     await db.commit()
-                    print(f"DEBUG: Research completed: {bool(research_data)}")
-                except Exception as e:
-                    print(f"ERROR: Research failed: {str(e)}")
-                    research_data = {}
-            
+                research_jobs.enqueue(account.id)
+                research_status = research_jobs.RESEARCH_PENDING
+
             initial_data = await booms_agent.get_initial_message(account_context, research_context=research_data)
             initial_message = initial_data["message"]
             buttons = initial_data.get("buttons", [])
@@ -458,12 +503,17 @@ async def get_agent_initial_message(
                     detail=f"Agent for stage {stage_number} not implemented"
                 )
 
+        # The server transcript is authoritative: the agents must see their own greeting
+        await stage_message_service.save_greeting(db, stage, initial_message)
+        await db.commit()
+
         print(f"DEBUG: Returning initial message successfully")
         return {
             "message": initial_message,
             "buttons": buttons,
             "stage_number": stage_number,
-            "status": stage.status
+            "status": stage.status,
+            "research_status": research_status
         }
 
     except Exception as e:
@@ -476,3 +526,149 @@ async def get_agent_initial_message(
             "status": stage.status
         }
 
+
+@router.get("/accounts/{account_id}/research")
+async def get_research_status(
+    account_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Poll the background company research of an account
+
+    Returns research_status ("pending", "ready", "failed" or null when the
+    account has no website) and research_data once ready.
+    """
+    await verify_account_ownership(account_id, current_user, db)
+
+    result = await db.execute(
+        select(Stage.state).where(
+            Stage.account_id == account_id,
+            Stage.stage_number == 1
+        )
+    )
+    state = result.scalar_one_or_none() or {}
+
+    research_status = state.get("research_status")
+    if research_status == research_jobs.RESEARCH_PENDING and not research_jobs.is_active(account_id):
+        # Job lost (e.g. server restart): queue it again
+        research_jobs.enqueue(account_id)
+
+    return {
+        "research_status": research_status,
+        "research_data": state.get("research_data")
+    }
+
+
+async def _get_validation_stage(account_id: UUID, stage_number: int, current_user: User, db: AsyncSession) -> Stage:
+    """
+    Stage of an account owned by the user, with only the columns of the
+    validation payload (one single-row query: /validation is polled)
+    """
+    result = await db.execute(
+        select(Stage)
+        .join(Account, Account.id == Stage.account_id)
+        .options(load_only(
+            Stage.id,
+            Stage.stage_number,
+            Stage.status,
+            Stage.output,
+            Stage.completed_at,
+            Stage.orchestrator_approved,
+            Stage.orchestrator_score,
+            Stage.orchestrator_feedback,
+            Stage.validation_status,
+            Stage.validation_id
+        ))
+        .where(
+            Stage.account_id == account_id,
+            Stage.stage_number == stage_number,
+            Account.user_id == current_user.id
+        )
+    )
+    stage = result.scalar_one_or_none()
+    if not stage:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Stage not found"
+        )
+    return stage
+
+
+def _validation_payload(stage: Stage, latest: OrchestratorValidationModel | None) -> dict:
+    return {
+        "stage_number": stage.stage_number,
+        "status": stage.status,
+        "validation_status": stage.validation_status,
+        "orchestrator_approved": stage.orchestrator_approved,
+        "orchestrator_score": stage.orchestrator_score,
+        "orchestrator_feedback": stage.orchestrator_feedback,
+        "output": stage.output,
+        "completed_at": stage.completed_at,
+        "validation": {
+            "approved": latest.approved,
+            "quality_score": latest.quality_score,
+            "coherence_score": latest.coherence_score,
+            "issues": latest.issues,
+            "suggestions": latest.suggestions,
+            "validated_at": latest.validated_at
+        } if latest else None
+    }
+
+
+@router.get("/accounts/{account_id}/stages/{stage_number}/validation")
+async def get_stage_validation(
+    account_id: UUID,
+    stage_number: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Poll the orchestrator validation of a completed stage
+
+    validation_status is "pending" while the orchestrator runs, then
+    "completed" (verdict in orchestrator_* / validation) or "failed"
+    (retry with POST .../validation/retry).
+    """
+    stage = await _get_validation_stage(account_id, stage_number, current_user, db)
+
+    if stage.validation_status == validation_jobs.VALIDATION_PENDING and not validation_jobs.is_active(stage.id):
+        # Job lost (e.g. server restart): queue it again
+        validation_jobs.enqueue(stage.id, current_user.full_name)
+
+    latest = None
+    if stage.validation_status == validation_jobs.VALIDATION_COMPLETED and stage.validation_id:
+        # The verdict that was applied (a memoized one may be older than the latest row)
+        latest = await db.get(OrchestratorValidationModel, stage.validation_id)
+
+    return _validation_payload(stage, latest)
+
+
+@router.post("/accounts/{account_id}/stages/{stage_number}/validation/retry")
+async def retry_stage_validation(
+    account_id: UUID,
+    stage_number: int,
+    force: bool = False,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Re-run a failed (or lost) orchestrator validation
+
+    Idempotent: a stage already validated or currently validating is left as is.
+    With force=true a validated stage is re-validated by the LLM, bypassing
+    the memoized verdict.
+    """
+    stage = await _get_validation_stage(account_id, stage_number, current_user, db)
+
+    retryable = [validation_jobs.VALIDATION_FAILED]
+    if force:
+        retryable.append(validation_jobs.VALIDATION_COMPLETED)
+    if stage.validation_status in retryable and stage.output:
+        stage.validation_status = validation_jobs.VALIDATION_PENDING
+        await db.commit()
+
+    if stage.validation_status == validation_jobs.VALIDATION_PENDING:
+        validation_jobs.enqueue(stage.id, current_user.full_name, force)
+
+    return _validation_payload(stage, None)
@@ -7,7 +7,7 @@ from sqlalchemy import select
 from app.database import get_db
 from app.models.user import User
 from app.schemas.user import UserCreate, UserLogin, UserResponse, Token
-from app.utils.security import hash_password, verify_password, create_access_token
+from app.utils.security import hash_password_async, verify_and_update_password, create_access_token
 from app.dependencies import get_current_user
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
@@ -40,7 +40,7 @@ async def register(
     # Create new user
     new_user = User(
         email=user_data.email,
-        hashed_password=hash_password(user_data.password),
+        hashed_password=await hash_password_async(user_data.password),
         full_name=user_data.full_name
     )
 
@@ -67,27 +67,45 @@ async def login(
     )
     user = result.scalar_one_or_none()
 
-    # Verify credentials
-    if not user or not verify_password(credentials.password, user.hashed_password):
+    # Verify credentials (off the event loop)
+    valid, new_hash = (False, None)
+    if user:
+        valid, new_hash = await verify_and_update_password(credentials.password, user.hashed_password)
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # Argon2 parameters changed since this hash was made: store it with the current ones
+    if new_hash:
+        user.hashed_password = new_hash
+        await db.commit()
+
     # Create access token
-    access_token = create_access_token(data={"sub": str(user.id)})
+    # Identity claims let auth_stateless deployments skip the users lookup
+    access_token = create_access_token(data={"sub": str(user.id), "email": user.email, "name": user.full_name})
 
     return {"access_token": access_token, "token_type": "bearer"}
 
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get current authenticated user information
 
     Requires: Bearer token in Authorization header
     """
-    return current_user
+    # The principal may be cached or built from token claims: read the profile from the table
+    user = await db.get(User, current_user.id)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
@@ -30,9 +30,9 @@ async def run_stage_demo(
     """
     Run an automated demo chat for a specific stage
     """
-    # Verify account ownership (simple check)
-    from app.routers.agents import verify_account_ownership
-    await verify_account_ownership(account_id, current_user, db)
+    # Verify account ownership; the account and its stages are handed to the demo (one query)
+    from app.routers.agents import load_owned_stage_context
+    context = await load_owned_stage_context(account_id, current_user, db)
     
     try:
         # Create generator
@@ -41,7 +41,8 @@ async def run_stage_demo(
             stage_number=stage_number,
             profile_key=request.profile,
             speed=request.speed,
-            db=db
+            db=db,
+            context=context
         )
         
         return StreamingResponse(
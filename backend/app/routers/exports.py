@@ -3,15 +3,14 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 from uuid import UUID
 
 from app.database import get_db
 from app.models.user import User
 from app.models.account import Account
-from app.models.stage import Stage
 from app.dependencies import get_current_user
 from app.services import pdf_service, excel_service
+from app.services.stage_context import load_stage_context
 
 router = APIRouter(prefix="/exports", tags=["Exports"])
 
@@ -27,30 +26,18 @@ async def get_account_with_stages(
     Returns:
         Tuple of (account, stage_outputs dict)
     """
-    # Get account
-    result = await db.execute(
-        select(Account).where(
-            Account.id == account_id,
-            Account.user_id == current_user.id
-        )
-    )
-    account = result.scalar_one_or_none()
+    # Account (ownership checked) and its stages in one query
+    context = await load_stage_context(db, account_id, current_user.id)
 
-    if not account:
+    if not context:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Account not found"
         )
+    account = context.account
 
-    # Get all completed stages with output
-    result = await db.execute(
-        select(Stage).where(
-            Stage.account_id == account_id,
-            Stage.status == "completed",
-            Stage.output.isnot(None)
-        ).order_by(Stage.stage_number)
-    )
-    stages = result.scalars().all()
+    # Completed stages with output
+    stages = context.completed_stages()
 
     if not stages:
         raise HTTPException(
@@ -1,6 +1,6 @@
 # /backend/app/routers/stages.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from uuid import UUID
@@ -10,8 +10,10 @@ from app.database import get_db
 from app.models.user import User
 from app.models.account import Account
 from app.models.stage import Stage
-from app.schemas.stage import StageUpdate, StageResponse
+from app.models.stage_message import StageMessage
+from app.schemas.stage import StageUpdate, StageResponse, StageMessageListResponse
 from app.dependencies import get_current_user
+from app.services import stage_message_service
 
 router = APIRouter(prefix="/accounts/{account_id}/stages", tags=["Stages"])
 
@@ -142,9 +144,18 @@ async def update_stage(
 
     # Update fields
     update_data = stage_data.model_dump(exclude_unset=True)
+    new_state = update_data.pop("state", None)
     for field, value in update_data.items():
         setattr(stage, field, value)
 
+    # Messages in the state go to stage_messages, the rest stays in Stage.state
+    if new_state is not None:
+        if "messages" in new_state:
+            persisted = await stage_message_service.load_messages(db, stage)
+            await stage_message_service.save_state(db, stage, new_state, persisted)
+        else:
+            stage.state = new_state
+
     # If status changed to completed, set completed_at timestamp
     if stage_data.status == "completed" and stage.completed_at is None:
         stage.completed_at = datetime.utcnow()
@@ -178,7 +189,7 @@ async def reset_stage(
     Reset a stage to its initial state
     
     - Sets status to 'in_progress'
-    - Clears state (chat history)
+    - Clears state and chat history
     - Clears output
     - Clears completed_at
     """
@@ -209,7 +220,8 @@ async def reset_stage(
     
     # Reset fields
     stage.status = "in_progress"
-    stage.state = {} # Clear chat history
+    stage.state = {} # Clear agent state
+    await stage_message_service.clear_messages(db, stage) # Clear chat history
     stage.output = None
     stage.completed_at = None
     
@@ -220,8 +232,57 @@ async def reset_stage(
     stage.orchestrator_approved = None
     stage.orchestrator_score = None
     stage.orchestrator_feedback = None
+    stage.validation_status = None
+    stage.validation_id = None
 
     await db.commit()
     await db.refresh(stage)
 
     return stage
+
+
+@router.get("/{stage_number}/messages", response_model=StageMessageListResponse)
+async def get_stage_messages(
+    account_id: UUID,
+    stage_number: int,
+    after_seq: int = Query(-1, ge=-1),
+    limit: int = Query(100, ge=1, le=500),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get the conversation history of a stage, oldest first
+
+    Keyset-paginated on seq: pass the returned next_after_seq as after_seq
+    to fetch the following page (null when there are no more messages).
+    """
+    # Verify ownership
+    await verify_account_ownership(account_id, current_user, db)
+
+    # Validate stage number
+    if stage_number < 1 or stage_number > 7:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Stage number must be between 1 and 7"
+        )
+
+    result = await db.execute(
+        select(StageMessage)
+        .join(Stage, StageMessage.stage_id == Stage.id)
+        .where(
+            Stage.account_id == account_id,
+            Stage.stage_number == stage_number,
+            StageMessage.seq > after_seq
+        )
+        .order_by(StageMessage.seq)
+        .limit(limit + 1)
+    )
+    messages = result.scalars().all()
+
+    has_more = len(messages) > limit
+    messages = messages[:limit]
+
+    return {
+        "messages": messages,
+        "next_after_seq": messages[-1].seq if has_more else None
+    }
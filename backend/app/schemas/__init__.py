@@ -1,8 +1,8 @@
 # /backend/app/schemas/__init__.py
 
 from app.schemas.user import UserCreate, UserLogin, UserResponse, Token, TokenData
-from app.schemas.account import AccountCreate, AccountUpdate, AccountResponse
-from app.schemas.stage import StageUpdate, StageResponse, StageMessageRequest
+from app.schemas.account import AccountCreate, AccountUpdate, AccountResponse, AccountSummaryResponse, AccountSummaryListResponse
+from app.schemas.stage import StageUpdate, StageResponse, StageSummaryResponse, StageMessageRequest, StageMessageResponse, StageMessageListResponse
 
 __all__ = [
     "UserCreate",
@@ -13,7 +13,12 @@ __all__ = [
     "AccountCreate",
     "AccountUpdate",
     "AccountResponse",
+    "AccountSummaryResponse",
+    "AccountSummaryListResponse",
     "StageUpdate",
     "StageResponse",
+    "StageSummaryResponse",
     "StageMessageRequest",
+    "StageMessageResponse",
+    "StageMessageListResponse",
 ]
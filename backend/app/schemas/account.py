@@ -33,5 +33,27 @@ class AccountResponse(BaseModel):
     class Config:
         from_attributes = True
 
-from .stage import StageResponse
+class AccountSummaryResponse(BaseModel):
+    """Schema for the dashboard account list (no stage state/output payloads)"""
+    id: UUID
+    user_id: UUID
+    client_name: str
+    company_website: str | None
+    ai_model: str
+    created_at: datetime
+    updated_at: datetime
+    stages: list["StageSummaryResponse"] = []
+
+    class Config:
+        from_attributes = True
+
+
+class AccountSummaryListResponse(BaseModel):
+    """Schema for a page of account summaries"""
+    accounts: list[AccountSummaryResponse]
+    next_cursor: str | None = None  # Pass as cursor to fetch the next page
+
+from .stage import StageResponse, StageSummaryResponse
 AccountResponse.model_rebuild()
+AccountSummaryResponse.model_rebuild()
+AccountSummaryListResponse.model_rebuild()
@@ -23,12 +23,29 @@ class StageResponse(BaseModel):
     state: dict[str, Any]
     output: dict[str, Any] | None
     ai_model_used: str | None
+    message_count: int = 0
     created_at: datetime
     updated_at: datetime
     completed_at: datetime | None
     orchestrator_approved: bool | None = None
     orchestrator_score: float | None = None
     orchestrator_feedback: dict[str, Any] | None = None
+    validation_status: str | None = None
+
+    class Config:
+        from_attributes = True
+
+
+class StageSummaryResponse(BaseModel):
+    """Schema for a stage in list views: status, score and timestamps only"""
+    id: UUID
+    stage_number: int
+    status: str
+    orchestrator_approved: bool | None = None
+    orchestrator_score: float | None = None
+    created_at: datetime
+    updated_at: datetime
+    completed_at: datetime | None
 
     class Config:
         from_attributes = True
@@ -38,3 +55,20 @@ class StageMessageRequest(BaseModel):
     """Schema for sending a message to a stage agent"""
     message: str = Field(..., min_length=1)
     state: dict[str, Any] | None = None
+
+
+class StageMessageResponse(BaseModel):
+    """Schema for a single message of a stage conversation"""
+    seq: int
+    role: str
+    content: str
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class StageMessageListResponse(BaseModel):
+    """Schema for a page of stage conversation messages"""
+    messages: list[StageMessageResponse]
+    next_after_seq: int | None = None  # Pass as after_seq to fetch the next page
@@ -1,17 +1,20 @@
 # /backend/app/services/ai_provider_service.py
 
-from app.services import openai_service, google_service
+import asyncio
+import time
+from contextlib import aclosing
+from app.services import openai_service, google_service, llm_cache, llm_limiter, llm_resilience
+from app.services.deadline import Deadline
+from app.services.llm_errors import LLMError, LLMDeadlineError, LLMUnavailableError
+from app.services.history_service import estimate_tokens
 from app.config import get_settings
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Awaitable, Callable, Optional, Tuple
 
 settings = get_settings()
 
-async def chat_completion(
-    messages: List[Dict[str, str]],
-    model_override: str = None,
-    temperature: float = 0.7,
-    max_tokens: int = 2048
-) -> str:
+
+def _select_provider(model_override: str = None) -> Tuple[str, str]:
+    """Resolve (provider, model) for a request based on the override and configured keys"""
     # Check for valid keys
     has_gemini = settings.google_ai_api_key and "your-google" not in settings.google_ai_api_key
     has_openai = settings.openai_api_key and "your-openai" not in settings.openai_api_key
@@ -48,12 +51,7 @@ async def chat_completion(
             elif "gemini-1.5-pro" in model_override: target_model = "gemini-1.5-pro"
             elif "gemini-1.5-flash" in model_override: target_model = "gemini-1.5-flash"
             
-        return await google_service.chat_completion(
-            messages=messages,
-            model=target_model,
-            temperature=temperature,
-            max_tokens=max_tokens
-        )
+        return "gemini", target_model
     elif has_openai:
         # Sanitize openai model name (remove prefixes like 'openai-')
         target_model = "gpt-4o"
@@ -64,11 +62,192 @@ async def chat_completion(
             elif "o1" in clean_model:
                 target_model = "o1-preview"
                 
-        return await openai_service.chat_completion(
+        return "openai", target_model
+    else:
+        raise Exception("No AI provider configured (missing API keys)")
+
+
+# Provider services by name (swap entries to inject fakes)
+PROVIDERS = {"gemini": google_service, "openai": openai_service}
+
+# Model used when failing over to the other provider
+FAILOVER_MODELS = {"gemini": "gemini-2.0-flash", "openai": "gpt-4o"}
+
+
+def _has_key(provider: str) -> bool:
+    if provider == "gemini":
+        return bool(settings.google_ai_api_key and "your-google" not in settings.google_ai_api_key)
+    return bool(settings.openai_api_key and "your-openai" not in settings.openai_api_key)
+
+
+def _provider_chain(model_override: str = None) -> List[Tuple[str, str]]:
+    """Primary (provider, model) plus the other provider as failover, healthy providers first"""
+    primary = _select_provider(model_override)
+    chain = [primary]
+    alternate = "openai" if primary[0] == "gemini" else "gemini"
+    if settings.llm_failover_enabled and _has_key(alternate):
+        chain.append((alternate, FAILOVER_MODELS[alternate]))
+    # Stable sort: providers whose circuit is open go last
+    return sorted(chain, key=lambda p: llm_resilience.get_breaker(p[0]).is_open())
+
+
+async def chat_completion(
+    messages: List[Dict[str, str]],
+    model_override: str = None,
+    temperature: float = 0.7,
+    max_tokens: int = 2048,
+    on_delta: Optional[Callable[[str], Awaitable[None]]] = None,
+    cache_ttl: Optional[float] = None,
+    priority: Optional[int] = None,
+    deadline: Optional[Deadline] = None
+) -> str:
+    """
+    Route a chat completion to Gemini or OpenAI.
+
+    If on_delta is given the provider is called in streaming mode and every text
+    delta is passed to it as it arrives; the full text is still returned.
+
+    Call sites with repeatable, low-temperature requests can opt into the
+    response cache by passing cache_ttl (seconds). The entry is keyed on the
+    requested model even when another provider answered. Streaming calls are
+    never cached.
+
+    Every provider call goes through llm_limiter (rate buckets, adaptive
+    concurrency, priority queue). priority defaults to the current context
+    (interactive unless a background job or the demo set it).
+
+    Transient errors (rate limit, timeout, 5xx) are retried with jittered
+    backoff; when a provider keeps failing, or its circuit breaker is open,
+    the call fails over to the other provider, all within the deadline
+    (llm_latency_budget_seconds if the caller gave none). A stream that already emitted text is not
+    retried. Raises an LLMError subclass when every option is exhausted.
+
+    Routers pass the deadline of the whole request: each attempt, including
+    its wait in the limiter queue, gets the time that is left and is
+    cancelled when it runs out (LLMDeadlineError).
+    """
+    chain = _provider_chain(model_override)
+
+    use_cache = on_delta is None and cache_ttl is not None and settings.llm_cache_enabled
+    if use_cache:
+        # Keyed on the model that was asked for, not on whoever answers: a failover
+        # response (or one served while the primary's breaker is open) is found again
+        cache_key = llm_cache.make_key(*_select_provider(model_override), messages, temperature, max_tokens)
+        cached = await llm_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    deadline = deadline or Deadline(settings.llm_latency_budget_seconds)
+    emitted = False
+    last_error: Optional[LLMError] = None
+
+    async def forward(delta: str) -> None:
+        nonlocal emitted
+        emitted = True
+        await on_delta(delta)
+
+    for index, (provider, target_model) in enumerate(chain):
+        breaker = llm_resilience.get_breaker(provider)
+
+        for attempt in range(settings.llm_max_retries + 1):
+            if not breaker.allow():
+                last_error = last_error or LLMUnavailableError(f"{provider} circuit open", provider)
+                break
+
+            if deadline.expired():
+                breaker.record_neutral()
+                raise LLMDeadlineError(f"Request deadline exceeded before calling {provider}", provider)
+
+            started = time.monotonic()
+            try:
+                # Cancels the call (queue wait included) when the deadline passes
+                response = await asyncio.wait_for(
+                    _call_provider(
+                        provider, target_model, messages, temperature, max_tokens,
+                        forward if on_delta else None, priority, deadline.remaining()
+                    ),
+                    timeout=deadline.remaining()
+                )
+            except asyncio.TimeoutError:
+                breaker.record_neutral()
+                raise LLMDeadlineError(
+                    f"{provider} did not answer within the request deadline ({deadline.budget:g}s)", provider
+                )
+            except LLMError as e:
+                last_error = e
+                if e.retryable:
+                    breaker.record_failure()
+                else:
+                    breaker.record_neutral()
+                if emitted:
+                    raise  # Partial text already reached the client
+                if not e.retryable:
+                    break  # Same request would fail again here; try the other provider
+                delay = llm_resilience.backoff_delay(attempt)
+                if attempt == settings.llm_max_retries or delay >= deadline.remaining():
+                    break
+                print(f"LLM {provider} {type(e).__name__}, retrying in {delay:.2f}s (attempt {attempt + 1})")
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                # Cancelled (client gone, outer timeout, shutdown) or unexpected: release a
+                # half-open trial so the breaker doesn't stay short-circuited for good
+                breaker.record_neutral()
+                raise
+
+            breaker.record_success()
+            if use_cache:
+                await llm_cache.put(cache_key, provider, target_model, response, cache_ttl, time.monotonic() - started)
+            return response
+
+        if deadline.expired():
+            break
+        if index + 1 < len(chain):
+            print(f"LLM failover: {provider} failed ({type(last_error).__name__}), trying {chain[index + 1][0]}")
+
+    if deadline.expired():
+        # Out of time rather than out of options
+        raise LLMDeadlineError(
+            f"Request deadline exceeded ({type(last_error).__name__}: {str(last_error)})",
+            getattr(last_error, "provider", None)
+        ) from last_error
+    raise last_error or LLMUnavailableError("No AI provider available")
+
+
+async def _call_provider(
+    provider: str,
+    target_model: str,
+    messages: List[Dict[str, str]],
+    temperature: float,
+    max_tokens: int,
+    on_delta: Optional[Callable[[str], Awaitable[None]]],
+    priority: Optional[int],
+    timeout: Optional[float] = None
+) -> str:
+    """One admission-controlled call to a provider (timeout is passed on to the SDK request)"""
+    service = PROVIDERS[provider]
+
+    if on_delta is None:
+        async with llm_limiter.limit(provider, estimate_tokens(messages), priority):
+            return await service.chat_completion(
+                messages=messages,
+                model=target_model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                timeout=timeout
+            )
+
+    parts = []
+    async with llm_limiter.limit(provider, estimate_tokens(messages), priority, track_latency=False):
+        # aclosing: on cancellation the provider stream is closed right away, not at GC
+        async with aclosing(service.chat_completion_stream(
             messages=messages,
             model=target_model,
             temperature=temperature,
-            max_tokens=max_tokens
-        )
-    else:
-        raise Exception("No AI provider configured (missing API keys)")
+            max_tokens=max_tokens,
+            timeout=timeout
+        )) as stream:
+            async for delta in stream:
+                parts.append(delta)
+                await on_delta(delta)
+    return "".join(parts)
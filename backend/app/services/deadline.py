@@ -0,0 +1,36 @@
+# /backend/app/services/deadline.py
+"""
+Per-request deadline.
+
+Routers create one when a request starts and pass it down (agents ->
+ai_provider_service -> provider SDKs), so every downstream call gets the
+time that is left instead of its own full timeout, and a slow provider
+can't push the request past its budget.
+"""
+
+import time
+from typing import Optional
+
+
+class Deadline:
+    """Point in time (monotonic clock) by which a request must be done"""
+
+    def __init__(self, seconds: float):
+        self.budget = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left, never negative"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def earliest(self, other: Optional["Deadline"]) -> "Deadline":
+        """Whichever of the two deadlines expires first"""
+        if other is None or self.expires_at <= other.expires_at:
+            return self
+        return other
+
+    def __repr__(self) -> str:
+        return f"Deadline(remaining={self.remaining():.2f}s of {self.budget:.2f}s)"
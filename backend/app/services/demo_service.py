@@ -2,14 +2,12 @@
 
 import asyncio
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 
-from app.services import ai_provider_service
+from app.services import ai_provider_service, llm_limiter, stage_message_service
 from app.services.demo_profiles import DEMO_PROFILES
-from app.models.stage import Stage
-from app.models.account import Account
+from app.services.stage_context import StageContext, load_stage_context
 from app.agents import booms_agent, journey_agent, ofertas_agent, canales_agent, atlas_agent, planner_agent, budgets_agent
 
 class DemoService:
@@ -19,29 +17,31 @@ class DemoService:
         stage_number: int,
         profile_key: str = "saas_b2b",
         speed: str = "normal",
-        db: AsyncSession = None
+        db: AsyncSession = None,
+        context: Optional[StageContext] = None
     ):
         """
         Executes a full autochat for a specific stage, yielding events as they happen
+
+        context (account + stages, see stage_context) is loaded here unless the
+        caller already has it.
         """
         import json
+
+        # Demo LLM calls queue behind interactive chats (scoped to this streaming task)
+        llm_limiter.current_priority.set(llm_limiter.PRIORITY_DEMO)
         
-        # Get stage
-        result = await db.execute(
-            select(Stage).where(
-                Stage.account_id == account_id,
-                Stage.stage_number == stage_number
-            )
-        )
-        stage = result.scalar_one_or_none()
-        if not stage:
-            yield json.dumps({"error": "Stage not found"}) + "\n\n"
+        # Account and all its stages (single query)
+        if context is None:
+            context = await load_stage_context(db, account_id)
+        if not context:
+            yield json.dumps({"error": "Account not found"}) + "\n\n"
             return
+        account = context.account
 
-        # Get account for context
-        account = await db.get(Account, account_id)
-        if not account:
-            yield json.dumps({"error": "Account not found"}) + "\n\n"
+        stage = context.stage(stage_number)
+        if not stage:
+            yield json.dumps({"error": "Stage not found"}) + "\n\n"
             return
 
         # Get profile
@@ -83,16 +83,7 @@ class DemoService:
         max_iterations = 60
         
         # Get all previous outputs for Stage 3 context
-        previous_outputs = {}
-        if stage_number > 1:
-            prev_stages_result = await db.execute(
-                select(Stage).where(
-                    Stage.account_id == account_id,
-                    Stage.stage_number < stage_number
-                )
-            )
-            for p_stage in prev_stages_result.scalars().all():
-                previous_outputs[f"stage_{p_stage.stage_number}"] = p_stage.output
+        previous_outputs = context.previous_outputs(stage_number)
 
         # Get initial message
         if stage_number == 1:
@@ -104,8 +95,8 @@ class DemoService:
             if not research_data and account.company_website:
                 from app.services import research_service
                 try:
-                    research_data = await research_service.research_company(account.client_name, account.company_website)
-                    stage.state["research_data"] = research_data
+                    research_data = await research_service.get_company_research(db, account.client_name, account.company_website)
+                    stage.state = {**stage.state, "research_data": research_data}
                     await db.commit()
                 except Exception as e:
                     print(f"Demo research failed: {e}")
@@ -130,6 +121,7 @@ class DemoService:
                 return
 
         current_state = {"messages": [{"role": "assistant", "content": agent_msg}]}
+        persisted_messages = await stage_message_service.load_messages(db, stage)
         conversation_log.append({"role": "assistant", "content": agent_msg})
         
         # Yield initial agent message
@@ -165,10 +157,8 @@ class DemoService:
                     stage.status = "completed"
                     stage.output = agent_response["output"]
                     stage.completed_at = datetime.utcnow()
-                    if stage_number < 7:
-                        next_result = await db.execute(select(Stage).where(Stage.account_id == account_id, Stage.stage_number == stage_number + 1))
-                        next_stage = next_result.scalar_one_or_none()
-                        if next_stage: next_stage.status = "in_progress"
+                    next_stage = context.stage(stage_number + 1)
+                    if next_stage: next_stage.status = "in_progress"
                     await db.commit()
 
                     yield json.dumps({
@@ -249,8 +239,9 @@ class DemoService:
                 "progressStep": agent_response.get("progressStep")
             }) + "\n\n"
             
-            # Update DB periodically or at the end
-            stage.state = current_state
+            # Update DB periodically or at the end (only new messages are written)
+            await stage_message_service.save_state(db, stage, current_state, persisted_messages)
+            persisted_messages = list(current_state["messages"])
             
             if agent_response["completed"]:
                 stage.status = "completed"
@@ -258,11 +249,9 @@ class DemoService:
                 stage.completed_at = datetime.utcnow()
                 
                 # Unlock next stage
-                if stage_number < 7:
-                    next_result = await db.execute(select(Stage).where(Stage.account_id == account_id, Stage.stage_number == stage_number + 1))
-                    next_stage = next_result.scalar_one_or_none()
-                    if next_stage:
-                        next_stage.status = "in_progress"
+                next_stage = context.stage(stage_number + 1)
+                if next_stage:
+                    next_stage.status = "in_progress"
                 
                 await db.commit()
                 yield json.dumps({
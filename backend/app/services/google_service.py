@@ -2,61 +2,106 @@
 
 import google.generativeai as genai
 from app.config import get_settings
-from typing import List, Dict, Any
+from app.services import llm_usage
+from app.services.llm_clients import registry
+from app.services.llm_errors import classify
+from typing import AsyncIterator, List, Dict, Any
 
 settings = get_settings()
 
-if settings.google_ai_api_key:
-    genai.configure(api_key=settings.google_ai_api_key)
+
+def _request_options(timeout: float | None) -> Dict[str, Any] | None:
+    return {"timeout": timeout} if timeout is not None else None
+
+
+def _start_chat(messages: List[Dict[str, str]], model: str):
+    """Convert OpenAI-style messages into a Gemini chat session and the prompt to send"""
+    # Gemini uses 'user' and 'model' instead of 'user' and 'assistant'
+    # Also handles 'system' as a separate parameter in GenerativeModel
+    
+    system_instruction = ""
+    gemini_history = []
+    
+    for msg in messages:
+        if msg["role"] == "system":
+            system_instruction = msg["content"]
+        elif msg["role"] == "user":
+            gemini_history.append({"role": "user", "parts": [msg["content"]]})
+        elif msg["role"] == "assistant":
+            gemini_history.append({"role": "model", "parts": [msg["content"]]})
+    
+    # Last message is always the current user prompt
+    last_message = gemini_history.pop() if gemini_history and gemini_history[-1]["role"] == "user" else None
+    
+    # Model objects are reused per (model, system prompt) by the client registry
+    model_instance = registry.gemini_model(model, system_instruction)
+    
+    chat = model_instance.start_chat(history=gemini_history)
+    
+    # If there's no history or the last message was assistant, this shouldn't happen in a normal chat
+    # but for robustness:
+    prompt = last_message["parts"][0] if last_message else "Continue"
+    return chat, prompt
+
 
 async def chat_completion(
     messages: List[Dict[str, str]],
     model: str = "gemini-2.0-flash",
     temperature: float = 0.7,
-    max_tokens: int = 2048
+    max_tokens: int = 2048,
+    timeout: float | None = None
 ) -> str:
     """
     Send a chat completion request to Google Gemini
     """
     try:
-        # Convert OpenAI format messages to Gemini format
-        # Gemini uses 'user' and 'model' instead of 'user' and 'assistant'
-        # Also handles 'system' as a separate parameter in GenerativeModel
-        
-        system_instruction = ""
-        gemini_history = []
-        
-        for msg in messages:
-            if msg["role"] == "system":
-                system_instruction = msg["content"]
-            elif msg["role"] == "user":
-                gemini_history.append({"role": "user", "parts": [msg["content"]]})
-            elif msg["role"] == "assistant":
-                gemini_history.append({"role": "model", "parts": [msg["content"]]})
-        
-        # Last message is always the current user prompt
-        last_message = gemini_history.pop() if gemini_history and gemini_history[-1]["role"] == "user" else None
+        chat, prompt = _start_chat(messages, model)
         
-        model_instance = genai.GenerativeModel(
-            model_name=model,
-            system_instruction=system_instruction
+        # Use the async API so the event loop keeps serving other requests
+        # (concurrency is bounded by llm_limiter in ai_provider_service)
+        response = await chat.send_message_async(
+            prompt,
+            generation_config=genai.GenerationConfig(
+                temperature=temperature,
+                max_output_tokens=max_tokens,
+            ),
+            request_options=_request_options(timeout)
         )
+
+        usage = getattr(response, "usage_metadata", None)
+        if usage:
+            llm_usage.record(usage.prompt_token_count, usage.candidates_token_count)
+        return response.text
+
+    except Exception as e:
+        raise classify(e, "gemini") from e
+
+
+async def chat_completion_stream(
+    messages: List[Dict[str, str]],
+    model: str = "gemini-2.0-flash",
+    temperature: float = 0.7,
+    max_tokens: int = 2048,
+    timeout: float | None = None
+) -> AsyncIterator[str]:
+    """
+    Stream a chat completion from Google Gemini, yielding text deltas
+    """
+    try:
+        chat, prompt = _start_chat(messages, model)
         
-        chat = model_instance.start_chat(history=gemini_history)
-        
-        # If there's no history or the last message was assistant, this shouldn't happen in a normal chat
-        # but for robustness:
-        prompt = last_message["parts"][0] if last_message else "Continue"
-        
-        response = chat.send_message(
+        response = await chat.send_message_async(
             prompt,
             generation_config=genai.GenerationConfig(
                 temperature=temperature,
                 max_output_tokens=max_tokens,
-            )
+            ),
+            stream=True,
+            request_options=_request_options(timeout)
         )
-        
-        return response.text
+        async for chunk in response:
+            if chunk.parts:
+                yield chunk.text
 
     except Exception as e:
-        raise Exception(f"Google Gemini API error: {str(e)}")
+        raise classify(e, "gemini") from e
@@ -0,0 +1,98 @@
+# /backend/app/services/history_service.py
+
+import json
+from typing import Any, Dict, List, Optional
+from app.config import get_settings
+
+settings = get_settings()
+
+
+def estimate_tokens(messages: List[Dict[str, str]]) -> int:
+    """Rough token estimate (~4 chars per token), good enough for budgeting"""
+    return sum(len(m.get("content") or "") for m in messages) // 4
+
+
+def _compress_assistant(content: str) -> str:
+    """Reduce a raw JSON assistant reply to its user-facing text"""
+    start = content.find('{')
+    end = content.rfind('}')
+    if start == -1 or end == -1:
+        return content
+    try:
+        data = json.loads(content[start:end + 1])
+    except json.JSONDecodeError:
+        return content
+    if isinstance(data, dict):
+        return data.get("agentMessage") or data.get("message") or content
+    return content
+
+
+def window_messages(
+    messages: List[Dict[str, str]],
+    collected_data: Optional[Any] = None,
+    max_turns: Optional[int] = None,
+    max_prompt_tokens: Optional[int] = None,
+    extra_context: Optional[str] = None
+) -> List[Dict[str, str]]:
+    """
+    Build the prompt sent to the LLM from the full stored history.
+
+    Keeps the system prompt, the last `max_turns` user turns and, when older
+    turns are dropped, a compact summary of the data collected so far. Only
+    the most recent assistant reply is sent as raw JSON (so the model keeps
+    the response format); older ones are reduced to their agentMessage.
+    extra_context (e.g. retrieved knowledge for this turn) is appended to the
+    system prompt. The stored history itself is never modified.
+    """
+    max_turns = max_turns or settings.history_max_turns
+    max_prompt_tokens = max_prompt_tokens or settings.history_max_prompt_tokens
+
+    system = dict(messages[0]) if messages and messages[0]["role"] == "system" else None
+    rest = messages[1:] if system else list(messages)
+
+    # Group into turns; each turn starts with a user message
+    turns: List[List[Dict[str, str]]] = []
+    for msg in rest:
+        if msg["role"] == "user" or not turns:
+            turns.append([])
+        turns[-1].append(msg)
+
+    kept = turns[-max_turns:]
+    dropped = len(turns) - len(kept)
+
+    # Compress every assistant reply except the latest one
+    last_assistant = None
+    for turn in kept:
+        for msg in turn:
+            if msg["role"] == "assistant":
+                last_assistant = msg
+    window = [
+        {"role": m["role"], "content": _compress_assistant(m["content"])}
+        if m["role"] == "assistant" and m is not last_assistant else m
+        for turn in kept for m in turn
+    ]
+
+    def build(window_msgs: List[Dict[str, str]], summarize: bool) -> List[Dict[str, str]]:
+        head = []
+        if system:
+            head_msg = dict(system)
+            # Appended to the system prompt (not a separate message) since Gemini keeps a single system instruction
+            if summarize and collected_data:
+                summary = json.dumps(collected_data, ensure_ascii=False, separators=(",", ":"), default=str)
+                head_msg["content"] += f"\n\nRESUMEN DE DATOS YA RECOPILADOS (turnos anteriores omitidos):\n{summary}"
+            if extra_context:
+                head_msg["content"] += f"\n\n{extra_context}"
+            head = [head_msg]
+        elif extra_context:
+            head = [{"role": "system", "content": extra_context}]
+        return head + window_msgs
+
+    prompt = build(window, dropped > 0)
+
+    # Trim oldest turns until the prompt fits the token budget (always keep the current turn)
+    while len(kept) > 1 and estimate_tokens(prompt) > max_prompt_tokens:
+        removed = kept.pop(0)
+        window = window[len(removed):]
+        prompt = build(window, True)
+
+    return prompt
@@ -0,0 +1,76 @@
+# /backend/app/services/job_queue.py
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+
+class JobQueue:
+    """
+    In-process background job queue with a bounded worker pool.
+
+    Jobs are deduplicated by key: enqueueing a key that is already queued or
+    running is a no-op. Workers are started and stopped in the app lifespan;
+    jobs still queued on shutdown are lost, so callers persist a status that
+    lets them re-enqueue on demand.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[..., Awaitable[None]],
+        workers: int,
+        maxsize: int
+    ):
+        self.name = name
+        self.handler = handler
+        self.workers = workers
+        self.maxsize = maxsize
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._active: Dict[Hashable, tuple] = {}  # key -> args, queued or running
+
+    def enqueue(self, key: Hashable, *args: Any) -> bool:
+        """Queue a job. Returns False if the key is already queued/running or the queue is full"""
+        if self._queue is None or key in self._active:
+            return False
+        try:
+            self._queue.put_nowait(key)
+        except asyncio.QueueFull:
+            print(f"{self.name} queue full, skipping {key}")
+            return False
+        self._active[key] = args
+        return True
+
+    def is_active(self, key: Hashable) -> bool:
+        return key in self._active
+
+    def depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def _worker(self) -> None:
+        while True:
+            key = await self._queue.get()
+            try:
+                await self.handler(key, *self._active.get(key, ()))
+            except Exception as e:
+                print(f"{self.name} job failed for {key}: {str(e)}")
+            finally:
+                self._active.pop(key, None)
+                self._queue.task_done()
+
+    def start(self) -> None:
+        """Start the worker pool (app startup)"""
+        if self._queue is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self.maxsize)
+        for _ in range(self.workers):
+            self._tasks.append(asyncio.create_task(self._worker()))
+
+    async def stop(self) -> None:
+        """Cancel the workers (app shutdown)"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._active.clear()
+        self._queue = None
@@ -0,0 +1,213 @@
+# /backend/app/services/knowledge_index.py
+"""
+Chunked BM25 index over the knowledge base (app/knowledge).
+
+The index can be built offline and saved next to the documents:
+
+    python -m app.services.knowledge_index [chunk_tokens]
+
+At runtime rag_service loads the saved index when it matches the current
+documents (by a hash of their content) and rebuilds it in memory otherwise.
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+import unicodedata
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+KNOWLEDGE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "knowledge")
+INDEX_PATH = os.path.join(KNOWLEDGE_DIR, "knowledge_index.json")
+
+# BM25 parameters
+K1 = 1.5
+B = 0.75
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, accent-free word tokens (very short words are dropped)"""
+    normalized = unicodedata.normalize("NFKD", text.lower())
+    normalized = "".join(c for c in normalized if not unicodedata.combining(c))
+    return [w for w in _WORD_RE.findall(normalized) if len(w) > 2]
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough LLM token estimate (~4 chars per token)"""
+    return len(text) // 4
+
+
+def chunk_text(text: str, max_tokens: int) -> List[str]:
+    """Split a document into chunks of whole paragraphs up to ~max_tokens each"""
+    paragraphs = [p.strip() for p in re.split(r"\n\s*\n", text) if p.strip()]
+    chunks: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+
+    for paragraph in paragraphs:
+        paragraph_tokens = estimate_tokens(paragraph)
+        if current and current_tokens + paragraph_tokens > max_tokens:
+            chunks.append("\n\n".join(current))
+            current, current_tokens = [], 0
+        current.append(paragraph)
+        current_tokens += paragraph_tokens
+
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+def list_documents() -> List[str]:
+    """Text documents that can be indexed (PDFs need extraction to .txt first)"""
+    if not os.path.exists(KNOWLEDGE_DIR):
+        return []
+    return sorted(f for f in os.listdir(KNOWLEDGE_DIR) if f.endswith(".txt"))
+
+
+def _read_document(filename: str) -> str:
+    with open(os.path.join(KNOWLEDGE_DIR, filename), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def read_documents(filenames: List[str]) -> Dict[str, str]:
+    return {f: _read_document(f) for f in filenames}
+
+
+def document_stats(filenames: List[str]) -> Dict[str, Tuple[float, int]]:
+    """(mtime, size) per document: a cheap change check before hashing the content"""
+    stats = {}
+    for filename in filenames:
+        st = os.stat(os.path.join(KNOWLEDGE_DIR, filename))
+        stats[filename] = (st.st_mtime, st.st_size)
+    return stats
+
+
+def content_digest(documents: Dict[str, str]) -> str:
+    """sha256 over document names and texts (unaffected by mtime-only changes such as a fresh checkout)"""
+    digest = hashlib.sha256()
+    for filename in sorted(documents):
+        digest.update(filename.encode("utf-8") + b"\0" + documents[filename].encode("utf-8") + b"\0")
+    return digest.hexdigest()
+
+
+def document_digest(filenames: List[str]) -> str:
+    return content_digest(read_documents(filenames))
+
+
+class KnowledgeIndex:
+    """BM25 index over knowledge chunks"""
+
+    def __init__(self, chunks: List[Dict[str, Any]], digest: str, chunk_tokens: int):
+        # chunk: {"document": str, "position": int, "text": str}
+        self.chunks = chunks
+        self.digest = digest
+        self.chunk_tokens = chunk_tokens
+        self._term_freqs = [Counter(tokenize(c["text"])) for c in chunks]
+        self._lengths = [sum(tf.values()) for tf in self._term_freqs]
+        self._avg_length = (sum(self._lengths) / len(self._lengths)) if self._lengths else 0.0
+        doc_freqs: Counter = Counter()
+        for tf in self._term_freqs:
+            doc_freqs.update(tf.keys())
+        n = len(chunks)
+        self._idf = {
+            term: math.log(1 + (n - df + 0.5) / (df + 0.5))
+            for term, df in doc_freqs.items()
+        }
+
+    @classmethod
+    def build(cls, filenames: Optional[List[str]] = None, chunk_tokens: int = 300) -> "KnowledgeIndex":
+        filenames = filenames if filenames is not None else list_documents()
+        return cls.from_documents(read_documents(filenames), chunk_tokens)
+
+    @classmethod
+    def from_documents(cls, documents: Dict[str, str], chunk_tokens: int = 300) -> "KnowledgeIndex":
+        """Index already-read documents ({filename: text})"""
+        chunks = []
+        for filename, text in documents.items():
+            for position, chunk in enumerate(chunk_text(text, chunk_tokens)):
+                chunks.append({"document": filename, "position": position, "text": chunk})
+        return cls(chunks, content_digest(documents), chunk_tokens)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"digest": self.digest, "chunk_tokens": self.chunk_tokens, "chunks": self.chunks}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "KnowledgeIndex":
+        return cls(data["chunks"], data["digest"], data["chunk_tokens"])
+
+    def save(self, path: str = INDEX_PATH) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, chunk_tokens: int, path: str = INDEX_PATH, digest: Optional[str] = None) -> Optional["KnowledgeIndex"]:
+        """
+        Load a saved index, or None if it is missing, out of date or built with
+        another chunk size. digest is the current content digest, if the caller
+        already computed it.
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                index = cls.from_dict(json.load(f))
+            if digest is None:
+                digest = document_digest(list_documents())
+            if index.chunk_tokens != chunk_tokens or index.digest != digest:
+                return None
+            return index
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _score(self, query_terms: List[str], i: int) -> float:
+        tf = self._term_freqs[i]
+        length_norm = K1 * (1 - B + B * self._lengths[i] / (self._avg_length or 1))
+        score = 0.0
+        for term in query_terms:
+            freq = tf.get(term)
+            if freq:
+                score += self._idf[term] * freq * (K1 + 1) / (freq + length_norm)
+        return score
+
+    def search(
+        self,
+        query: str,
+        documents: Optional[List[str]] = None,
+        top_k: int = 6,
+        max_tokens: int = 2000
+    ) -> List[Dict[str, Any]]:
+        """
+        Best chunks for the query within a token budget, in document order.
+
+        If every candidate chunk fits in the budget they are all returned, so
+        small knowledge bases are never truncated.
+        """
+        candidates = [
+            i for i, c in enumerate(self.chunks)
+            if documents is None or c["document"] in documents
+        ]
+
+        total_tokens = sum(estimate_tokens(self.chunks[i]["text"]) for i in candidates)
+        if total_tokens <= max_tokens:
+            selected = candidates
+        else:
+            query_terms = list(set(tokenize(query)))
+            ranked = sorted(candidates, key=lambda i: self._score(query_terms, i), reverse=True)
+            selected, used = [], 0
+            for i in ranked[:top_k]:
+                tokens = estimate_tokens(self.chunks[i]["text"])
+                if used + tokens > max_tokens:
+                    continue
+                selected.append(i)
+                used += tokens
+
+        return [self.chunks[i] for i in sorted(selected)]
+
+
+if __name__ == "__main__":
+    import sys
+    index = KnowledgeIndex.build(chunk_tokens=int(sys.argv[1]) if len(sys.argv) > 1 else 300)
+    index.save()
+    print(f"Indexed {len(index.chunks)} chunks from {len(list_documents())} documents -> {INDEX_PATH}")
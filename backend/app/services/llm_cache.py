@@ -0,0 +1,198 @@
+# /backend/app/services/llm_cache.py
+"""
+Response cache for deterministic LLM calls (opt-in per call site).
+
+Two tiers:
+- in-memory LRU, bounded by entry count and total bytes
+- Postgres (llm_response_cache table), bounded by row count, shared across
+  workers and restarts
+
+Entries expire after the TTL chosen by the call site. Keys cover the
+requested provider and model, the normalized messages and the sampling
+params, so any change in the prompt is a miss. The provider that actually
+answered (after a failover) is recorded on the row.
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import select, delete, func
+from sqlalchemy.dialects.postgresql import insert
+
+from app.config import get_settings
+from app.database import AsyncSessionLocal
+from app.models.llm_response_cache import LLMResponseCache
+
+settings = get_settings()
+
+# key -> (expires_at monotonic, response, latency_seconds)
+_memory: "OrderedDict[str, Tuple[float, str, float]]" = OrderedDict()
+_memory_bytes = 0
+
+# Inserts since the last persistent-tier trim
+_writes_since_trim = 0
+
+metrics = {
+    "memory_hits": 0,
+    "db_hits": 0,
+    "misses": 0,
+    "stores": 0,
+    "evictions": 0,
+    "saved_seconds": 0.0
+}
+
+
+def snapshot() -> Dict[str, Any]:
+    """Metrics plus derived hit ratio and memory tier size (exposed on /health)"""
+    hits = metrics["memory_hits"] + metrics["db_hits"]
+    lookups = hits + metrics["misses"]
+    return {
+        **metrics,
+        "saved_seconds": round(metrics["saved_seconds"], 2),
+        "hit_ratio": round(hits / lookups, 3) if lookups else 0.0,
+        "memory_entries": len(_memory),
+        "memory_bytes": _memory_bytes
+    }
+
+
+def make_key(
+    provider: str,
+    model: str,
+    messages: List[Dict[str, str]],
+    temperature: float,
+    max_tokens: Optional[int]
+) -> str:
+    """Cache key: sha256 of the canonical request (whitespace-normalized messages)"""
+    normalized = [
+        {"role": m.get("role"), "content": " ".join((m.get("content") or "").split())}
+        for m in messages
+    ]
+    payload = json.dumps(
+        {"p": provider, "m": model, "msgs": normalized, "t": temperature, "mt": max_tokens},
+        sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _size(response: str) -> int:
+    return len(response.encode("utf-8"))
+
+
+def _memory_put(key: str, expires_at: float, response: str, latency: float) -> None:
+    global _memory_bytes
+    size = _size(response)
+    if size > settings.llm_cache_memory_max_bytes:
+        return
+    if key in _memory:
+        _memory_bytes -= _size(_memory.pop(key)[1])
+    _memory[key] = (expires_at, response, latency)
+    _memory_bytes += size
+
+    # Size-based eviction, least recently used first
+    while len(_memory) > settings.llm_cache_memory_max_entries or _memory_bytes > settings.llm_cache_memory_max_bytes:
+        _, (_, evicted, _) = _memory.popitem(last=False)
+        _memory_bytes -= _size(evicted)
+        metrics["evictions"] += 1
+
+
+def _memory_get(key: str) -> Optional[Tuple[str, float]]:
+    global _memory_bytes
+    entry = _memory.get(key)
+    if entry is None:
+        return None
+    expires_at, response, latency = entry
+    if expires_at <= time.monotonic():
+        del _memory[key]
+        _memory_bytes -= _size(response)
+        return None
+    _memory.move_to_end(key)
+    return response, latency
+
+
+async def get(key: str) -> Optional[str]:
+    """Cached response for the key, or None (counts as a miss)"""
+    cached = _memory_get(key)
+    if cached:
+        metrics["memory_hits"] += 1
+        metrics["saved_seconds"] += cached[1]
+        return cached[0]
+
+    if settings.llm_cache_db_enabled:
+        try:
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(
+                    select(LLMResponseCache).where(
+                        LLMResponseCache.key == key,
+                        LLMResponseCache.expires_at > datetime.utcnow()
+                    )
+                )
+                row = result.scalar_one_or_none()
+            if row:
+                metrics["db_hits"] += 1
+                metrics["saved_seconds"] += row.latency_seconds
+                remaining = (row.expires_at - datetime.utcnow()).total_seconds()
+                _memory_put(key, time.monotonic() + remaining, row.response, row.latency_seconds)
+                return row.response
+        except Exception as e:
+            print(f"LLM cache lookup failed: {str(e)}")
+
+    metrics["misses"] += 1
+    return None
+
+
+async def put(
+    key: str,
+    provider: str,
+    model: str,
+    response: str,
+    ttl_seconds: float,
+    latency_seconds: float
+) -> None:
+    """Store a response in both tiers"""
+    global _writes_since_trim
+    if not response:
+        return
+    _memory_put(key, time.monotonic() + ttl_seconds, response, latency_seconds)
+    metrics["stores"] += 1
+
+    if not settings.llm_cache_db_enabled:
+        return
+    try:
+        now = datetime.utcnow()
+        values = {
+            "key": key,
+            "provider": provider,
+            "model": model,
+            "response": response,
+            "size_bytes": _size(response),
+            "latency_seconds": latency_seconds,
+            "created_at": now,
+            "expires_at": now + timedelta(seconds=ttl_seconds)
+        }
+        async with AsyncSessionLocal() as db:
+            stmt = insert(LLMResponseCache).values(**values)
+            await db.execute(stmt.on_conflict_do_update(
+                index_elements=[LLMResponseCache.key],
+                set_={k: v for k, v in values.items() if k != "key"}
+            ))
+            _writes_since_trim += 1
+            if _writes_since_trim >= 100:
+                await _trim(db)
+                _writes_since_trim = 0
+            await db.commit()
+    except Exception as e:
+        print(f"LLM cache store failed: {str(e)}")
+
+
+async def _trim(db) -> None:
+    """Drop expired rows and keep at most llm_cache_db_max_rows (oldest first)"""
+    await db.execute(delete(LLMResponseCache).where(LLMResponseCache.expires_at <= datetime.utcnow()))
+    count = (await db.execute(select(func.count()).select_from(LLMResponseCache))).scalar_one()
+    overflow = count - settings.llm_cache_db_max_rows
+    if overflow > 0:
+        oldest = select(LLMResponseCache.key).order_by(LLMResponseCache.created_at).limit(overflow)
+        await db.execute(delete(LLMResponseCache).where(LLMResponseCache.key.in_(oldest)))
+        metrics["evictions"] += overflow
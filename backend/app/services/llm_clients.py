@@ -0,0 +1,114 @@
+# /backend/app/services/llm_clients.py
+"""
+Registry of long-lived LLM provider clients.
+
+Owned by the FastAPI lifespan: start() creates the pooled HTTP clients and
+close() releases them on shutdown. Provider services ask the registry for
+clients instead of building their own, so connections (and Gemini model
+objects) are reused across calls.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import google.generativeai as genai
+import httpx
+from openai import AsyncOpenAI
+
+from app.config import get_settings
+
+settings = get_settings()
+
+
+def _limits(max_connections: int, max_keepalive: int, keepalive_expiry: float) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive,
+        keepalive_expiry=keepalive_expiry
+    )
+
+
+class LLMClientRegistry:
+    """Pooled provider clients, keyed per (provider, model, system prompt hash) where relevant"""
+
+    def __init__(self):
+        self._openai: Optional[AsyncOpenAI] = None
+        self._perplexity: Optional[httpx.AsyncClient] = None
+        # (model, system prompt hash) -> GenerativeModel, LRU-bounded
+        self._gemini_models: "OrderedDict[Tuple[str, str], genai.GenerativeModel]" = OrderedDict()
+        self.stats = {"gemini_models_created": 0, "gemini_models_reused": 0}
+
+    def openai(self) -> AsyncOpenAI:
+        """Shared OpenAI client over a pooled HTTP/1.1 connection pool"""
+        if self._openai is None or self._openai.is_closed():
+            self._openai = AsyncOpenAI(
+                api_key=settings.openai_api_key,
+                http_client=httpx.AsyncClient(
+                    limits=_limits(
+                        settings.openai_max_connections,
+                        settings.openai_max_keepalive_connections,
+                        settings.openai_keepalive_expiry
+                    ),
+                    timeout=httpx.Timeout(settings.openai_timeout, connect=settings.openai_connect_timeout)
+                )
+            )
+        return self._openai
+
+    def perplexity(self) -> httpx.AsyncClient:
+        """Shared Perplexity HTTP client"""
+        if self._perplexity is None or self._perplexity.is_closed:
+            self._perplexity = httpx.AsyncClient(
+                http2=settings.perplexity_http2,
+                limits=_limits(
+                    settings.perplexity_max_connections,
+                    settings.perplexity_max_keepalive_connections,
+                    settings.perplexity_keepalive_expiry
+                ),
+                timeout=httpx.Timeout(
+                    settings.perplexity_timeout,
+                    connect=settings.perplexity_connect_timeout
+                )
+            )
+        return self._perplexity
+
+    def gemini_model(self, model: str, system_instruction: str) -> genai.GenerativeModel:
+        """GenerativeModel for a model and system prompt, reused while it stays in the LRU"""
+        key = (model, hashlib.sha256(system_instruction.encode("utf-8")).hexdigest())
+        instance = self._gemini_models.get(key)
+        if instance is not None:
+            self._gemini_models.move_to_end(key)
+            self.stats["gemini_models_reused"] += 1
+            return instance
+
+        instance = genai.GenerativeModel(
+            model_name=model,
+            system_instruction=system_instruction or None
+        )
+        self._gemini_models[key] = instance
+        self.stats["gemini_models_created"] += 1
+        while len(self._gemini_models) > settings.gemini_model_cache_size:
+            self._gemini_models.popitem(last=False)
+        return instance
+
+    async def start(self) -> None:
+        """Create the clients of every configured provider (app startup)"""
+        if settings.google_ai_api_key:
+            genai.configure(api_key=settings.google_ai_api_key)
+        if settings.openai_api_key and "your-openai" not in settings.openai_api_key:
+            self.openai()
+        if settings.perplexity_api_key and "your-perplexity" not in settings.perplexity_api_key:
+            self.perplexity()
+
+    async def close(self) -> None:
+        """Close pooled connections (app shutdown)"""
+        if self._openai is not None:
+            await self._openai.close()
+            self._openai = None
+        if self._perplexity is not None:
+            await self._perplexity.aclose()
+            self._perplexity = None
+        self._gemini_models.clear()
+
+
+registry = LLMClientRegistry()
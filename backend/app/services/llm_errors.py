@@ -0,0 +1,81 @@
+# /backend/app/services/llm_errors.py
+"""
+Classified LLM provider errors.
+
+Provider services raise these instead of bare Exceptions so the resilience
+layer in ai_provider_service can decide whether to retry, fail over or give
+up, and routers can answer with a meaningful status code.
+"""
+
+from typing import Optional
+
+
+class LLMError(Exception):
+    """Base class for provider errors"""
+    retryable = False
+
+    def __init__(self, message: str, provider: Optional[str] = None):
+        super().__init__(message)
+        self.provider = provider
+
+
+class LLMRateLimitError(LLMError):
+    """429 / quota exhausted"""
+    retryable = True
+
+
+class LLMTimeoutError(LLMError):
+    """Request or connection timed out"""
+    retryable = True
+
+
+class LLMDeadlineError(LLMTimeoutError):
+    """The request's deadline passed before a provider answered (no time left to retry)"""
+    retryable = False
+
+
+class LLMServerError(LLMError):
+    """5xx, overloaded or connection failure"""
+    retryable = True
+
+
+class LLMContentError(LLMError):
+    """Prompt or response blocked by the provider's safety filters"""
+
+
+class LLMClientError(LLMError):
+    """Invalid request, auth or permission error (won't succeed on retry)"""
+
+
+class LLMUnavailableError(LLMError):
+    """Every provider failed or was skipped (open circuit, budget exhausted)"""
+
+
+def classify(error: BaseException, provider: str) -> LLMError:
+    """Map an SDK/HTTP exception to an LLMError subclass"""
+    if isinstance(error, LLMError):
+        return error
+
+    message = f"{provider} API error: {str(error)}"
+    name = type(error).__name__.lower()
+    text = str(error).lower()
+    status = (
+        getattr(error, "status_code", None)
+        or getattr(error, "code", None)
+        or getattr(getattr(error, "response", None), "status_code", None)
+    )
+    if not isinstance(status, int):
+        status = None
+
+    if status == 429 or "ratelimit" in name or "resourceexhausted" in name or "rate limit" in text or "quota" in text:
+        return LLMRateLimitError(message, provider)
+    if "timeout" in name or "deadlineexceeded" in name or "timed out" in text:
+        return LLMTimeoutError(message, provider)
+    if "blocked" in name or "stopcandidate" in name or "content_filter" in text or "safety" in text:
+        return LLMContentError(message, provider)
+    if (status and status >= 500) or any(k in name for k in ("internalserver", "serviceunavailable", "connection", "servererror")):
+        return LLMServerError(message, provider)
+    if (status and 400 <= status < 500) or any(k in name for k in ("badrequest", "authentication", "permissiondenied", "invalidargument", "notfound")):
+        return LLMClientError(message, provider)
+    # Unknown errors are treated as transient server errors
+    return LLMServerError(message, provider)
@@ -0,0 +1,222 @@
+# /backend/app/services/llm_limiter.py
+"""
+Per-provider admission control for LLM calls.
+
+Each provider gets:
+- token buckets for requests per minute and (estimated) tokens per minute
+- an adaptive concurrency limit (AIMD): +1/limit per fast success, halved
+  on a rate-limit error or a slow response
+- a priority queue: waiting calls are admitted interactive chat first, then
+  background validation, then demo and research
+
+The priority of a call comes from the `priority` argument or, if omitted,
+from the current context (see priority_scope), so background jobs and the
+demo can lower the priority of every LLM call they make.
+"""
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, List, Optional, Tuple
+
+from app.config import get_settings
+from app.services.llm_errors import LLMRateLimitError
+
+settings = get_settings()
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+PRIORITY_DEMO = 2
+PRIORITY_RESEARCH = 2
+
+PRIORITY_NAMES = {
+    PRIORITY_INTERACTIVE: "interactive",
+    PRIORITY_BACKGROUND: "background",
+    PRIORITY_DEMO: "demo_research"
+}
+
+current_priority: contextvars.ContextVar[int] = contextvars.ContextVar("llm_priority", default=PRIORITY_INTERACTIVE)
+
+
+@contextmanager
+def priority_scope(priority: int):
+    """Run the enclosed LLM calls at the given priority"""
+    token = current_priority.set(priority)
+    try:
+        yield
+    finally:
+        current_priority.reset(token)
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Provider 429 / quota errors (classified, or detected from the message)"""
+    if isinstance(error, LLMRateLimitError):
+        return True
+    text = str(error).lower()
+    return any(marker in text for marker in ("429", "rate limit", "rate_limit", "resourceexhausted", "resource exhausted", "quota"))
+
+
+class TokenBucket:
+    """Refills `rate_per_minute` units per minute up to one minute of capacity"""
+
+    def __init__(self, rate_per_minute: float):
+        self.capacity = rate_per_minute
+        self.tokens = rate_per_minute
+        self.rate = rate_per_minute / 60.0
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until `amount` is available (0 if it is now)"""
+        self._refill()
+        amount = min(amount, self.capacity)  # Oversized requests wait for a full bucket
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def take(self, amount: float) -> None:
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+
+
+class ProviderLimiter:
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int,
+        requests_per_minute: float,
+        tokens_per_minute: float
+    ):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.limit = float(max_concurrency)
+        self.in_flight = 0
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self._waiters: List[Tuple[int, int, asyncio.Future, float]] = []  # (priority, seq, future, tokens)
+        self._seq = itertools.count()
+        self._wakeup: Optional[asyncio.TimerHandle] = None
+        self.stats = {"admitted": 0, "rate_limited": 0, "slow": 0, "decreases": 0}
+
+    def queue_depth(self) -> Dict[str, int]:
+        depth = {name: 0 for name in PRIORITY_NAMES.values()}
+        for priority, _, future, _ in self._waiters:
+            if not future.done():
+                depth[PRIORITY_NAMES.get(priority, "demo_research")] += 1
+        return depth
+
+    def snapshot(self) -> Dict[str, object]:
+        return {
+            "limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth(),
+            **self.stats
+        }
+
+    def _dispatch(self) -> None:
+        """Admit waiters in priority order while concurrency and both buckets allow"""
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+
+        while self._waiters:
+            priority, seq, future, tokens = self._waiters[0]
+            if future.done():  # Cancelled while waiting
+                heapq.heappop(self._waiters)
+                continue
+            if self.in_flight >= int(self.limit):
+                return
+            wait = max(self.requests.wait_time(1), self.tokens.wait_time(tokens))
+            if wait > 0:
+                # Head of the queue waits for the buckets; lower priorities wait behind it
+                self._wakeup = asyncio.get_running_loop().call_later(wait, self._dispatch)
+                return
+            heapq.heappop(self._waiters)
+            self.requests.take(1)
+            self.tokens.take(tokens)
+            self.in_flight += 1
+            self.stats["admitted"] += 1
+            future.set_result(None)
+
+    async def acquire(self, priority: int, tokens: float) -> None:
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future, tokens))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Admitted right as we were cancelled: give the slot back
+                self.release()
+            raise
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._dispatch()
+
+    def on_success(self, latency: float) -> None:
+        """AIMD: additive increase on fast responses, multiplicative decrease on slow ones"""
+        if latency > settings.llm_slow_response_seconds:
+            self.stats["slow"] += 1
+            self._decrease()
+        else:
+            self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+        self._dispatch()
+
+    def on_rate_limited(self) -> None:
+        self.stats["rate_limited"] += 1
+        self._decrease()
+
+    def _decrease(self) -> None:
+        self.limit = max(1.0, self.limit / 2)
+        self.stats["decreases"] += 1
+
+
+_limiters: Dict[str, ProviderLimiter] = {}
+
+
+def get_limiter(provider: str) -> ProviderLimiter:
+    limiter = _limiters.get(provider)
+    if limiter is None:
+        if provider == "gemini":
+            limiter = ProviderLimiter("gemini", settings.gemini_max_concurrency, settings.gemini_rpm, settings.gemini_tpm)
+        else:
+            limiter = ProviderLimiter(provider, settings.openai_max_concurrency, settings.openai_rpm, settings.openai_tpm)
+        _limiters[provider] = limiter
+    return limiter
+
+
+def snapshot() -> Dict[str, Dict[str, object]]:
+    """Limiter state per provider (exposed on /health)"""
+    return {name: limiter.snapshot() for name, limiter in _limiters.items()}
+
+
+@asynccontextmanager
+async def limit(provider: str, tokens: float, priority: Optional[int] = None, track_latency: bool = True):
+    """
+    Hold a provider slot for the enclosed call.
+
+    Rate-limit errors raised inside the block, and its latency unless
+    track_latency is False (streams last as long as the reply), feed the
+    AIMD controller.
+    """
+    limiter = get_limiter(provider)
+    await limiter.acquire(current_priority.get() if priority is None else priority, tokens)
+    started = time.monotonic()
+    try:
+        yield
+    except Exception as e:
+        if is_rate_limit_error(e):
+            limiter.on_rate_limited()
+        raise
+    else:
+        limiter.on_success(time.monotonic() - started if track_latency else 0.0)
+    finally:
+        limiter.release()
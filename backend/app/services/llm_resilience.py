@@ -0,0 +1,96 @@
+# /backend/app/services/llm_resilience.py
+"""
+Retry and circuit-breaker primitives used by ai_provider_service.
+
+- backoff_delay: exponential backoff with full jitter
+- CircuitBreaker: opens after consecutive transient failures of a provider,
+  lets a single trial call through after the cooldown (half-open) and closes
+  again on success
+"""
+
+import random
+import time
+from typing import Dict
+
+from app.config import get_settings
+
+settings = get_settings()
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def backoff_delay(attempt: int) -> float:
+    """Full-jitter backoff: uniform(0, min(cap, base * 2^attempt))"""
+    return random.uniform(0, min(settings.llm_retry_max_delay, settings.llm_retry_base_delay * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    def __init__(self, name: str, failure_threshold: int, cooldown_seconds: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+        self.stats = {"opened": 0, "short_circuited": 0}
+
+    def is_open(self) -> bool:
+        """Open and still cooling down (no side effects)"""
+        return self.state == OPEN and time.monotonic() - self.opened_at < self.cooldown_seconds
+
+    def allow(self) -> bool:
+        """Whether a call may go through now (moves open -> half-open after the cooldown)"""
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN:
+            if time.monotonic() - self.opened_at < self.cooldown_seconds:
+                self.stats["short_circuited"] += 1
+                return False
+            self.state = HALF_OPEN
+            self._trial_in_flight = False
+        # Half-open: a single trial call at a time
+        if self._trial_in_flight:
+            self.stats["short_circuited"] += 1
+            return False
+        self._trial_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self._trial_in_flight = False
+        self.failures += 1
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != OPEN:
+                self.stats["opened"] += 1
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+
+    def record_neutral(self) -> None:
+        """Non-transient error (content/client): says nothing about provider health"""
+        self._trial_in_flight = False
+
+    def snapshot(self) -> Dict[str, object]:
+        return {"state": self.state, "failures": self.failures, **self.stats}
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(provider: str) -> CircuitBreaker:
+    breaker = _breakers.get(provider)
+    if breaker is None:
+        breaker = CircuitBreaker(provider, settings.llm_breaker_failure_threshold, settings.llm_breaker_cooldown_seconds)
+        _breakers[provider] = breaker
+    return breaker
+
+
+def snapshot() -> Dict[str, Dict[str, object]]:
+    """Breaker state per provider (exposed on /health)"""
+    return {name: breaker.snapshot() for name, breaker in _breakers.items()}
@@ -0,0 +1,39 @@
+# /backend/app/services/llm_usage.py
+"""
+Token usage reported by the providers, collected per caller.
+
+Provider services call record() with the counts from the API response
+(OpenAI usage, Gemini usage_metadata). A caller that needs the real numbers
+wraps its LLM calls in track(); calls outside a scope aren't collected.
+Cache hits and responses without usage leave the counts at None, so the
+caller falls back to its own estimate.
+"""
+
+import contextvars
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+_current: contextvars.ContextVar[Optional[Dict[str, Optional[int]]]] = contextvars.ContextVar(
+    "llm_usage", default=None
+)
+
+
+@contextmanager
+def track() -> Iterator[Dict[str, Optional[int]]]:
+    """Collect the usage of the enclosed LLM calls (summed when there are several)"""
+    usage: Dict[str, Optional[int]] = {"prompt_tokens": None, "completion_tokens": None}
+    token = _current.set(usage)
+    try:
+        yield usage
+    finally:
+        _current.reset(token)
+
+
+def record(prompt_tokens: Optional[int], completion_tokens: Optional[int]) -> None:
+    """Add a provider response's counts to the current scope, if any"""
+    usage = _current.get()
+    if usage is None:
+        return
+    for key, value in (("prompt_tokens", prompt_tokens), ("completion_tokens", completion_tokens)):
+        if value is not None:
+            usage[key] = (usage[key] or 0) + value
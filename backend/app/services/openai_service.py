@@ -1,19 +1,21 @@
 # /backend/app/services/openai_service.py
 
-from openai import AsyncOpenAI
+from typing import AsyncIterator
+from openai import NOT_GIVEN
 from app.config import get_settings
+from app.services import llm_usage
+from app.services.llm_clients import registry
+from app.services.llm_errors import classify
 
 settings = get_settings()
 
-# Initialize OpenAI client
-client = AsyncOpenAI(api_key=settings.openai_api_key)
-
 
 async def chat_completion(
     messages: list[dict[str, str]],
     model: str = "gpt-4o",
     temperature: float = 0.7,
-    max_tokens: int | None = None
+    max_tokens: int | None = None,
+    timeout: float | None = None
 ) -> str:
     """
     Send a chat completion request to OpenAI
@@ -23,19 +25,55 @@ async def chat_completion(
         model: Model to use (default: gpt-4o)
         temperature: Sampling temperature (0-2)
         max_tokens: Maximum tokens in response
+        timeout: Seconds for this request (default: the client's timeout)
 
     Returns:
         The assistant's response content
     """
     try:
-        response = await client.chat.completions.create(
+        response = await registry.openai().chat.completions.create(
             model=model,
             messages=messages,
             temperature=temperature,
-            max_tokens=max_tokens
+            max_tokens=max_tokens,
+            timeout=timeout if timeout is not None else NOT_GIVEN
         )
 
+        if response.usage:
+            llm_usage.record(response.usage.prompt_tokens, response.usage.completion_tokens)
         return response.choices[0].message.content
 
     except Exception as e:
-        raise Exception(f"OpenAI API error: {str(e)}")
+        raise classify(e, "openai") from e
+
+
+async def chat_completion_stream(
+    messages: list[dict[str, str]],
+    model: str = "gpt-4o",
+    temperature: float = 0.7,
+    max_tokens: int | None = None,
+    timeout: float | None = None
+) -> AsyncIterator[str]:
+    """
+    Stream a chat completion from OpenAI, yielding text deltas as they arrive
+    """
+    try:
+        stream = await registry.openai().chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+            timeout=timeout if timeout is not None else NOT_GIVEN
+        )
+
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            # Release the connection when the consumer stops early (cancelled, deadline)
+            await stream.close()
+
+    except Exception as e:
+        raise classify(e, "openai") from e
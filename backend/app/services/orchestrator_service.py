@@ -1,11 +1,25 @@
 from enum import Enum
-from typing import Dict, List, Any, Optional
-from pydantic import BaseModel
+from typing import Dict, List, Any, Optional, Type
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+import hashlib
 import json
 import os
 from datetime import datetime
 
+from app.services import llm_usage
 from app.services.ai_provider_service import chat_completion
+from app.services.history_service import estimate_tokens
+from app.config import get_settings
+
+settings = get_settings()
+
+PROMPT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "prompts", "orchestrator-system.txt")
+FALLBACK_PROMPT = "Eres un asistente de control de calidad. Valida el output. Responde en JSON."
+
+
+def canonical_json(data: Any) -> str:
+    """Compact, deterministic JSON (sorted keys, no whitespace, UTF-8 kept) to minimize prompt tokens"""
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
 
 class ValidationIssue(BaseModel):
     type: str  # "error" | "warning"
@@ -32,6 +46,190 @@ class OrchestratorValidationResult(BaseModel):
     validationDetails: Dict[str, Any]
     metadata: Dict[str, Any]
 
+# --- Per-stage output models (rule-based pre-validation) ---
+# Only what the agent prompts require is enforced; extra fields are allowed.
+
+class _StageOutput(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+class ScalingUpCriterion(_StageOutput):
+    name: str = Field(..., min_length=1)
+    superGreen: str = ""
+    green: str = ""
+    yellow: str = ""
+    red: str = ""
+    notEligible: str = ""
+
+class ScalingUpTable(_StageOutput):
+    criteria: List[ScalingUpCriterion] = Field(..., min_length=1)
+
+class BuyerPersona(_StageOutput):
+    name: str = ""
+    narrative: str = Field(..., min_length=1)
+    demographics: str = ""
+    goals: List[str] = []
+    challenges: List[str] = []
+
+class Agent1Output(_StageOutput):
+    buyerPersona: BuyerPersona
+    scalingUpTable: ScalingUpTable
+
+class Agent2Output(_StageOutput):
+    narrative: str = Field(..., min_length=1)
+    markdown_table: str = ""
+    csv_block: str = ""
+    hubspot_props: List[Any] = []
+
+class ValueEquation(_StageOutput):
+    dream_outcome: str = ""
+    perceived_likelihood: str = ""
+    time_delay: str = ""
+    effort_sacrifice: str = ""
+
+class StoryBrand(_StageOutput):
+    character: str = ""
+    problem: str = ""
+    guide: str = ""
+    plan: str = ""
+    call_to_action: str = ""
+    success: str = ""
+    failure: str = ""
+
+class OfferStack(_StageOutput):
+    core_offer: str = Field(..., min_length=1)
+    bonuses: List[str] = []
+    guarantees: List[str] = []
+    scarcity_urgency: str = ""
+    naming: str = ""
+
+class Agent3Output(_StageOutput):
+    value_equation: ValueEquation
+    storybrand: StoryBrand
+    offer_stack: OfferStack
+
+# Stages 4-7 have no fixed output schema in their prompts: any non-empty object
+class Agent4Output(_StageOutput):
+    pass
+
+class Agent5Output(_StageOutput):
+    pass
+
+class Agent6Output(_StageOutput):
+    pass
+
+class Agent7Output(_StageOutput):
+    pass
+
+STAGE_OUTPUT_MODELS: Dict[int, Type[_StageOutput]] = {
+    1: Agent1Output,
+    2: Agent2Output,
+    3: Agent3Output,
+    4: Agent4Output,
+    5: Agent5Output,
+    6: Agent6Output,
+    7: Agent7Output
+}
+
+# Minimum share of filled leaf fields; below it the output is rejected without the LLM
+MIN_COMPLETENESS = 0.5
+
+# How many validations the rules rejected (LLM calls saved) vs escalated to the LLM
+rule_stats = {"rule_rejected": 0, "escalated": 0}
+
+
+def _leaf_values(data: Any, path: str = "") -> List[tuple]:
+    """(path, value) for every leaf of a JSON document"""
+    if isinstance(data, dict) and data:
+        return [leaf for k, v in data.items() for leaf in _leaf_values(v, f"{path}.{k}" if path else k)]
+    if isinstance(data, list) and data and any(isinstance(v, (dict, list)) for v in data):
+        return [leaf for i, v in enumerate(data) for leaf in _leaf_values(v, f"{path}[{i}]")]
+    return [(path, data)]
+
+
+def _is_empty(value: Any) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, str):
+        return not value.strip() or value.strip() == "..."
+    if isinstance(value, (list, dict)):
+        return len(value) == 0
+    return False
+
+
+def _rule_rejection(
+    score: float,
+    issues: List[ValidationIssue],
+    checks: List[str],
+    reasoning: str,
+    stage_number: int
+) -> OrchestratorValidationResult:
+    return OrchestratorValidationResult(
+        approved=False,
+        canProceed=False,
+        qualityScore=score,
+        coherenceScore=score,
+        overallScore=score,
+        issues=issues,
+        suggestions=[],
+        validationDetails={"engine": "rules", "checks": checks, "reasoning": reasoning},
+        metadata={
+            "stageValidated": stage_number,
+            "modelUsed": "rules",
+            "validatedAt": datetime.utcnow().isoformat() + "Z",
+            "promptTokens": 0,
+            "completionTokens": 0
+        }
+    )
+
+
+def pre_validate(stage_number: int, stage_output: Any) -> Optional[OrchestratorValidationResult]:
+    """
+    Reject trivially invalid outputs without calling the LLM.
+
+    Rejects outputs that are missing, fail the stage schema or are mostly
+    empty. Never approves: judging quality and coherence is the LLM's job.
+    Returns None when the case needs the LLM.
+    """
+    checks = ["schema", "completeness"]
+
+    if not isinstance(stage_output, dict) or not stage_output:
+        return _rule_rejection(0.0, [ValidationIssue(
+            type="error", severity="high", category="completeness",
+            message="El agente no generó un output final.",
+            suggestion="Continúa la conversación hasta que el agente genere el entregable completo."
+        )], checks, "Output vacío", stage_number)
+
+    model = STAGE_OUTPUT_MODELS.get(stage_number)
+    if model:
+        try:
+            model.model_validate(stage_output)
+        except ValidationError as e:
+            issues = [ValidationIssue(
+                type="error", severity="high", category="completeness",
+                field=".".join(str(part) for part in err["loc"]),
+                message=f"Campo obligatorio inválido o faltante: {err['msg']}",
+                suggestion="Pide al agente que complete este campo antes de finalizar."
+            ) for err in e.errors()]
+            return _rule_rejection(0.0, issues, checks, "El output no cumple el esquema del stage", stage_number)
+
+    leaves = _leaf_values(stage_output)
+    empty = [path for path, value in leaves if _is_empty(value)]
+    completeness = 1 - len(empty) / len(leaves) if leaves else 0.0
+
+    if completeness < MIN_COMPLETENESS:
+        issues = [ValidationIssue(
+            type="error", severity="medium", category="completeness", field=path,
+            message="Campo vacío.",
+            suggestion="Completa este campo con información específica del cliente."
+        ) for path in empty[:20]]
+        return _rule_rejection(
+            round(completeness * 10, 1), issues, checks,
+            f"Solo {completeness:.0%} de los campos tienen contenido", stage_number
+        )
+
+    return None
+
+
 class OrchestratorMode(str, Enum):
     TRANSITION_VALIDATOR = "transition"
     CONTINUOUS_SUPERVISOR = "continuous"
@@ -42,19 +240,55 @@ class OrchestratorService:
         mode: OrchestratorMode = OrchestratorMode.TRANSITION_VALIDATOR
     ):
         self.mode = mode
-        self.system_prompt = self._load_system_prompt()
+        self._prompt_mtime: Optional[float] = None
+        self._prompt: Optional[str] = None
+
+    @property
+    def system_prompt(self) -> str:
+        """System prompt, cached and reloaded only when the file changes on disk"""
+        try:
+            mtime = os.path.getmtime(PROMPT_PATH)
+        except OSError:
+            return self._prompt or FALLBACK_PROMPT
+        if self._prompt is None or mtime != self._prompt_mtime:
+            self._prompt = self._load_system_prompt()
+            self._prompt_mtime = mtime
+        return self._prompt
 
     def _load_system_prompt(self) -> str:
         """Cargar prompt del sistema desde archivo"""
         try:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            # Go up one level to app/ then prompts/
-            prompt_path = os.path.join(current_dir, "..", "prompts", "orchestrator-system.txt")
-            with open(prompt_path, "r") as f:
+            with open(PROMPT_PATH, "r") as f:
                 return f.read()
         except FileNotFoundError:
             # Fallback if file not found
-            return "Eres un asistente de control de calidad. Valida el output. Responde en JSON."
+            return FALLBACK_PROMPT
+
+    @property
+    def prompt_version(self) -> str:
+        """Short digest of the current system prompt (changes invalidate memoized verdicts)"""
+        return hashlib.sha256(self.system_prompt.encode("utf-8")).hexdigest()[:16]
+
+    def verdict_hash(
+        self,
+        account_id: str,
+        stage_number: int,
+        stage_output: Dict[str, Any],
+        previous_outputs: Dict[str, Any],
+        account_context: Dict[str, Any]
+    ) -> str:
+        """Content address of a validation: same inputs and prompt -> same verdict"""
+        previous_digest = hashlib.sha256(
+            canonical_json({k: v for k, v in previous_outputs.items() if v}).encode("utf-8")
+        ).hexdigest()
+        return hashlib.sha256(canonical_json({
+            "account": account_id,
+            "context": account_context,
+            "stage": stage_number,
+            "output": stage_output,
+            "previous": previous_digest,
+            "prompt": self.prompt_version
+        }).encode("utf-8")).hexdigest()
 
     def _get_agent_name(self, stage_number: int) -> str:
         """Mapear número de stage a nombre del agente"""
@@ -69,22 +303,15 @@ class OrchestratorService:
         }
         return agent_names.get(stage_number, f"Agent {stage_number}")
 
-    async def validate_stage_completion(
+    def build_payload(
         self,
-        account_id: str,
         stage_number: int,
         stage_output: Dict[str, Any],
         previous_outputs: Dict[str, Any],
         account_context: Dict[str, Any]
-    ) -> OrchestratorValidationResult:
-        """
-        Validar un stage completado.
-        """
-        if not self.system_prompt:
-             self.system_prompt = self._load_system_prompt()
-
-        # Construir payload para el orquestador
-        payload = {
+    ) -> Dict[str, Any]:
+        """Payload para el orquestador (stages sin output se omiten)"""
+        return {
             "task": "VALIDATE_STAGE_COMPLETION",
             "context": {
                 "account": account_context,
@@ -95,14 +322,47 @@ class OrchestratorService:
                 }
             },
             "inputToValidate": stage_output,
-            "previousStagesContext": previous_outputs
+            "previousStagesContext": {k: v for k, v in previous_outputs.items() if v}
         }
 
+    async def validate_stage_completion(
+        self,
+        account_id: str,
+        stage_number: int,
+        stage_output: Dict[str, Any],
+        previous_outputs: Dict[str, Any],
+        account_context: Dict[str, Any],
+        use_rules: bool = True,
+        fail_open: bool = True,
+        bypass_cache: bool = False
+    ) -> OrchestratorValidationResult:
+        """
+        Validar un stage completado.
+
+        Los casos triviales (output vacío, incompleto o que no cumple el
+        esquema del stage) se rechazan con reglas locales sin llamar al LLM.
+
+        Con fail_open=False un error del LLM se propaga en lugar de devolver
+        un veredicto aprobado con advertencia (validación en segundo plano).
+        Con bypass_cache=True no se usa la caché de respuestas del LLM
+        (re-validación forzada).
+        """
+        if use_rules:
+            verdict = pre_validate(stage_number, stage_output)
+            if verdict is not None:
+                rule_stats["rule_rejected"] += 1
+                return verdict
+            rule_stats["escalated"] += 1
+
+        payload = self.build_payload(stage_number, stage_output, previous_outputs, account_context)
+
         # Llamar al modelo de IA
         messages = [
             {"role": "system", "content": self.system_prompt},
-            {"role": "user", "content": json.dumps(payload, indent=2, default=str)}
+            {"role": "user", "content": canonical_json(payload)}
         ]
+        prompt_tokens = estimate_tokens(messages)
+        print(f"Orchestrator: validating stage {stage_number} (~{prompt_tokens} prompt tokens)")
 
         try:
             # Use JSON mode if possible, or just ask for JSON in prompt
@@ -111,11 +371,13 @@ class OrchestratorService:
             # Actually ai_provider_service signature is just (messages, model_override, temperature, max_tokens)
             # We rely on the prompt saying "RESPOND ALWAYS IN JSON"
             
-            content = await chat_completion(
-                messages=messages,
-                model_override="gpt-4o", # Prefer GPT-4o for reasoning
-                temperature=0.1 # Low temp for consistency
-            )
+            with llm_usage.track() as usage:
+                content = await chat_completion(
+                    messages=messages,
+                    model_override="gpt-4o", # Prefer GPT-4o for reasoning
+                    temperature=0.1, # Low temp for consistency
+                    cache_ttl=None if bypass_cache else settings.orchestrator_cache_ttl_seconds
+                )
             
             # Clean markdown code blocks if present
             cleaned_content = content.replace("```json", "").replace("```", "").strip()
@@ -138,12 +400,17 @@ class OrchestratorService:
             validation_data["metadata"] = {
                 "stageValidated": stage_number,
                 "modelUsed": "gpt-4o",
-                "validatedAt": datetime.utcnow().isoformat() + "Z"
+                "validatedAt": datetime.utcnow().isoformat() + "Z",
+                # Provider-reported usage; estimates for cache hits or when none was reported
+                "promptTokens": usage["prompt_tokens"] if usage["prompt_tokens"] is not None else prompt_tokens,
+                "completionTokens": usage["completion_tokens"] if usage["completion_tokens"] is not None else len(content) // 4
             }
             
             return OrchestratorValidationResult(**validation_data)
 
         except Exception as e:
+            if not fail_open:
+                raise
             # Fallback in case of AI error - don't block the user, but warn
             print(f"Orchestrator Error: {str(e)}")
             return OrchestratorValidationResult(
@@ -158,5 +425,16 @@ class OrchestratorService:
                 )],
                 suggestions=[],
                 validationDetails={"error": str(e)},
-                metadata={"error": True}
+                metadata={"error": True, "promptTokens": prompt_tokens}
             )
+
+
+# Process-wide instance (prompt cached across validations)
+_orchestrator: Optional[OrchestratorService] = None
+
+
+def get_orchestrator() -> OrchestratorService:
+    global _orchestrator
+    if _orchestrator is None:
+        _orchestrator = OrchestratorService()
+    return _orchestrator
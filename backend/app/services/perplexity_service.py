@@ -2,6 +2,8 @@
 
 import httpx
 from app.config import get_settings
+from app.services.llm_clients import registry
+from app.services.llm_errors import classify
 
 settings = get_settings()
 
@@ -28,27 +30,25 @@ async def chat_completion(
         raise Exception("Perplexity API key not configured")
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                PERPLEXITY_API_URL,
-                headers={
-                    "Authorization": f"Bearer {settings.perplexity_api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": model,
-                    "messages": messages,
-                    "temperature": temperature
-                },
-                timeout=60.0
-            )
-
-            response.raise_for_status()
-            data = response.json()
-
-            return data["choices"][0]["message"]["content"]
+        response = await registry.perplexity().post(
+            PERPLEXITY_API_URL,
+            headers={
+                "Authorization": f"Bearer {settings.perplexity_api_key}",
+                "Content-Type": "application/json"
+            },
+            json={
+                "model": model,
+                "messages": messages,
+                "temperature": temperature
+            }
+        )
+
+        response.raise_for_status()
+        data = response.json()
+
+        return data["choices"][0]["message"]["content"]
 
     except httpx.HTTPError as e:
-        raise Exception(f"Perplexity API error: {str(e)}")
+        raise classify(e, "perplexity") from e
     except Exception as e:
         raise Exception(f"Error calling Perplexity: {str(e)}")
@@ -0,0 +1,91 @@
+# /backend/app/services/principal_cache.py
+"""
+In-process cache of authenticated principals.
+
+get_current_user resolves the JWT subject to a User on every request; this
+keeps the user's columns (never the password hash) in a bounded LRU for a
+short TTL so hot endpoints (chat turns, stage and validation polls) skip the
+users lookup.
+
+Entries are dropped when a User row is updated or deleted through the ORM
+(see the mapper events below). Other workers/processes keep their copy
+until the TTL expires, so the TTL bounds how long a change can go unseen.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import event
+
+from app.config import get_settings
+from app.models.user import User
+
+settings = get_settings()
+
+# Columns kept per principal
+FIELDS = ("id", "email", "full_name", "created_at", "updated_at")
+
+# user id -> (expires_at monotonic, column values)
+_principals: "OrderedDict[UUID, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+metrics = {"hits": 0, "misses": 0, "invalidations": 0, "stateless": 0}
+
+
+def snapshot() -> Dict[str, Any]:
+    """Metrics plus hit ratio and size (exposed on /health)"""
+    lookups = metrics["hits"] + metrics["misses"]
+    return {
+        **metrics,
+        "hit_ratio": round(metrics["hits"] / lookups, 3) if lookups else 0.0,
+        "entries": len(_principals)
+    }
+
+
+def get(user_id: UUID) -> Optional[User]:
+    """Cached principal as a detached User (fresh instance per call), or None"""
+    entry = _principals.get(user_id)
+    if entry is None or entry[0] <= time.monotonic():
+        if entry is not None:
+            del _principals[user_id]
+        metrics["misses"] += 1
+        return None
+    _principals.move_to_end(user_id)
+    metrics["hits"] += 1
+    return User(**entry[1])
+
+
+def put(user: User) -> None:
+    if settings.auth_principal_cache_ttl_seconds <= 0:
+        return
+    _principals[user.id] = (
+        time.monotonic() + settings.auth_principal_cache_ttl_seconds,
+        {field: getattr(user, field) for field in FIELDS}
+    )
+    _principals.move_to_end(user.id)
+    while len(_principals) > settings.auth_principal_cache_max_entries:
+        _principals.popitem(last=False)
+
+
+def invalidate(user_id: UUID) -> None:
+    if _principals.pop(user_id, None) is not None:
+        metrics["invalidations"] += 1
+
+
+def from_claims(payload: Dict[str, Any], user_id: UUID) -> Optional[User]:
+    """
+    Stateless mode: build the principal from the signed token claims alone.
+
+    Returns None for tokens issued without the identity claims (they go
+    through the cache/database path).
+    """
+    if "email" not in payload:
+        return None
+    metrics["stateless"] += 1
+    return User(id=user_id, email=payload["email"], full_name=payload.get("name"))
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_on_change(mapper, connection, target: User) -> None:
+    invalidate(target.id)
@@ -1,31 +1,89 @@
 # /backend/app/services/rag_service.py
 
+import asyncio
 import os
-from typing import List, Dict
+import time
+from typing import Dict, List, Optional, Tuple
+from app.config import get_settings
+from app.services.knowledge_index import (
+    KnowledgeIndex, content_digest, document_stats, list_documents, read_documents
+)
+
+settings = get_settings()
 
 # Path to knowledge base
 KNOWLEDGE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "knowledge")
 
-async def get_knowledge_context(filenames: List[str]) -> str:
+# Chunked retrieval index: (last change check, document (mtime, size) stats, index)
+_index_cache: Optional[Tuple[float, Dict[str, Tuple[float, int]], KnowledgeIndex]] = None
+_index_lock = asyncio.Lock()
+
+
+def _load_or_build_index(
+    current: Optional[Tuple[Dict[str, Tuple[float, int]], KnowledgeIndex]]
+) -> Tuple[Dict[str, Tuple[float, int]], KnowledgeIndex]:
+    """
+    Reuse the current index if the documents didn't change, else load the saved one or rebuild.
+
+    Files are only read and hashed when their mtime or size changed; the
+    content digest then decides whether the index is still valid.
+    """
+    filenames = list_documents()
+    stats = document_stats(filenames)
+    if current and current[0] == stats:
+        return current
+
+    documents = read_documents(filenames)
+    digest = content_digest(documents)
+    if current and current[1].digest == digest:
+        return stats, current[1]  # Touched, not changed
+    index = KnowledgeIndex.load(settings.rag_chunk_tokens, digest=digest)
+    if index is None:
+        index = KnowledgeIndex.from_documents(documents, settings.rag_chunk_tokens)
+    return stats, index
+
+
+async def get_index() -> KnowledgeIndex:
     """
-    Retrieves the content of specific knowledge files to inject into the prompt.
-    For MVP, we simply read the full text files.
+    Chunked retrieval index. The knowledge base is stat-checked at most every
+    knowledge_refresh_seconds and the index rebuilt only when its content
+    changed; disk access runs in a worker thread.
     """
-    context_parts = []
-    
-    for filename in filenames:
-        file_path = os.path.join(KNOWLEDGE_DIR, filename)
-        if os.path.exists(file_path):
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                    context_parts.append(f"--- DOCUMENT: {filename} ---\n{content}\n")
-            except Exception as e:
-                print(f"Error reading {filename}: {e}")
-        else:
-            print(f"Knowledge file not found: {file_path}")
-            
-    return "\n".join(context_parts)
+    global _index_cache
+    now = time.monotonic()
+    if _index_cache and now - _index_cache[0] < settings.knowledge_refresh_seconds:
+        return _index_cache[2]
+
+    async with _index_lock:
+        if _index_cache and now - _index_cache[0] < settings.knowledge_refresh_seconds:
+            return _index_cache[2]
+        stats, index = await asyncio.to_thread(_load_or_build_index, _index_cache[1:] if _index_cache else None)
+        _index_cache = (time.monotonic(), stats, index)
+        return index
+
+
+async def retrieve_context(query: str, filenames: Optional[List[str]] = None) -> str:
+    """
+    Render the top-k knowledge chunks relevant to the query, within the
+    rag_max_context_tokens budget, as a prompt block.
+    """
+    index = await get_index()
+    chunks = index.search(
+        query,
+        documents=filenames,
+        top_k=settings.rag_top_k,
+        max_tokens=settings.rag_max_context_tokens
+    )
+    return "\n".join(
+        f"--- DOCUMENT: {c['document']} (fragment {c['position'] + 1}) ---\n{c['text']}\n"
+        for c in chunks
+    )
+
+
+async def warm_up() -> None:
+    """Load the retrieval index (called at startup)"""
+    await get_index()
+
 
 async def get_available_documents() -> List[str]:
     """List available documents in the knowledge base"""
@@ -0,0 +1,100 @@
+# /backend/app/services/research_jobs.py
+"""
+In-process background jobs for company research.
+
+Accounts enqueue their research when they are created; a small pool of
+workers (started in the app lifespan) runs it and merges the result into
+the Stage 1 state:
+
+    research_status: "pending" | "ready" | "failed"
+    research_data:   the research JSON (when ready)
+
+Jobs are deduplicated per account, so enqueueing again while a job is queued
+or running is a no-op.
+"""
+
+from typing import Any, Dict
+from uuid import UUID
+from sqlalchemy import select, update
+
+from app.config import get_settings
+from app.database import AsyncSessionLocal
+from app.models.account import Account
+from app.models.stage import Stage
+from app.services import llm_limiter, research_service
+from app.services.stage_message_service import merged_state
+from app.services.job_queue import JobQueue
+
+settings = get_settings()
+
+RESEARCH_PENDING = "pending"
+RESEARCH_READY = "ready"
+RESEARCH_FAILED = "failed"
+
+
+def enqueue(account_id: UUID) -> bool:
+    """Queue research for an account. Returns False if it is already queued/running or the queue is full"""
+    return _jobs.enqueue(account_id)
+
+
+def is_active(account_id: UUID) -> bool:
+    return _jobs.is_active(account_id)
+
+
+async def _merge_stage1_state(db, account_id: UUID, values: Dict[str, Any]) -> None:
+    """Merge keys into the Stage 1 state in SQL (jsonb ||) so concurrent writers keep their keys"""
+    await db.execute(
+        update(Stage)
+        .where(Stage.account_id == account_id, Stage.stage_number == 1)
+        .values(state=merged_state(values))
+    )
+
+
+async def _run(account_id: UUID) -> None:
+    with llm_limiter.priority_scope(llm_limiter.PRIORITY_RESEARCH):
+        await _research_account(account_id)
+
+
+async def _research_account(account_id: UUID) -> None:
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(Account.client_name, Account.company_website).where(Account.id == account_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return
+
+        client_name, company_website = row
+        try:
+            research_data = await research_service.get_company_research(db, client_name, company_website)
+            if research_data:
+                values = {"research_status": RESEARCH_READY, "research_data": research_data}
+            else:
+                # Nothing to confirm with the consultant: the greeting falls back to asking
+                print(f"Research job returned no data for account {account_id}")
+                values = {"research_status": RESEARCH_FAILED}
+        except Exception as e:
+            print(f"Research job failed for account {account_id}: {str(e)}")
+            await db.rollback()
+            values = {"research_status": RESEARCH_FAILED}
+
+        await _merge_stage1_state(db, account_id, values)
+        await db.commit()
+
+
+_jobs = JobQueue(
+    "Research",
+    _run,
+    workers=settings.research_workers,
+    maxsize=settings.research_queue_size
+)
+
+
+def start() -> None:
+    """Start the worker pool (app startup)"""
+    _jobs.start()
+
+
+async def stop() -> None:
+    """Cancel the workers (app shutdown); unfinished jobs are re-queued by /init on demand"""
+    await _jobs.stop()
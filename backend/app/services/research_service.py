@@ -1,16 +1,136 @@
 # /backend/app/services/research_service.py
 
+import asyncio
 import json
-from typing import Dict, Any, Optional
-from app.services import perplexity_service, ai_provider_service
+import re
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services import perplexity_service, ai_provider_service, llm_limiter
+from app.services.deadline import Deadline
+from app.services.llm_errors import LLMDeadlineError
+from app.models.company_research import CompanyResearch
 from app.config import get_settings
 
 settings = get_settings()
 
+# Research cache counters (exposed on /health)
+cache_metrics = {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "errors": 0}
+
+# Background refreshes in flight, keyed by cache key (one refresh per company at a time)
+_refresh_tasks: Dict[str, asyncio.Task] = {}
+
+
+def normalize_domain(website_url: Optional[str]) -> Optional[str]:
+    """'https://www.Example.com/about' -> 'example.com'"""
+    if not website_url:
+        return None
+    url = website_url.strip().lower()
+    if "://" not in url:
+        url = f"https://{url}"
+    host = urlparse(url).hostname or ""
+    if host.startswith("www."):
+        host = host[4:]
+    return host or None
+
+
+def cache_key(company_name: str, website_url: Optional[str] = None) -> str:
+    """Cache key: normalized domain plus normalized company name"""
+    name = re.sub(r"\s+", " ", company_name.strip().lower())
+    return f"{normalize_domain(website_url) or ''}|{name}"
+
+
+async def get_company_research(
+    db: AsyncSession,
+    company_name: str,
+    website_url: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Company research through the company_research cache.
+
+    - Fresh entry (younger than research_cache_ttl_hours): returned as is.
+    - Stale entry (within research_cache_stale_hours): returned immediately
+      while a background task refreshes it (stale-while-revalidate).
+    - Missing or expired: researched now and stored. Empty results are not cached.
+    """
+    key = cache_key(company_name, website_url)
+    result = await db.execute(select(CompanyResearch).where(CompanyResearch.cache_key == key))
+    entry = result.scalar_one_or_none()
+
+    if entry:
+        age = datetime.utcnow() - entry.fetched_at
+        if age < timedelta(hours=settings.research_cache_ttl_hours):
+            cache_metrics["hits"] += 1
+            return entry.data
+        if age < timedelta(hours=settings.research_cache_stale_hours):
+            cache_metrics["stale_hits"] += 1
+            _schedule_refresh(key, company_name, website_url)
+            return entry.data
+
+    cache_metrics["misses"] += 1
+    data = await research_company(company_name, website_url)
+    if data:
+        await _store(db, key, company_name, website_url, data)
+        await db.commit()
+    return data
+
+
+async def _store(
+    db: AsyncSession,
+    key: str,
+    company_name: str,
+    website_url: Optional[str],
+    data: Dict[str, Any]
+) -> None:
+    """Upsert a research result into the cache"""
+    now = datetime.utcnow()
+    stmt = insert(CompanyResearch).values(
+        cache_key=key,
+        domain=normalize_domain(website_url),
+        company_name=company_name,
+        data=data,
+        fetched_at=now,
+        created_at=now,
+        updated_at=now
+    )
+    await db.execute(stmt.on_conflict_do_update(
+        index_elements=[CompanyResearch.cache_key],
+        set_={"data": data, "fetched_at": now, "updated_at": now}
+    ))
+
+
+def _schedule_refresh(key: str, company_name: str, website_url: Optional[str]) -> None:
+    """Refresh a stale entry in the background (deduplicated per key)"""
+    if key in _refresh_tasks:
+        return
+
+    async def refresh():
+        from app.database import AsyncSessionLocal
+        llm_limiter.current_priority.set(llm_limiter.PRIORITY_RESEARCH)  # Own task: doesn't leak to the caller
+        try:
+            data = await research_company(company_name, website_url)
+            if data:
+                async with AsyncSessionLocal() as session:
+                    await _store(session, key, company_name, website_url, data)
+                    await session.commit()
+                cache_metrics["refreshes"] += 1
+        except Exception as e:
+            cache_metrics["errors"] += 1
+            print(f"Research cache refresh failed for {key}: {str(e)}")
+        finally:
+            _refresh_tasks.pop(key, None)
+
+    _refresh_tasks[key] = asyncio.create_task(refresh())
+
 async def research_company(company_name: str, website_url: Optional[str] = None) -> Dict[str, Any]:
     """
     Research a company to get industry, products, LinkedIn, etc.
-    Uses Perplexity if configured, otherwise falls back to OpenAI with general knowledge.
+    Uses Perplexity if configured, hedged by the configured LLM provider
+    (started after research_hedge_delay_seconds, first valid JSON wins).
     """
     
     prompt = f"""
@@ -28,36 +148,95 @@ async def research_company(company_name: str, website_url: Optional[str] = None)
     Devuelve ÚNICAMENTE el JSON sin texto adicional. Si no estás seguro de algo, haz tu mejor estimación basándote en el nombre y URL.
     """
 
-    # Try Perplexity first (has real-time web search)
+    # Perplexity has real-time web search; the configured LLM falls back to general knowledge
     has_perplexity = settings.perplexity_api_key and "your-perplexity" not in settings.perplexity_api_key
-    
-    if has_perplexity:
-        try:
-            response = await perplexity_service.chat_completion(
+    if not has_perplexity:
+        return await _research_fallback(prompt)
+
+    if not settings.research_hedged:
+        return await _research_perplexity(prompt) or await _research_fallback(prompt)
+
+    return await hedged_research([
+        (0.0, lambda: _research_perplexity(prompt)),
+        (settings.research_hedge_delay_seconds, lambda: _research_fallback(prompt)),
+    ])
+
+
+async def hedged_research(
+    providers: List[Tuple[float, Callable[[], Awaitable[Dict[str, Any]]]]]
+) -> Dict[str, Any]:
+    """
+    Run research providers as a hedge and return the first non-empty result.
+
+    Each provider is (delay, factory). A provider starts once its delay has
+    elapsed, or earlier if every running provider already failed. Remaining
+    providers are cancelled as soon as one returns valid data.
+    """
+    loop = asyncio.get_running_loop()
+    started_at = loop.time()
+    pending_providers = list(providers)
+    running: set = set()
+
+    try:
+        while pending_providers or running:
+            # Start the next provider when its delay is due or nothing else is running
+            if pending_providers and (
+                not running or loop.time() - started_at >= pending_providers[0][0]
+            ):
+                _, factory = pending_providers.pop(0)
+                running.add(asyncio.create_task(factory()))
+                continue
+
+            timeout = None
+            if pending_providers:
+                timeout = max(0.0, started_at + pending_providers[0][0] - loop.time())
+
+            done, running = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if not task.cancelled() and task.exception() is None and task.result():
+                    return task.result()
+    finally:
+        for task in running:
+            task.cancel()
+
+    return {}
+
+
+async def _research_perplexity(prompt: str) -> Dict[str, Any]:
+    """Perplexity research, {} on error, timeout or unparsable JSON"""
+    try:
+        response = await asyncio.wait_for(
+            perplexity_service.chat_completion(
                 messages=[{"role": "user", "content": prompt}],
                 model="llama-3.1-sonar-large-128k-online"
-            )
-            result = _extract_json(response)
-            if result:
-                return result
-        except Exception as e:
-            print(f"Perplexity research failed: {str(e)}")
+            ),
+            timeout=settings.research_perplexity_timeout
+        )
+        return _extract_json(response)
+    except asyncio.TimeoutError:
+        print("Perplexity research timed out")
+    except Exception as e:
+        print(f"Perplexity research failed: {str(e)}")
+    return {}
 
-    # Fallback to OpenAI (uses training data, not real-time but knows major companies)
+
+async def _research_fallback(prompt: str) -> Dict[str, Any]:
+    """Research with the configured LLM provider, {} on error, timeout or unparsable JSON"""
     try:
         response = await ai_provider_service.chat_completion(
             messages=[
                 {"role": "system", "content": "Eres un experto en análisis de empresas. Responde SOLO con JSON válido."},
                 {"role": "user", "content": prompt}
             ],
-            temperature=0.3
+            temperature=0.3,
+            cache_ttl=settings.research_llm_cache_ttl_seconds,
+            deadline=Deadline(settings.research_fallback_timeout)
         )
-        result = _extract_json(response)
-        if result:
-            return result
+        return _extract_json(response)
+    except LLMDeadlineError:
+        print("Fallback research timed out")
     except Exception as e:
-        print(f"OpenAI research failed: {str(e)}")
-
+        print(f"Fallback research failed: {str(e)}")
     return {}
 
 
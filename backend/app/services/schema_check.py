@@ -0,0 +1,85 @@
+# /backend/app/services/schema_check.py
+"""
+Startup check that the database schema is at the Alembic head.
+
+The schema is only changed by migrations (`python migrate.py`, run once per
+deploy). Web processes no longer create tables; they compare the revision
+stored in alembic_version with the head of alembic/versions, which costs a
+single query.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List
+
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from alembic.util import CommandError
+from sqlalchemy import exc, text
+
+from app.config import get_settings
+from app.database import engine
+
+settings = get_settings()
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+AT_HEAD = "at_head"
+BEHIND = "behind"
+AHEAD = "ahead"  # Migrated by a newer release (rolling deploy)
+UNMANAGED = "unmanaged"  # No alembic_version table (empty or create_all-made database)
+UNKNOWN = "unknown"
+
+# Result of the last check (exposed on /health)
+state: Dict[str, Any] = {"status": UNKNOWN, "current": [], "head": []}
+
+
+def migration_scripts() -> ScriptDirectory:
+    """Migration scripts (reads alembic/versions, no database)"""
+    return ScriptDirectory.from_config(Config(str(ALEMBIC_INI)))
+
+
+def _is_known(scripts: ScriptDirectory, revision: str) -> bool:
+    try:
+        return scripts.get_revision(revision) is not None
+    except CommandError:
+        return False
+
+
+async def current_revisions() -> List[str]:
+    """Revision(s) recorded in the database, [] when it isn't managed by Alembic"""
+    async with engine.connect() as conn:
+        try:
+            result = await conn.execute(text("SELECT version_num FROM alembic_version"))
+        except exc.ProgrammingError:
+            return []
+        return sorted(row[0] for row in result)
+
+
+async def check() -> Dict[str, Any]:
+    """
+    Compare the database revision with the head.
+
+    Logs a warning when the schema is not at head, or raises RuntimeError if
+    require_schema_at_head is set, so an instance never serves an old or
+    missing schema.
+    """
+    scripts = migration_scripts()
+    head = sorted(scripts.get_heads())
+    current = await current_revisions()
+    if not current:
+        status = UNMANAGED
+    elif current == head:
+        status = AT_HEAD
+    elif not all(_is_known(scripts, revision) for revision in current):
+        status = AHEAD
+    else:
+        status = BEHIND
+    state.update({"status": status, "current": current, "head": head})
+
+    if status != AT_HEAD:
+        message = f"Database schema is {status} (current {current or 'none'}, head {head}): run `python migrate.py`"
+        # A newer schema is expected while a rolling deploy replaces this release
+        if settings.require_schema_at_head and status != AHEAD:
+            raise RuntimeError(message)
+        print(f"WARNING: {message}")
+    return state
@@ -0,0 +1,68 @@
+# /backend/app/services/stage_context.py
+"""
+Stage context loader.
+
+One statement (accounts LEFT JOIN stages) returns an account, checked
+against its owner, together with all of its stages. Chat, init, the demo
+autochat and exports read the current, previous and next stages from it
+instead of querying them one by one.
+"""
+
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from app.models.account import Account
+from app.models.stage import Stage
+
+
+class StageContext:
+    """An account and its stages, indexed by stage number"""
+
+    def __init__(self, account: Account):
+        self.account = account
+        self.stages: Dict[int, Stage] = {stage.stage_number: stage for stage in account.stages}
+
+    def stage(self, stage_number: int) -> Optional[Stage]:
+        return self.stages.get(stage_number)
+
+    def previous_stage_output(self, stage_number: int) -> Optional[Dict[str, Any]]:
+        """Output of the stage right before, if it has one"""
+        previous = self.stages.get(stage_number - 1)
+        return previous.output if previous and previous.output else None
+
+    def previous_outputs(self, stage_number: int) -> Dict[str, Any]:
+        """{"stage_N": output} for every stage before stage_number"""
+        return {
+            f"stage_{number}": stage.output
+            for number, stage in sorted(self.stages.items())
+            if number < stage_number
+        }
+
+    def completed_stages(self) -> List[Stage]:
+        """Completed stages with an output, in stage order"""
+        return [
+            stage for _, stage in sorted(self.stages.items())
+            if stage.status == "completed" and stage.output is not None
+        ]
+
+
+async def load_stage_context(
+    db: AsyncSession,
+    account_id: UUID,
+    user_id: Optional[UUID] = None
+) -> Optional[StageContext]:
+    """
+    Load an account with all its stages in a single round trip.
+
+    With user_id the account must belong to that user. Returns None when
+    the account does not exist (or is not theirs).
+    """
+    query = select(Account).options(joinedload(Account.stages)).where(Account.id == account_id)
+    if user_id is not None:
+        query = query.where(Account.user_id == user_id)
+    result = await db.execute(query)
+    account = result.unique().scalar_one_or_none()
+    return StageContext(account) if account else None
@@ -0,0 +1,114 @@
+# /backend/app/services/stage_message_service.py
+
+from typing import Any, Dict, List
+from sqlalchemy import select, delete, update, func, literal
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models.stage import Stage
+from app.models.stage_message import StageMessage
+
+
+async def load_messages(db: AsyncSession, stage: Stage) -> List[Dict[str, str]]:
+    """Load the full transcript of a stage in conversation order"""
+    result = await db.execute(
+        select(StageMessage.role, StageMessage.content)
+        .where(StageMessage.stage_id == stage.id)
+        .order_by(StageMessage.seq)
+    )
+    return [{"role": role, "content": content} for role, content in result.all()]
+
+
+def build_state(stage: Stage, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+    """Agent-facing state: the compact Stage.state plus a fresh copy of the transcript"""
+    return {**(stage.state or {}), "messages": list(messages)}
+
+
+async def save_state(
+    db: AsyncSession,
+    stage: Stage,
+    state: Dict[str, Any],
+    persisted_messages: List[Dict[str, str]]
+) -> None:
+    """
+    Persist an agent state returned by process_message.
+
+    Messages that extend the already persisted transcript are appended as new
+    rows (the normal case, O(1) per turn). If the agent rewrote earlier history
+    the transcript is replaced. Everything except "messages" stays in Stage.state;
+    only the keys the agent changed are written (see merge_state).
+    """
+    messages = state.get("messages") or []
+    persisted_count = len(persisted_messages)
+
+    if len(messages) >= persisted_count and messages[:persisted_count] == persisted_messages:
+        new_messages = messages[persisted_count:]
+        next_seq = stage.message_count or 0
+    else:
+        await clear_messages(db, stage)
+        new_messages = messages
+        next_seq = 0
+
+    for offset, msg in enumerate(new_messages):
+        db.add(StageMessage(
+            stage_id=stage.id,
+            seq=next_seq + offset,
+            role=msg.get("role", "user"),
+            content=msg.get("content") or ""
+        ))
+
+    compact = {k: v for k, v in state.items() if k != "messages"}
+    changed = {k: v for k, v in compact.items() if k not in (stage.state or {}) or stage.state[k] != v}
+    if changed:
+        await merge_state(db, stage, changed, message_count=next_seq + len(new_messages))
+    else:
+        stage.message_count = next_seq + len(new_messages)
+
+
+def merged_state(values: Dict[str, Any]):
+    """SQL for Stage.state || values (jsonb): keys not in values keep their stored value"""
+    return func.coalesce(Stage.state, literal({}, JSONB)).op("||")(literal(values, JSONB))
+
+
+async def merge_state(db: AsyncSession, stage: Stage, values: Dict[str, Any], **columns: Any) -> None:
+    """
+    Merge keys into Stage.state in SQL, so keys written meanwhile by another
+    writer (e.g. the research job) aren't overwritten by this request's copy.
+
+    Other columns can be set in the same UPDATE. The in-memory stage gets the
+    merged keys without being marked dirty, so the ORM never writes the whole
+    state back.
+    """
+    await db.execute(
+        update(Stage)
+        .where(Stage.id == stage.id)
+        .values(state=merged_state(values), **columns)
+        .execution_options(synchronize_session=False)
+    )
+    set_committed_value(stage, "state", {**(stage.state or {}), **values})
+    for key, value in columns.items():
+        set_committed_value(stage, key, value)
+
+
+async def save_greeting(db: AsyncSession, stage: Stage, message: str) -> None:
+    """
+    Persist the agent greeting as the first assistant message.
+
+    Only while the consultant hasn't answered: an empty transcript gets the
+    greeting, and a transcript holding just an earlier greeting (e.g. written
+    before the company research landed) has it replaced.
+    """
+    if (stage.message_count or 0) > 1:
+        return
+    persisted = await load_messages(db, stage) if stage.message_count else []
+    if persisted and persisted[0]["role"] != "assistant":
+        return
+    greeting = [{"role": "assistant", "content": message}]
+    await save_state(db, stage, {**(stage.state or {}), "messages": greeting}, persisted)
+
+
+async def clear_messages(db: AsyncSession, stage: Stage) -> None:
+    """Delete the transcript of a stage (used on reset or history rewrite)"""
+    await db.execute(delete(StageMessage).where(StageMessage.stage_id == stage.id))
+    stage.message_count = 0
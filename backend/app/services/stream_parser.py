@@ -0,0 +1,69 @@
+# /backend/app/services/stream_parser.py
+
+import json
+import re
+
+# Matches the opening of the agentMessage string value: "agentMessage": "
+_AGENT_MESSAGE_START = re.compile(r'"agentMessage"\s*:\s*"')
+
+
+class AgentMessageExtractor:
+    """
+    Incrementally extracts the "agentMessage" string from a streamed JSON reply.
+
+    Agents answer with a JSON document whose user-facing text lives in
+    "agentMessage". Feeding the raw deltas in order returns the newly decoded
+    part of that string, so the UI can render it before the JSON is complete.
+    The rest of the document (state, buttons, progress, output) is parsed by
+    the agent once the full reply is available.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._cursor = None  # Position of the next undecoded char inside the string
+        self._done = False
+
+    def feed(self, delta: str) -> str:
+        """Add a raw delta and return any newly available agentMessage text"""
+        if self._done:
+            return ""
+
+        self._buffer += delta
+
+        if self._cursor is None:
+            match = _AGENT_MESSAGE_START.search(self._buffer)
+            if not match:
+                return ""
+            self._cursor = match.end()
+
+        decoded = []
+        i = self._cursor
+        while i < len(self._buffer):
+            char = self._buffer[i]
+            if char == '"':
+                self._done = True
+                i += 1
+                break
+            if char == "\\":
+                # Escape sequences may be split across deltas; wait for the rest
+                length = 2
+                if self._buffer[i + 1:i + 2] == "u":
+                    # High surrogates (emoji) are only decodable together with their pair
+                    high = self._buffer[i + 2:i + 4].lower()
+                    length = 12 if high in ("d8", "d9", "da", "db") else 6
+                    if len(high) < 2:
+                        break
+                escape = self._buffer[i:i + length]
+                if len(escape) < length:
+                    break
+                try:
+                    decoded.append(json.loads(f'"{escape}"'))
+                except json.JSONDecodeError:
+                    decoded.append(escape)
+                i += length
+                continue
+            decoded.append(char)
+            i += 1
+
+        self._cursor = i
+        return "".join(decoded)
@@ -0,0 +1,251 @@
+# /backend/app/services/validation_jobs.py
+"""
+Background orchestrator validation of completed stages.
+
+When an agent reports completion the chat turn stores the draft output,
+sets Stage.validation_status = "pending" and returns right away. A worker
+then runs the orchestrator and applies the verdict:
+
+    approved (canProceed) -> stage completed, next stage unlocked
+    rejected              -> stage stays in_progress with the feedback
+    error                 -> validation_status "failed" (retryable)
+
+Jobs are keyed by stage, so retries are idempotent: a stage that is not
+pending is skipped, and if the output changes while a validation runs the
+new output is validated before anything is applied.
+
+LLM verdicts are memoized by content hash (stage, output, previous outputs,
+account context and prompt version): re-validating identical content reuses
+the stored OrchestratorValidation row instead of calling the LLM again.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.database import AsyncSessionLocal
+from app.models.account import Account
+from app.models.stage import Stage
+from app.models.orchestrator_validation import OrchestratorValidation as OrchestratorValidationModel
+from app.services import llm_limiter
+from app.services.job_queue import JobQueue
+from app.services.orchestrator_service import OrchestratorValidationResult, get_orchestrator
+
+settings = get_settings()
+
+VALIDATION_PENDING = "pending"
+VALIDATION_COMPLETED = "completed"
+VALIDATION_FAILED = "failed"
+
+
+# Memoized verdict lookups
+memo_stats = {"hits": 0, "misses": 0}
+
+
+def enqueue(stage_id: UUID, consultant_name: Optional[str] = None, bypass_cache: bool = False) -> bool:
+    """Queue the validation of a stage. Returns False if it is already queued/running"""
+    return _jobs.enqueue(stage_id, consultant_name, bypass_cache)
+
+
+def is_active(stage_id: UUID) -> bool:
+    return _jobs.is_active(stage_id)
+
+
+async def unlock_next_stage(db: AsyncSession, account_id: UUID, stage_number: int) -> None:
+    """Move the following stage from locked to in_progress"""
+    if stage_number >= 7:
+        return
+    result = await db.execute(
+        select(Stage).where(
+            Stage.account_id == account_id,
+            Stage.stage_number == stage_number + 1
+        )
+    )
+    next_stage = result.scalar_one_or_none()
+    if next_stage and next_stage.status == "locked":
+        next_stage.status = "in_progress"
+
+
+async def apply_verdict(
+    db: AsyncSession,
+    stage: Stage,
+    output: Dict[str, Any],
+    validation: OrchestratorValidationResult,
+    content_hash: Optional[str] = None,
+    record: Optional[OrchestratorValidationModel] = None
+) -> None:
+    """
+    Store the orchestrator verdict and update the stage status accordingly.
+
+    record is the stored validation a memoized verdict was rebuilt from;
+    otherwise a new row is inserted. Either way the stage points at it.
+    """
+    if record is None:
+        # Rule verdicts are free and fail-open errors must not be reused
+        reusable = validation.metadata.get("modelUsed") not in ("rules", None) and not validation.metadata.get("error")
+        record = OrchestratorValidationModel(
+            account_id=stage.account_id,
+            stage_number=stage.stage_number,
+            approved=validation.approved,
+            quality_score=validation.qualityScore,
+            coherence_score=validation.coherenceScore,
+            issues=[i.dict() for i in validation.issues],
+            suggestions=[s.dict() for s in validation.suggestions],
+            validation_details=validation.validationDetails,
+            ai_model_used=validation.metadata.get("modelUsed"),
+            prompt_tokens=validation.metadata.get("promptTokens"),
+            completion_tokens=validation.metadata.get("completionTokens"),
+            content_hash=content_hash if reusable else None
+        )
+        db.add(record)
+        await db.flush()
+
+    stage.validation_id = record.id
+    stage.orchestrator_approved = validation.approved
+    stage.orchestrator_score = validation.overallScore
+    stage.orchestrator_feedback = {
+        "issues": [i.dict() for i in validation.issues],
+        "suggestions": [s.dict() for s in validation.suggestions]
+    }
+    stage.validation_status = VALIDATION_COMPLETED
+    stage.output = output
+
+    if validation.canProceed:
+        stage.status = "completed"
+        stage.completed_at = datetime.utcnow()
+        await unlock_next_stage(db, stage.account_id, stage.stage_number)
+    else:
+        # Rejected: keep the latest draft visible but let the user continue chatting
+        stage.status = "in_progress"
+
+
+async def _memoized_record(db: AsyncSession, content_hash: str) -> Optional[OrchestratorValidationModel]:
+    """Stored validation with the same content hash"""
+    result = await db.execute(
+        select(OrchestratorValidationModel).where(OrchestratorValidationModel.content_hash == content_hash)
+    )
+    return result.scalar_one_or_none()
+
+
+def _memoized_verdict(row: OrchestratorValidationModel) -> OrchestratorValidationResult:
+    """Rebuild a verdict from a stored validation"""
+    quality = row.quality_score or 0.0
+    coherence = row.coherence_score or 0.0
+    return OrchestratorValidationResult(
+        approved=row.approved,
+        canProceed=row.approved,
+        qualityScore=quality,
+        coherenceScore=coherence,
+        overallScore=(quality + coherence) / 2,
+        issues=row.issues or [],
+        suggestions=row.suggestions or [],
+        validationDetails=row.validation_details or {},
+        metadata={
+            "stageValidated": row.stage_number,
+            "modelUsed": row.ai_model_used,
+            "validatedAt": row.validated_at.isoformat() + "Z",
+            "memoized": True
+        }
+    )
+
+
+async def _previous_outputs(db: AsyncSession, stage: Stage) -> Dict[str, Any]:
+    result = await db.execute(
+        select(Stage.stage_number, Stage.output).where(
+            Stage.account_id == stage.account_id,
+            Stage.stage_number < stage.stage_number
+        )
+    )
+    return {f"stage_{number}": output for number, output in result.all()}
+
+
+async def _run(stage_id: UUID, consultant_name: Optional[str] = None, bypass_cache: bool = False) -> None:
+    with llm_limiter.priority_scope(llm_limiter.PRIORITY_BACKGROUND):
+        await _validate_stage(stage_id, consultant_name, bypass_cache)
+
+
+async def _validate_stage(stage_id: UUID, consultant_name: Optional[str], bypass_cache: bool) -> None:
+    async with AsyncSessionLocal() as db:
+        stage = await db.get(Stage, stage_id)
+        if stage is None or stage.validation_status != VALIDATION_PENDING:
+            return  # Already validated (idempotent retry) or stage removed
+
+        account = await db.get(Account, stage.account_id)
+        account_context = {
+            "company_name": account.client_name,
+            "company_website": account.company_website,
+            "consultant_name": consultant_name or "Consultor"
+        }
+        previous_outputs = await _previous_outputs(db, stage)
+        orchestrator = get_orchestrator()
+
+        try:
+            while True:
+                output = stage.output
+                content_hash = orchestrator.verdict_hash(
+                    str(stage.account_id), stage.stage_number, output, previous_outputs, account_context
+                )
+
+                validation = record = None
+                if settings.orchestrator_memoize and not bypass_cache:
+                    record = await _memoized_record(db, content_hash)
+                    memo_stats["hits" if record else "misses"] += 1
+                if record is not None:
+                    validation = _memoized_verdict(record)
+                else:
+                    validation = await orchestrator.validate_stage_completion(
+                        account_id=str(stage.account_id),
+                        stage_number=stage.stage_number,
+                        stage_output=output,
+                        previous_outputs=previous_outputs,
+                        account_context=account_context,
+                        fail_open=False,  # An LLM error marks the validation failed (retryable)
+                        bypass_cache=bypass_cache
+                    )
+
+                # The user may have produced a new output while we were validating
+                await db.refresh(stage)
+                if stage.validation_status != VALIDATION_PENDING:
+                    return
+                if stage.output == output:
+                    break
+
+            if record is None and content_hash:
+                # A bypassed re-validation replaces the memoized verdict
+                existing = await db.execute(
+                    select(OrchestratorValidationModel).where(OrchestratorValidationModel.content_hash == content_hash)
+                )
+                for row in existing.scalars().all():
+                    row.content_hash = None
+                await db.flush()
+
+            await apply_verdict(db, stage, output, validation, content_hash, record)
+            await db.commit()
+        except Exception as e:
+            print(f"Orchestrator validation failed for stage {stage_id}: {str(e)}")
+            await db.rollback()
+            stage = await db.get(Stage, stage_id)
+            if stage is not None and stage.validation_status == VALIDATION_PENDING:
+                stage.validation_status = VALIDATION_FAILED
+                await db.commit()
+
+
+_jobs = JobQueue(
+    "Validation",
+    _run,
+    workers=settings.validation_workers,
+    maxsize=settings.validation_queue_size
+)
+
+
+def start() -> None:
+    """Start the worker pool (app startup)"""
+    _jobs.start()
+
+
+async def stop() -> None:
+    """Cancel the workers (app shutdown); pending stages are re-queued when polled"""
+    await _jobs.stop()
@@ -1,5 +1,7 @@
 # /backend/app/utils/security.py
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any
 from jose import jwt, JWTError
@@ -9,7 +11,18 @@ from app.config import get_settings
 settings = get_settings()
 
 # Password hashing context - using argon2 (more modern and secure)
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+# Hashes made with other parameters still verify and are flagged for rehash
+pwd_context = CryptContext(
+    schemes=["argon2"],
+    deprecated="auto",
+    argon2__memory_cost=settings.argon2_memory_cost,
+    argon2__rounds=settings.argon2_time_cost,
+    argon2__parallelism=settings.argon2_parallelism
+)
+
+# Argon2 is CPU/memory heavy on purpose: async handlers run it on this bounded pool
+# (argon2-cffi releases the GIL) so a login burst queues here instead of blocking the event loop
+_hash_pool = ThreadPoolExecutor(max_workers=settings.password_hash_workers, thread_name_prefix="argon2")
 
 
 def hash_password(password: str) -> str:
@@ -22,6 +35,24 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+async def hash_password_async(password: str) -> str:
+    """hash_password on the hashing pool"""
+    return await asyncio.get_running_loop().run_in_executor(_hash_pool, pwd_context.hash, password)
+
+
+async def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """
+    Verify a password on the hashing pool
+
+    Returns:
+        (valid, new_hash): new_hash is set when the stored hash uses outdated
+        argon2 parameters and should be replaced
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        _hash_pool, pwd_context.verify_and_update, plain_password, hashed_password
+    )
+
+
 def create_access_token(data: dict[str, Any], expires_delta: timedelta | None = None) -> str:
     """Create a JWT access token"""
     to_encode = data.copy()
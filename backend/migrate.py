@@ -0,0 +1,46 @@
+import asyncio
+import sys
+import time
+
+# Add the current directory to sys.path to allow importing 'app'
+import os
+sys.path.append(os.getcwd())
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+
+from app.database import engine
+from app.services import schema_check
+
+# Schema migrations: run once per deploy, before the web processes start
+# (they only check that the schema is at head).
+
+
+async def _inspect_database() -> tuple[list[str], bool]:
+    """(revisions in alembic_version, whether app tables already exist)"""
+    current = await schema_check.current_revisions()
+    async with engine.connect() as conn:
+        has_tables = await conn.run_sync(lambda sync_conn: inspect(sync_conn).has_table("users"))
+    await engine.dispose()
+    return current, has_tables
+
+
+def migrate():
+    started = time.perf_counter()
+    current, has_tables = asyncio.run(_inspect_database())
+
+    if not current and has_tables:
+        # Tables made by the old create_all-on-startup path: Alembic doesn't know what is there
+        print("Error: database has tables but no alembic_version.")
+        print("Check which migration the schema matches and record it once with")
+        print("`alembic stamp <revision>`, then run this command again.")
+        sys.exit(1)
+
+    print(f"Migrating from {current or 'empty database'} to head...")
+    command.upgrade(Config(str(schema_check.ALEMBIC_INI)), "head")
+    print(f"Schema at head {schema_check.migration_scripts().get_heads()} ({time.perf_counter() - started:.2f}s)")
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,129 @@
+# /backend/tests/test_account_summary.py
+"""/accounts/summary against the full /accounts list: payload, latency and keyset pages"""
+
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from app.database import Base
+from app.models.account import Account
+from app.models.stage import Stage
+from app.models.user import User
+from app.schemas.account import AccountResponse, AccountSummaryListResponse
+
+try:
+    from app.routers import accounts as accounts_router
+except OSError:  # The routers package imports weasyprint, which needs pango at import time
+    pytest.skip("weasyprint system libraries are not installed", allow_module_level=True)
+
+ACCOUNTS = 60
+
+
+class AsyncSessionAdapter:
+    """Runs the handlers' statements on a synchronous SQLite session"""
+
+    def __init__(self, session):
+        self.session = session
+
+    async def execute(self, statement, *args, **kwargs):
+        return self.session.execute(statement, *args, **kwargs)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    user_id = uuid.uuid4()
+    start = datetime(2026, 1, 1)
+    with Session(engine) as session:
+        session.add(User(id=user_id, email="ana@example.com", full_name="Ana", hashed_password="x"))
+        for i in range(ACCOUNTS):
+            account = Account(
+                id=uuid.uuid4(), user_id=user_id, client_name=f"Cliente {i}", ai_model="openai-gpt4o",
+                created_at=start + timedelta(minutes=i)
+            )
+            account.stages = [
+                Stage(
+                    stage_number=number, status="completed",
+                    state={"notes": ["Resumen de la conversación " * 20] * 5},
+                    output={"sections": [{"title": f"Sección {n}", "body": "Contenido del entregable " * 40} for n in range(5)]},
+                    orchestrator_feedback={"issues": ["Falta detalle"] * 5}
+                )
+                for number in range(1, 8)
+            ]
+            session.add(account)
+        session.commit()
+
+    with Session(engine) as session:
+        statements.clear()
+        yield AsyncSessionAdapter(session), User(id=user_id), statements
+
+
+async def full_list(session, user):
+    accounts = await accounts_router.get_accounts(user, session)
+    return TypeAdapter(list[AccountResponse]).dump_json(accounts)
+
+
+async def summary_page(session, user, cursor=None, limit=50):
+    page = await accounts_router.get_account_summaries(cursor, limit, user, session)
+    return AccountSummaryListResponse.model_validate(page)
+
+
+async def timed(call):
+    started = time.perf_counter()
+    result = await call()
+    return result, time.perf_counter() - started
+
+
+async def test_summary_payload_is_a_fraction_of_the_full_list(db):
+    session, user, statements = db
+
+    full = await full_list(session, user)
+    assert all("stages.state" in sql for sql in statements if "FROM stages" in sql)
+    statements.clear()
+
+    page = await summary_page(session, user, limit=ACCOUNTS)
+    summary = page.model_dump_json().encode()
+
+    assert len(page.accounts) == ACCOUNTS
+    assert len(summary) < len(full) / 10
+    stage_sql = [sql for sql in statements if "FROM stages" in sql]
+    assert stage_sql and not any("stages.state" in sql or "stages.output" in sql for sql in stage_sql)
+
+
+async def test_summary_page_is_faster_than_the_full_list(db):
+    session, user, _ = db
+
+    # Best of three over the same accounts, with an empty identity map so every call loads its rows
+    full_times, summary_times = [], []
+    for _ in range(3):
+        session.session.expunge_all()
+        full_times.append((await timed(lambda: full_list(session, user)))[1])
+        session.session.expunge_all()
+        summary_times.append((await timed(lambda: summary_page(session, user, limit=ACCOUNTS)))[1])
+
+    assert min(summary_times) < min(full_times) / 2
+
+
+async def test_pages_walk_every_account_newest_first(db):
+    session, user, _ = db
+
+    seen, cursor = [], None
+    while True:
+        page = await summary_page(session, user, cursor=cursor, limit=25)
+        seen.extend(page.accounts)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert len(seen) == ACCOUNTS
+    assert len({account.id for account in seen}) == ACCOUNTS
+    assert [account.created_at for account in seen] == sorted((a.created_at for a in seen), reverse=True)
@@ -0,0 +1,191 @@
+# /backend/tests/test_chat_flow.py
+"""/init followed by the first /chat turn, against an in-memory session"""
+
+import json
+import uuid
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.dml import Delete, Update
+
+from app.models.account import Account
+from app.models.stage import Stage
+from app.models.stage_message import StageMessage
+from app.models.user import User
+from app.schemas.stage import StageMessageRequest
+from app.services import ai_provider_service
+
+try:
+    from app.routers import agents as agents_router
+except OSError:  # The routers package imports weasyprint, which needs pango at import time
+    pytest.skip("weasyprint system libraries are not installed", allow_module_level=True)
+
+
+class _Result:
+    def __init__(self, rows=(), obj=None):
+        self.rows = list(rows)
+        self.obj = obj
+
+    def all(self):
+        return self.rows
+
+    def unique(self):
+        return self
+
+    def scalar_one_or_none(self):
+        return self.obj
+
+
+class FakeSession:
+    """
+    AsyncSession stand-in: serves one account with its stages and keeps
+    stage_messages rows in memory. Every statement and commit is recorded.
+    """
+
+    def __init__(self, account):
+        self.account = account
+        self.messages = []
+        self.statements = []
+        self.commits = 0
+
+    async def execute(self, statement, *args, **kwargs):
+        self.statements.append(statement)
+        if isinstance(statement, Delete):
+            self.messages.clear()
+            return _Result()
+        if isinstance(statement, Update):
+            return _Result()
+        entity = statement.column_descriptions[0]["entity"]
+        if entity is StageMessage:
+            return _Result(rows=[(m.role, m.content) for m in sorted(self.messages, key=lambda m: m.seq)])
+        if entity is Stage:
+            stage_number = statement.compile().params["stage_number_1"]
+            return _Result(obj=next(s for s in self.account.stages if s.stage_number == stage_number))
+        return _Result(obj=self.account)
+
+    def add(self, obj):
+        if isinstance(obj, StageMessage):
+            self.messages.append(obj)
+
+    async def flush(self):
+        pass
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        pass
+
+
+def make_account(current_stage):
+    account = Account(
+        id=uuid.uuid4(), user_id=uuid.uuid4(), client_name="Acme",
+        company_website=None, ai_model="openai-gpt4o"
+    )
+    account.stages = [
+        Stage(
+            id=uuid.uuid4(), account_id=account.id, stage_number=number, state={}, message_count=0,
+            status="completed" if number < current_stage else "in_progress" if number == current_stage else "locked",
+            output={"buyerPersona": {"name": "Ana", "narrative": "Compradora"}} if number < current_stage else None
+        )
+        for number in range(1, 8)
+    ]
+    return account
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    """Records the messages of every LLM call and answers with plain text"""
+    calls = []
+
+    async def chat_completion(messages, **kwargs):
+        calls.append(messages)
+        return "Entendido, sigamos."
+
+    monkeypatch.setattr(ai_provider_service, "chat_completion", chat_completion)
+    return calls
+
+
+async def init_then_chat(stage_number, message="Tenemos 5k al mes de presupuesto"):
+    account = make_account(stage_number)
+    user = User(id=account.user_id, full_name="Ana")
+    db = FakeSession(account)
+
+    greeting = await agents_router.get_agent_initial_message(account.id, stage_number, user, db)
+    response = await agents_router.chat_with_agent(
+        account.id, stage_number, StageMessageRequest(message=message), user, db
+    )
+    return db, greeting, response
+
+
+@pytest.mark.parametrize("stage_number", [2, 3, 4, 5, 6, 7])
+async def test_first_turn_after_init_sends_the_system_prompt(llm, stage_number):
+    db, greeting, response = await init_then_chat(stage_number)
+
+    assert response["response"] == "Entendido, sigamos."
+    sent = llm[-1]
+    assert sent[0]["role"] == "system"
+    assert sent[1] == {"role": "assistant", "content": greeting["message"]}
+    assert sent[-1] == {"role": "user", "content": "Tenemos 5k al mes de presupuesto"}
+
+    # The stored transcript keeps the system prompt first, so later turns don't add it again
+    roles = [m.role for m in sorted(db.messages, key=lambda m: m.seq)]
+    assert roles == ["system", "assistant", "user", "assistant"]
+
+
+async def test_stream_sends_server_sent_events(monkeypatch):
+    reply = json.dumps({"agentMessage": "Perfecto, anotado.", "completed": False, "state": {}})
+
+    async def chat_completion(messages, on_delta=None, **kwargs):
+        for i in range(0, len(reply), 7):
+            await on_delta(reply[i:i + 7])
+        return reply
+
+    monkeypatch.setattr(ai_provider_service, "chat_completion", chat_completion)
+    account = make_account(3)
+    db = FakeSession(account)
+
+    response = await agents_router.chat_with_agent_stream(
+        account.id, 3, StageMessageRequest(message="Hola"), User(id=account.user_id, full_name="Ana"), db
+    )
+    frames = [frame async for frame in response.body_iterator]
+
+    assert response.media_type == "text/event-stream"
+    assert all(frame.startswith("data: ") and frame.endswith("\n\n") for frame in frames)
+    events = [json.loads(frame[len("data: "):]) for frame in frames]
+    assert "".join(e["content"] for e in events if e["type"] == "token") == "Perfecto, anotado."
+    assert events[-1]["type"] == "complete"
+    assert events[-1]["response"] == reply
+    assert db.commits == 1
+
+
+async def test_chat_turn_query_count(llm):
+    db, _, _ = await init_then_chat(3)
+    db.statements.clear()
+    db.commits = 0
+
+    await agents_router.chat_with_agent(
+        db.account.id, 3, StageMessageRequest(message="Sigamos"), User(id=db.account.user_id, full_name="Ana"), db
+    )
+
+    # Account + stages, then the transcript; the commit flushes the new messages and message_count
+    # (the state didn't change this turn, so no state merge either)
+    assert [s.column_descriptions[0]["entity"] for s in db.statements] == [Account, StageMessage]
+    assert db.commits == 1
+
+
+async def test_validation_poll_loads_one_stage_row():
+    account = make_account(4)
+    stage = account.stages[2]
+    stage.output, stage.validation_status = {"oferta": "Grand Slam"}, "failed"
+    db = FakeSession(account)
+
+    payload = await agents_router.get_stage_validation(account.id, 3, User(id=account.user_id), db)
+
+    assert payload["output"] == {"oferta": "Grand Slam"}
+    assert payload["validation_status"] == "failed"
+    [statement] = db.statements
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "JOIN accounts" in sql and "accounts.user_id" in sql  # Ownership checked in the same query
+    assert "stages.state" not in sql
+    assert "FROM stages" in sql and "accounts.client_name" not in sql
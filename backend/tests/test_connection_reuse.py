@@ -0,0 +1,92 @@
+# /backend/tests/test_connection_reuse.py
+"""Connection reuse of the pooled Perplexity client against a local stub server"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from app.services import perplexity_service
+from app.services.llm_clients import LLMClientRegistry
+
+BODY = json.dumps({"choices": [{"message": {"content": "ok"}}]}).encode()
+
+
+class StubServer:
+    """Minimal keep-alive HTTP/1.1 server that counts accepted connections"""
+
+    def __init__(self):
+        self.connections = 0
+        self.requests = 0
+        self.server = None
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                await reader.readexactly(length)
+                self.requests += 1
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(BODY)}\r\n\r\n".encode() + BODY
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/chat/completions"
+        return self
+
+    async def __aexit__(self, *exc):
+        self.server.close()
+
+
+@pytest.fixture
+async def perplexity(monkeypatch):
+    monkeypatch.setattr(perplexity_service.settings, "perplexity_api_key", "pplx-test")
+    registry = LLMClientRegistry()
+    monkeypatch.setattr(perplexity_service, "registry", registry)
+    async with StubServer() as server:
+        monkeypatch.setattr(perplexity_service, "PERPLEXITY_API_URL", server.url)
+        yield server
+        await registry.close()
+
+
+MESSAGES = [{"role": "user", "content": "Investiga Acme"}]
+
+
+async def test_sequential_calls_reuse_one_connection(perplexity):
+    for _ in range(10):
+        assert await perplexity_service.chat_completion(MESSAGES) == "ok"
+
+    assert perplexity.requests == 10
+    assert perplexity.connections == 1
+
+
+async def test_concurrent_calls_stay_within_the_pool(perplexity):
+    for _ in range(3):
+        await asyncio.gather(*(perplexity_service.chat_completion(MESSAGES) for _ in range(5)))
+
+    assert perplexity.requests == 15
+    assert perplexity.connections <= 5  # Later bursts reuse the kept-alive connections
+
+
+async def test_a_client_per_call_opens_a_connection_per_call(perplexity):
+    # Baseline the pooled client replaces
+    for _ in range(5):
+        async with httpx.AsyncClient() as client:
+            response = await client.post(perplexity.url, json={"messages": MESSAGES})
+            assert response.status_code == 200
+
+    assert perplexity.connections == 5
@@ -0,0 +1,76 @@
+# /backend/tests/test_gemini_load.py
+"""Load test: Gemini calls don't block the event loop and respect the concurrency cap"""
+
+import asyncio
+
+import pytest
+
+from app.services import ai_provider_service, google_service, llm_limiter
+
+MESSAGES = [{"role": "user", "content": "hola"}]
+LATENCY = 0.02
+CALLS = 40
+MAX_CONCURRENCY = 4
+
+
+class FakeGemini:
+    """Stands in for the client registry, model and chat session: only the async API exists"""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def gemini_model(self, model, system_instruction):
+        return self
+
+    def start_chat(self, history):
+        return self
+
+    async def send_message_async(self, prompt, generation_config=None, request_options=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(LATENCY)
+        finally:
+            self.in_flight -= 1
+        return type("Response", (), {"text": "ok"})()
+
+
+@pytest.fixture
+def gemini(monkeypatch, install_providers):
+    settings = ai_provider_service.settings
+    monkeypatch.setattr(settings, "gemini_max_concurrency", MAX_CONCURRENCY)
+    monkeypatch.setattr(settings, "llm_failover_enabled", False)
+
+    fake = FakeGemini()
+    monkeypatch.setattr(google_service, "registry", fake)
+    install_providers(gemini=google_service)
+    return fake
+
+
+async def test_concurrent_gemini_calls_are_capped_and_keep_the_loop_responsive(gemini):
+    loop = asyncio.get_running_loop()
+    lags = []
+    stop = asyncio.Event()
+
+    async def heartbeat():
+        while not stop.is_set():
+            expected = loop.time() + 0.005
+            await asyncio.sleep(0.005)
+            lags.append(loop.time() - expected)
+
+    ticker = asyncio.create_task(heartbeat())
+    started = loop.time()
+    results = await asyncio.gather(*(
+        ai_provider_service.chat_completion(MESSAGES, model_override="gemini-2.0-flash")
+        for _ in range(CALLS)
+    ))
+    elapsed = loop.time() - started
+    stop.set()
+    await ticker
+
+    assert results == ["ok"] * CALLS
+    assert gemini.max_in_flight == MAX_CONCURRENCY  # Parallel, but never above the cap
+    assert elapsed < CALLS * LATENCY / 2  # Far below a serialized run
+    assert max(lags) < 0.05  # The event loop kept ticking during the calls
+    assert llm_limiter.get_limiter("gemini").in_flight == 0
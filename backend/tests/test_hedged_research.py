@@ -0,0 +1,86 @@
+# /backend/tests/test_hedged_research.py
+"""Hedged company research: tail latency with stub providers"""
+
+import asyncio
+
+from app.services.research_service import hedged_research
+
+HEDGE_DELAY = 0.02
+FALLBACK_LATENCY = 0.03
+
+# Primary provider profile over 20 calls: mostly fast, a slow tail and a few empty results
+PRIMARY_PROFILE = [(0.01, True)] * 15 + [(0.01, False)] * 2 + [(0.2, True)] * 3
+
+
+def stub(latency, ok):
+    async def provider():
+        await asyncio.sleep(latency)
+        return {"company": "Acme"} if ok else {}
+    return provider
+
+
+def p95(samples):
+    ordered = sorted(samples)
+    return ordered[int(len(ordered) * 0.95) - 1]
+
+
+async def timed(coro):
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    result = await coro
+    return result, loop.time() - started
+
+
+async def sequential(primary, fallback):
+    return await primary() or await fallback()
+
+
+async def test_hedging_cuts_the_p95_latency():
+    sequential_latencies, hedged_latencies = [], []
+    for latency, ok in PRIMARY_PROFILE:
+        result, elapsed = await timed(sequential(stub(latency, ok), stub(FALLBACK_LATENCY, True)))
+        assert result
+        sequential_latencies.append(elapsed)
+
+        result, elapsed = await timed(hedged_research([
+            (0.0, stub(latency, ok)),
+            (HEDGE_DELAY, stub(FALLBACK_LATENCY, True))
+        ]))
+        assert result
+        hedged_latencies.append(elapsed)
+
+    # The slow tail is bounded by hedge delay + fallback latency instead of the primary's latency
+    assert p95(sequential_latencies) >= 0.2
+    assert p95(hedged_latencies) < HEDGE_DELAY + FALLBACK_LATENCY + 0.05
+    assert p95(hedged_latencies) < p95(sequential_latencies) / 2
+
+
+async def test_a_failed_provider_starts_the_next_one_early():
+    result, elapsed = await timed(hedged_research([
+        (0.0, stub(0.0, False)),
+        (1.0, stub(0.01, True))
+    ]))
+
+    assert result == {"company": "Acme"}
+    assert elapsed < 0.5
+
+
+async def test_the_slower_provider_is_cancelled():
+    cancelled = asyncio.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    result = await hedged_research([(0.0, slow), (0.01, stub(0.01, True))])
+    await asyncio.sleep(0)
+
+    assert result == {"company": "Acme"}
+    assert cancelled.is_set()
+
+
+async def test_returns_empty_when_every_provider_fails():
+    assert await hedged_research([(0.0, stub(0.0, False)), (0.01, stub(0.0, False))]) == {}
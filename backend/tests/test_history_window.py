@@ -0,0 +1,73 @@
+# /backend/tests/test_history_window.py
+"""Prompt size and windowing cost at turn 5, 20 and 40"""
+
+import json
+import time
+
+import pytest
+
+from app.services import history_service
+
+SYSTEM = {"role": "system", "content": "Eres el agente BOOMS. " * 200}
+COLLECTED = {"empresa": "Acme", "industria": "SaaS", "ticket": "5k USD", "canales": ["LinkedIn", "Email"]}
+SETTINGS = history_service.settings
+
+
+def history(turns):
+    """System prompt plus `turns` user / raw-JSON assistant exchanges"""
+    messages = [SYSTEM]
+    for i in range(turns):
+        messages.append({"role": "user", "content": f"Respuesta {i}: " + "detalle del negocio " * 40})
+        messages.append({"role": "assistant", "content": json.dumps({
+            "agentMessage": f"Pregunta {i + 1}",
+            "collectedData": {**COLLECTED, "notas": "x" * 3000},
+            "isComplete": False
+        })})
+    return messages
+
+
+def full_size(messages):
+    return history_service.estimate_tokens(messages)
+
+
+@pytest.mark.parametrize("turns", [5, 20, 40])
+def test_window_fits_the_budget_and_keeps_system_and_summary(turns):
+    messages = history(turns)
+    messages.append({"role": "user", "content": "Siguiente"})
+
+    started = time.perf_counter()
+    prompt = history_service.window_messages(messages, collected_data=COLLECTED)
+    elapsed = time.perf_counter() - started
+
+    assert history_service.estimate_tokens(prompt) <= SETTINGS.history_max_prompt_tokens
+    assert prompt[0]["role"] == "system" and prompt[0]["content"].startswith(SYSTEM["content"])
+    assert prompt[-1] == {"role": "user", "content": "Siguiente"}
+    if turns + 1 > SETTINGS.history_max_turns:
+        assert "RESUMEN DE DATOS YA RECOPILADOS" in prompt[0]["content"]
+        assert '"empresa":"Acme"' in prompt[0]["content"]
+    assert elapsed < 0.05
+    assert messages[0] is SYSTEM  # Stored history untouched
+
+
+def test_prompt_size_stops_growing_with_the_conversation():
+    sizes = {}
+    for turns in (5, 20, 40):
+        messages = history(turns) + [{"role": "user", "content": "Siguiente"}]
+        sizes[turns] = history_service.estimate_tokens(
+            history_service.window_messages(messages, collected_data=COLLECTED)
+        )
+
+    assert full_size(history(40)) > SETTINGS.history_max_prompt_tokens  # The unwindowed prompt would not fit
+    assert sizes[40] < full_size(history(40)) / 3
+    assert sizes[5] < sizes[20]
+    assert sizes[40] == sizes[20]  # Bounded by the turn window, not the conversation length
+
+
+def test_token_budget_trims_oldest_turns_but_keeps_the_current_one():
+    messages = history(40) + [{"role": "user", "content": "Siguiente"}]
+
+    prompt = history_service.window_messages(messages, collected_data=COLLECTED, max_prompt_tokens=2500)
+
+    assert history_service.estimate_tokens(prompt) <= 2500
+    assert prompt[0]["role"] == "system" and "RESUMEN DE DATOS YA RECOPILADOS" in prompt[0]["content"]
+    assert prompt[-1]["content"] == "Siguiente"
@@ -0,0 +1,137 @@
+# /backend/tests/test_knowledge_index.py
+"""Knowledge index: content-hash validation and the stat-based change check"""
+
+import os
+import time
+
+import pytest
+
+from app.services import knowledge_index, rag_service
+from app.services.knowledge_index import KnowledgeIndex
+
+
+@pytest.fixture
+def knowledge_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(knowledge_index, "KNOWLEDGE_DIR", str(tmp_path))
+    (tmp_path / "offers.txt").write_text("Grand slam offer.\n\nValue equation.", encoding="utf-8")
+    (tmp_path / "story.txt").write_text("The hero has a problem.", encoding="utf-8")
+    return tmp_path
+
+
+def test_saved_index_survives_an_mtime_only_change(knowledge_dir):
+    path = str(knowledge_dir / "index.json")
+    KnowledgeIndex.build(chunk_tokens=300).save(path)
+
+    os.utime(knowledge_dir / "offers.txt", (1, 1))  # e.g. a fresh checkout
+
+    assert KnowledgeIndex.load(300, path) is not None
+
+
+def test_saved_index_is_rejected_when_a_source_changes(knowledge_dir):
+    path = str(knowledge_dir / "index.json")
+    KnowledgeIndex.build(chunk_tokens=300).save(path)
+
+    (knowledge_dir / "story.txt").write_text("The guide has a plan.", encoding="utf-8")
+
+    assert KnowledgeIndex.load(300, path) is None
+
+
+def test_saved_index_is_rejected_for_another_chunk_size(knowledge_dir):
+    path = str(knowledge_dir / "index.json")
+    KnowledgeIndex.build(chunk_tokens=300).save(path)
+
+    assert KnowledgeIndex.load(100, path) is None
+
+
+def test_unchanged_stats_skip_reading_the_documents(knowledge_dir, monkeypatch):
+    reads = []
+    read_documents = rag_service.read_documents
+
+    def counting_read(filenames):
+        reads.append(filenames)
+        return read_documents(filenames)
+
+    monkeypatch.setattr(rag_service, "read_documents", counting_read)
+
+    current = rag_service._load_or_build_index(None)
+    assert len(reads) == 1
+
+    assert rag_service._load_or_build_index(current) is current
+    assert len(reads) == 1  # Stat check only
+
+    os.utime(knowledge_dir / "story.txt", (1, 1))
+    stats, index = rag_service._load_or_build_index(current)
+    assert len(reads) == 2  # Hashed once, content unchanged: same index
+    assert index is current[1] and stats != current[0]
+
+    (knowledge_dir / "story.txt").write_text("The guide has a plan.", encoding="utf-8")
+    _, rebuilt = rag_service._load_or_build_index((stats, index))
+    assert len(reads) == 3  # Read once for both the digest and the rebuild
+    assert rebuilt is not index
+
+
+# --- Retrieval on a synthetic corpus ---
+
+FILLER = "marketing ventas cliente producto mercado estrategia canal equipo proceso resultado"
+
+
+def synthetic_index(n_chunks=2000):
+    """Filler chunks plus a few needles whose terms appear nowhere else"""
+    chunks = [
+        {"document": f"doc{i % 5}.txt", "position": i, "text": f"{FILLER} variante{i % 97} {FILLER}"}
+        for i in range(n_chunks)
+    ]
+    needles = {
+        123: "La garantía incondicional reduce el riesgo percibido del comprador.",
+        1500: "El stack de bonos aumenta el valor percibido de la oferta.",
+    }
+    needles = {i: text for i, text in needles.items() if i < n_chunks}
+    for i, text in needles.items():
+        chunks[i]["text"] = f"{FILLER} {text}"
+    return KnowledgeIndex(chunks, "synthetic", 300), needles
+
+
+def test_search_finds_the_relevant_chunk_in_the_top_k():
+    index, needles = synthetic_index()
+
+    for i, text in needles.items():
+        results = index.search(text, top_k=3, max_tokens=200)
+        assert index.chunks[i] in results
+
+
+def test_search_respects_the_token_budget():
+    index, _ = synthetic_index()
+    max_tokens = 100
+
+    results = index.search("garantía incondicional riesgo", top_k=10, max_tokens=max_tokens)
+
+    assert 0 < len(results) <= 10
+    assert sum(knowledge_index.estimate_tokens(c["text"]) for c in results) <= max_tokens
+    assert results == sorted(results, key=lambda c: c["position"])  # Document order
+
+
+def test_search_returns_every_chunk_when_they_fit():
+    index, _ = synthetic_index(n_chunks=5)
+
+    results = index.search("nada que ver", top_k=1, max_tokens=10000)
+
+    assert results == index.chunks
+
+
+def test_search_only_considers_the_requested_documents():
+    index, _ = synthetic_index()
+
+    results = index.search("garantía incondicional", documents=["doc1.txt"], top_k=5, max_tokens=200)
+
+    assert results and all(c["document"] == "doc1.txt" for c in results)
+
+
+def test_search_latency_on_a_large_corpus():
+    index, needles = synthetic_index()
+
+    started = time.perf_counter()
+    for _ in range(20):
+        index.search(needles[123], top_k=6, max_tokens=2000)
+    per_query = (time.perf_counter() - started) / 20
+
+    assert per_query < 0.05  # 2000 chunks, well under a provider round trip
@@ -0,0 +1,167 @@
+# /backend/tests/test_llm_limiter.py
+"""Admission control: priority order, AIMD concurrency, token buckets, cancellation"""
+
+import asyncio
+
+import pytest
+
+from app.services import llm_limiter
+from app.services.llm_errors import LLMRateLimitError
+from app.services.llm_limiter import (
+    PRIORITY_BACKGROUND, PRIORITY_DEMO, PRIORITY_INTERACTIVE, ProviderLimiter, TokenBucket
+)
+
+
+def make_limiter(max_concurrency=4, rpm=10000, tpm=10_000_000):
+    return ProviderLimiter("test", max_concurrency, rpm, tpm)
+
+
+async def test_waiters_are_admitted_in_priority_order():
+    limiter = make_limiter(max_concurrency=1)
+    await limiter.acquire(PRIORITY_INTERACTIVE, 1)  # Holds the only slot
+    admitted = []
+
+    async def call(priority, name):
+        await limiter.acquire(priority, 1)
+        admitted.append(name)
+        limiter.release()
+
+    # Queued lowest priority first, so FIFO order would be wrong
+    tasks = [
+        asyncio.create_task(call(PRIORITY_DEMO, "demo")),
+        asyncio.create_task(call(PRIORITY_BACKGROUND, "validation")),
+        asyncio.create_task(call(PRIORITY_INTERACTIVE, "chat")),
+    ]
+    await asyncio.sleep(0)
+    assert limiter.queue_depth() == {"interactive": 1, "background": 1, "demo_research": 1}
+
+    limiter.release()
+    await asyncio.gather(*tasks)
+
+    assert admitted == ["chat", "validation", "demo"]
+
+
+async def test_rate_limit_halves_the_limit_and_fast_successes_grow_it_back():
+    limiter = make_limiter(max_concurrency=8)
+
+    limiter.on_rate_limited()
+    assert limiter.limit == 4
+    limiter.on_rate_limited()
+    assert limiter.limit == 2
+    assert limiter.stats["rate_limited"] == 2
+
+    for _ in range(3):
+        limiter.on_success(0.1)
+    assert 2 < limiter.limit < 4  # Additive: +1/limit per success
+
+    for _ in range(200):
+        limiter.on_success(0.1)
+    assert limiter.limit == 8  # Capped at max_concurrency
+
+
+async def test_slow_response_decreases_the_limit(monkeypatch):
+    monkeypatch.setattr(llm_limiter.settings, "llm_slow_response_seconds", 1.0)
+    limiter = make_limiter(max_concurrency=8)
+
+    limiter.on_success(5.0)
+
+    assert limiter.limit == 4
+    assert limiter.stats["slow"] == 1
+
+
+async def test_limit_never_drops_below_one():
+    limiter = make_limiter(max_concurrency=2)
+    for _ in range(5):
+        limiter.on_rate_limited()
+    assert limiter.limit == 1
+
+
+async def test_rate_limit_error_inside_the_block_feeds_aimd(monkeypatch):
+    limiter = make_limiter(max_concurrency=8)
+    monkeypatch.setattr(llm_limiter, "_limiters", {"test": limiter})
+
+    with pytest.raises(LLMRateLimitError):
+        async with llm_limiter.limit("test", 10):
+            raise LLMRateLimitError("429", "test")
+
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
+
+
+def test_token_bucket_refills_over_time(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(llm_limiter.time, "monotonic", lambda: now[0])
+    bucket = TokenBucket(60)  # 1 per second
+
+    bucket.take(60)
+    assert bucket.wait_time(1) == pytest.approx(1.0)
+
+    now[0] += 30
+    assert bucket.wait_time(30) == 0
+    assert bucket.wait_time(31) == pytest.approx(1.0)
+
+    now[0] += 3600
+    bucket._refill()
+    assert bucket.tokens == 60  # Never above one minute of capacity
+
+
+async def test_empty_request_bucket_delays_admission():
+    limiter = make_limiter(rpm=60)
+    limiter.requests.tokens = 0
+    limiter.requests.rate = 100.0  # Refill fast so the test stays quick
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await limiter.acquire(PRIORITY_INTERACTIVE, 1)
+
+    assert loop.time() - started >= 0.005
+    assert limiter.in_flight == 1
+
+
+async def test_cancelled_waiter_gives_its_place_back():
+    limiter = make_limiter(max_concurrency=1)
+    await limiter.acquire(PRIORITY_INTERACTIVE, 1)
+
+    waiter = asyncio.create_task(limiter.acquire(PRIORITY_INTERACTIVE, 1))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    limiter.release()
+    assert limiter.in_flight == 0
+    await asyncio.wait_for(limiter.acquire(PRIORITY_INTERACTIVE, 1), 1)  # Slot not leaked
+    assert limiter.in_flight == 1
+
+
+async def test_cancelled_call_releases_its_slot(monkeypatch):
+    limiter = make_limiter(max_concurrency=1)
+    monkeypatch.setattr(llm_limiter, "_limiters", {"test": limiter})
+
+    async def hold():
+        async with llm_limiter.limit("test", 1):
+            await asyncio.sleep(3600)
+
+    task = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    assert limiter.in_flight == 1
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert limiter.in_flight == 0
+
+
+async def test_waiter_admitted_as_it_is_cancelled_returns_the_slot():
+    limiter = make_limiter(max_concurrency=1)
+    await limiter.acquire(PRIORITY_INTERACTIVE, 1)
+
+    waiter = asyncio.create_task(limiter.acquire(PRIORITY_INTERACTIVE, 1))
+    await asyncio.sleep(0)
+    limiter.release()  # Admits the waiter before it gets to run
+    assert limiter.in_flight == 1
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert limiter.in_flight == 0
@@ -0,0 +1,110 @@
+# /backend/tests/test_llm_resilience.py
+"""Fault injection for ai_provider_service retries, circuit breakers and failover"""
+
+import asyncio
+from collections import OrderedDict
+
+import pytest
+
+from app.services import ai_provider_service, llm_cache, llm_limiter, llm_resilience
+from app.services.llm_errors import LLMContentError, LLMServerError
+from tests.conftest import FakeProvider
+
+MESSAGES = [{"role": "user", "content": "hola"}]
+
+
+@pytest.fixture
+def providers(monkeypatch, install_providers):
+    settings = ai_provider_service.settings
+    monkeypatch.setattr(settings, "llm_failover_enabled", True)
+    monkeypatch.setattr(settings, "llm_max_retries", 2)
+    monkeypatch.setattr(settings, "llm_retry_base_delay", 0.001)
+    monkeypatch.setattr(settings, "llm_retry_max_delay", 0.002)
+    monkeypatch.setattr(settings, "llm_breaker_failure_threshold", 3)
+    monkeypatch.setattr(settings, "llm_breaker_cooldown_seconds", 0.05)
+    return install_providers(gemini=FakeProvider("gemini"), openai=FakeProvider("openai"))
+
+
+async def test_transient_error_is_retried_on_the_same_provider(providers):
+    providers["gemini"].outcomes = [LLMServerError("503", "gemini"), "recovered"]
+
+    assert await ai_provider_service.chat_completion(MESSAGES) == "recovered"
+    assert providers["gemini"].calls == 2
+    assert providers["openai"].calls == 0
+
+
+async def test_content_error_is_not_retried_but_fails_over(providers):
+    providers["gemini"].outcomes = [LLMContentError("blocked", "gemini")]
+
+    assert await ai_provider_service.chat_completion(MESSAGES) == "openai ok"
+    assert providers["gemini"].calls == 1
+
+
+async def test_fails_over_when_retries_are_exhausted(providers):
+    providers["gemini"].outcomes = [LLMServerError("503", "gemini")] * 3
+
+    assert await ai_provider_service.chat_completion(MESSAGES) == "openai ok"
+    assert providers["gemini"].calls == 3
+    assert llm_resilience.get_breaker("gemini").state == llm_resilience.OPEN
+
+
+async def test_open_breaker_short_circuits_the_provider(providers):
+    providers["gemini"].outcomes = [LLMServerError("503", "gemini")] * 3
+    await ai_provider_service.chat_completion(MESSAGES)
+
+    assert await ai_provider_service.chat_completion(MESSAGES) == "openai ok"
+    assert providers["gemini"].calls == 3  # Not called while open
+
+
+async def test_cancelled_half_open_trial_releases_the_breaker(providers):
+    breaker = llm_resilience.get_breaker("gemini")
+    for _ in range(3):
+        breaker.record_failure()
+    await asyncio.sleep(0.06)  # Cooldown over: next call is the half-open trial
+
+    providers["gemini"].outcomes = ["hang"]
+    task = asyncio.create_task(ai_provider_service.chat_completion(MESSAGES))
+    await asyncio.sleep(0.01)
+    assert breaker.state == llm_resilience.HALF_OPEN
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # The trial slot is free again: the next call reaches Gemini and closes the breaker
+    assert await ai_provider_service.chat_completion(MESSAGES) == "gemini ok"
+    assert breaker.state == llm_resilience.CLOSED
+    assert llm_limiter.get_limiter("gemini").in_flight == 0
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Memory tier only, emptied for the test"""
+    settings = ai_provider_service.settings
+    monkeypatch.setattr(settings, "llm_cache_enabled", True)
+    monkeypatch.setattr(settings, "llm_cache_db_enabled", False)
+    monkeypatch.setattr(llm_cache, "_memory", OrderedDict())
+    monkeypatch.setattr(llm_cache, "_memory_bytes", 0)
+
+
+async def test_failover_response_is_served_from_the_cache(providers, cache):
+    providers["gemini"].outcomes = [LLMContentError("blocked", "gemini")]
+
+    assert await ai_provider_service.chat_completion(MESSAGES, cache_ttl=60) == "openai ok"
+    assert await ai_provider_service.chat_completion(MESSAGES, cache_ttl=60) == "openai ok"
+
+    # Primary healthy again on the second call: the failover answer was still found
+    assert providers["gemini"].calls == 1
+    assert providers["openai"].calls == 1
+
+
+async def test_open_breaker_and_recovery_share_one_cache_entry(providers, cache):
+    providers["gemini"].outcomes = [LLMServerError("503", "gemini")] * 3
+    await ai_provider_service.chat_completion(MESSAGES, cache_ttl=60)
+    assert llm_resilience.get_breaker("gemini").state == llm_resilience.OPEN
+
+    # Breaker open (OpenAI first in the chain), then closed again: same entry both times
+    assert await ai_provider_service.chat_completion(MESSAGES, cache_ttl=60) == "openai ok"
+    await asyncio.sleep(0.06)
+    assert await ai_provider_service.chat_completion(MESSAGES, cache_ttl=60) == "openai ok"
+    assert providers["openai"].calls == 1
+    assert len(llm_cache._memory) == 1
@@ -0,0 +1,76 @@
+# /backend/tests/test_llm_usage.py
+"""Provider-reported token usage reaches the caller's llm_usage scope"""
+
+from types import SimpleNamespace
+
+from app.services import ai_provider_service, google_service, llm_usage, openai_service
+
+
+def test_usage_is_summed_within_a_scope_and_ignored_outside():
+    llm_usage.record(10, 2)  # No scope: dropped
+
+    with llm_usage.track() as usage:
+        llm_usage.record(100, 20)
+        llm_usage.record(50, None)
+
+    assert usage == {"prompt_tokens": 150, "completion_tokens": 20}
+
+
+def test_no_usage_reported_leaves_none():
+    with llm_usage.track() as usage:
+        pass
+
+    assert usage == {"prompt_tokens": None, "completion_tokens": None}
+
+
+async def test_openai_response_usage_is_recorded(monkeypatch):
+    response = SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))],
+        usage=SimpleNamespace(prompt_tokens=321, completion_tokens=12)
+    )
+
+    async def create(**kwargs):
+        return response
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(openai_service, "registry", SimpleNamespace(openai=lambda: client))
+
+    with llm_usage.track() as usage:
+        assert await openai_service.chat_completion([{"role": "user", "content": "hola"}]) == "ok"
+
+    assert usage == {"prompt_tokens": 321, "completion_tokens": 12}
+
+
+async def test_gemini_usage_metadata_is_recorded(monkeypatch):
+    class FakeGemini:
+        def gemini_model(self, model, system_instruction):
+            return self
+
+        def start_chat(self, history):
+            return self
+
+        async def send_message_async(self, prompt, generation_config=None, request_options=None):
+            return SimpleNamespace(
+                text="ok", usage_metadata=SimpleNamespace(prompt_token_count=400, candidates_token_count=30)
+            )
+
+    monkeypatch.setattr(google_service, "registry", FakeGemini())
+
+    with llm_usage.track() as usage:
+        assert await google_service.chat_completion([{"role": "user", "content": "hola"}]) == "ok"
+
+    assert usage == {"prompt_tokens": 400, "completion_tokens": 30}
+
+
+async def test_usage_crosses_the_provider_router(install_providers):
+    class ReportingProvider:
+        async def chat_completion(self, messages, model, temperature, max_tokens, timeout=None):
+            llm_usage.record(70, 7)
+            return "ok"
+
+    install_providers(gemini=ReportingProvider(), openai=ReportingProvider())
+
+    with llm_usage.track() as usage:
+        await ai_provider_service.chat_completion([{"role": "user", "content": "hola"}])
+
+    assert usage == {"prompt_tokens": 70, "completion_tokens": 7}
@@ -0,0 +1,101 @@
+# /backend/tests/test_orchestrator_service.py
+"""Orchestrator validation: rule pre-checks, LLM error handling and caching"""
+
+import pytest
+
+from app.services import llm_usage, orchestrator_service
+from app.services.llm_errors import LLMServerError
+
+ACCOUNT_CONTEXT = {"company_name": "Acme", "company_website": None, "consultant_name": "Consultor"}
+OUTPUT = {"resumen": "Output completo"}
+VERDICT = '{"approved": true, "canProceed": true, "qualityScore": 8, "coherenceScore": 8}'
+
+
+def test_rules_reject_an_empty_output():
+    verdict = orchestrator_service.pre_validate(2, {})
+
+    assert not verdict.approved and not verdict.canProceed
+    assert verdict.metadata["modelUsed"] == "rules"
+
+
+def test_rules_never_approve_a_complete_stage_1_output():
+    complete = {
+        "buyerPersona": {"name": "Ana", "narrative": "Directora de compras", "demographics": "35-45",
+                         "goals": ["Ahorrar"], "challenges": ["Tiempo"]},
+        "scalingUpTable": {"criteria": [{"name": "Ticket", "superGreen": "a", "green": "b", "yellow": "c",
+                                         "red": "d", "notEligible": "e"}]}
+    }
+
+    assert orchestrator_service.pre_validate(1, complete) is None  # Escalated to the LLM
+
+
+@pytest.fixture
+def failing_llm(monkeypatch):
+    async def chat_completion(messages, **kwargs):
+        raise LLMServerError("503", "openai")
+
+    monkeypatch.setattr(orchestrator_service, "chat_completion", chat_completion)
+
+
+async def test_llm_error_fails_open_by_default(failing_llm):
+    validation = await orchestrator_service.OrchestratorService().validate_stage_completion(
+        "account", 2, OUTPUT, {}, ACCOUNT_CONTEXT, use_rules=False
+    )
+
+    assert validation.canProceed
+    assert validation.metadata["error"]
+
+
+async def test_llm_error_is_raised_when_not_failing_open(failing_llm):
+    with pytest.raises(LLMServerError):
+        await orchestrator_service.OrchestratorService().validate_stage_completion(
+            "account", 2, OUTPUT, {}, ACCOUNT_CONTEXT, use_rules=False, fail_open=False
+        )
+
+
+async def test_forced_validation_bypasses_the_llm_cache(monkeypatch):
+    calls = []
+
+    async def chat_completion(messages, **kwargs):
+        calls.append(kwargs)
+        return VERDICT
+
+    monkeypatch.setattr(orchestrator_service, "chat_completion", chat_completion)
+    orchestrator = orchestrator_service.OrchestratorService()
+
+    await orchestrator.validate_stage_completion("account", 2, OUTPUT, {}, ACCOUNT_CONTEXT, use_rules=False)
+    await orchestrator.validate_stage_completion(
+        "account", 2, OUTPUT, {}, ACCOUNT_CONTEXT, use_rules=False, bypass_cache=True
+    )
+
+    assert calls[0]["cache_ttl"] == orchestrator_service.settings.orchestrator_cache_ttl_seconds
+    assert calls[1]["cache_ttl"] is None
+
+
+async def test_token_metrics_use_the_reported_usage(monkeypatch):
+    async def chat_completion(messages, **kwargs):
+        llm_usage.record(812, 95)  # What the provider service records from the API response
+        return VERDICT
+
+    monkeypatch.setattr(orchestrator_service, "chat_completion", chat_completion)
+
+    validation = await orchestrator_service.OrchestratorService().validate_stage_completion(
+        "account", 2, OUTPUT, {}, ACCOUNT_CONTEXT, use_rules=False
+    )
+
+    assert validation.metadata["promptTokens"] == 812
+    assert validation.metadata["completionTokens"] == 95
+
+
+async def test_token_metrics_fall_back_to_estimates(monkeypatch):
+    async def chat_completion(messages, **kwargs):
+        return VERDICT  # Cache hit: no provider call, no usage
+
+    monkeypatch.setattr(orchestrator_service, "chat_completion", chat_completion)
+
+    validation = await orchestrator_service.OrchestratorService().validate_stage_completion(
+        "account", 2, OUTPUT, {}, ACCOUNT_CONTEXT, use_rules=False
+    )
+
+    assert validation.metadata["promptTokens"] > 0
+    assert validation.metadata["completionTokens"] == len(VERDICT) // 4
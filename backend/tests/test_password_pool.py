@@ -0,0 +1,61 @@
+# /backend/tests/test_password_pool.py
+"""Argon2 on the hashing pool: a login burst doesn't stall chat requests"""
+
+import asyncio
+import time
+
+from passlib.context import CryptContext
+
+from app.utils import security
+
+LOGINS = 4
+
+
+async def chat_latencies(stop: asyncio.Event):
+    """Stand-in for chat requests: each does ~5 ms of async work; returns observed latencies"""
+    latencies = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(0.005)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+async def test_login_burst_keeps_chat_responsive():
+    stored = security.hash_password("secreto")
+    stop = asyncio.Event()
+    chat = asyncio.create_task(chat_latencies(stop))
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(security.verify_and_update_password("secreto", stored) for _ in range(LOGINS)))
+    login_burst = time.perf_counter() - started
+    stop.set()
+    latencies = await chat
+
+    assert all(valid for valid, _ in results)
+    assert max(latencies) < 0.1  # Chat kept being served while the pool hashed
+    assert len(latencies) > 10
+
+    # Baseline: the same verification inline blocks every request for a full hash
+    started = time.perf_counter()
+    security.verify_password("secreto", stored)
+    inline_hash = time.perf_counter() - started
+    assert inline_hash > max(latencies)
+    assert login_burst < LOGINS * inline_hash * 1.5  # Bounded pool: logins queue, they don't multiply
+
+
+async def test_outdated_hash_is_upgraded_at_login():
+    old_context = CryptContext(schemes=["argon2"], argon2__memory_cost=8192, argon2__rounds=1, argon2__parallelism=1)
+    stored = old_context.hash("secreto")
+
+    valid, new_hash = await security.verify_and_update_password("secreto", stored)
+
+    assert valid and new_hash
+    assert security.verify_password("secreto", new_hash)
+    assert await security.verify_and_update_password("secreto", new_hash) == (True, None)
+
+
+async def test_wrong_password_is_rejected():
+    stored = await security.hash_password_async("secreto")
+
+    assert await security.verify_and_update_password("otro", stored) == (False, None)
@@ -0,0 +1,104 @@
+# /backend/tests/test_schema_check.py
+"""Startup schema check: one query instead of create_all, and the at-head verdicts"""
+
+import time
+
+import pytest
+from sqlalchemy import create_engine, event, exc
+
+import app.models  # noqa: F401  (registers every table on Base.metadata)
+from app.database import Base
+from app.services import schema_check
+
+HEAD = schema_check.migration_scripts().get_heads()[0]
+OLDER = schema_check.migration_scripts().get_revision(HEAD).down_revision
+
+
+class FakeConnection:
+    def __init__(self, engine):
+        self.engine = engine
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    async def execute(self, statement):
+        self.engine.queries.append(str(statement))
+        if self.engine.revisions is None:
+            raise exc.ProgrammingError(str(statement), {}, Exception('relation "alembic_version" does not exist'))
+        return [(revision,) for revision in self.engine.revisions]
+
+
+class FakeEngine:
+    """Async engine stand-in that records queries and serves alembic_version rows"""
+
+    def __init__(self, revisions):
+        self.revisions = revisions
+        self.queries = []
+
+    def connect(self):
+        return FakeConnection(self)
+
+
+@pytest.fixture
+def database(monkeypatch):
+    def install(revisions, require_at_head=False):
+        fake = FakeEngine(revisions)
+        monkeypatch.setattr(schema_check, "engine", fake)
+        monkeypatch.setattr(schema_check.settings, "require_schema_at_head", require_at_head)
+        monkeypatch.setattr(schema_check, "state", dict(schema_check.state))
+        return fake
+    return install
+
+
+def create_all_queries():
+    """Statements create_all issues on a database that already has every table (a warm boot)"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    queries = []
+    event.listen(engine, "before_cursor_execute", lambda *args: queries.append(args[2]))
+    Base.metadata.create_all(engine)
+    return queries
+
+
+async def test_startup_check_is_one_query_where_create_all_checked_every_table(database):
+    fake = database([HEAD])
+
+    started = time.perf_counter()
+    state = await schema_check.check()
+    elapsed = time.perf_counter() - started
+
+    assert state["status"] == schema_check.AT_HEAD
+    assert len(fake.queries) == 1
+    assert len(create_all_queries()) >= len(Base.metadata.tables)  # One round trip per table before
+    assert elapsed < 0.1  # Reading alembic/versions is the only other work
+
+
+@pytest.mark.parametrize("revisions, status", [
+    ([OLDER], schema_check.BEHIND),
+    (["0000deadbeef"], schema_check.AHEAD),
+    (None, schema_check.UNMANAGED),
+])
+async def test_schema_not_at_head_is_reported(database, revisions, status):
+    database(revisions)
+
+    state = await schema_check.check()
+
+    assert state["status"] == status
+    assert state["head"] == [HEAD]
+
+
+@pytest.mark.parametrize("revisions", [[OLDER], None])
+async def test_required_schema_refuses_to_start_when_behind_or_unmanaged(database, revisions):
+    database(revisions, require_at_head=True)
+
+    with pytest.raises(RuntimeError, match="python migrate.py"):
+        await schema_check.check()
+
+
+async def test_required_schema_tolerates_a_newer_release(database):
+    database(["0000deadbeef"], require_at_head=True)
+
+    assert (await schema_check.check())["status"] == schema_check.AHEAD
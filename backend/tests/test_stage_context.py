@@ -0,0 +1,69 @@
+# /backend/tests/test_stage_context.py
+"""Query-count regression: an account and all its stages load in one statement"""
+
+import uuid
+
+from sqlalchemy.dialects import postgresql
+
+from app.models.account import Account
+from app.models.stage import Stage
+from app.services.stage_context import load_stage_context
+
+
+class _Result:
+    def __init__(self, account):
+        self.account = account
+
+    def unique(self):
+        return self
+
+    def scalar_one_or_none(self):
+        return self.account
+
+
+class CountingSession:
+    """AsyncSession stand-in recording every statement it is asked to run"""
+
+    def __init__(self, account):
+        self.account = account
+        self.statements = []
+
+    async def execute(self, statement, *args, **kwargs):
+        self.statements.append(str(statement.compile(dialect=postgresql.dialect())))
+        return _Result(self.account)
+
+
+def make_account():
+    account = Account(id=uuid.uuid4(), user_id=uuid.uuid4(), client_name="Acme")
+    account.stages = [
+        Stage(stage_number=number, status="completed" if number < 3 else "in_progress",
+              output={"n": number} if number < 3 else None)
+        for number in range(1, 8)
+    ]
+    return account
+
+
+async def test_account_and_stages_load_in_a_single_query():
+    account = make_account()
+    db = CountingSession(account)
+
+    context = await load_stage_context(db, account.id, account.user_id)
+
+    assert len(db.statements) == 1
+    statement = db.statements[0]
+    assert "LEFT OUTER JOIN stages" in statement
+    assert "accounts.user_id" in statement  # Ownership checked in the same statement
+
+    # Everything a chat turn reads comes from the loaded context, without further queries
+    assert context.stage(3).stage_number == 3
+    assert context.previous_stage_output(3) == {"n": 2}
+    assert context.previous_outputs(3) == {"stage_1": {"n": 1}, "stage_2": {"n": 2}}
+    assert [stage.stage_number for stage in context.completed_stages()] == [1, 2]
+    assert len(db.statements) == 1
+
+
+async def test_missing_account_returns_none():
+    db = CountingSession(None)
+
+    assert await load_stage_context(db, uuid.uuid4()) is None
+    assert len(db.statements) == 1
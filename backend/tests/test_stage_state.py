@@ -0,0 +1,126 @@
+# /backend/tests/test_stage_state.py
+"""Stage.state writes merge in SQL, and research jobs record empty results as failed"""
+
+import uuid
+
+from sqlalchemy import inspect
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.dml import Update
+
+from app.models.stage import Stage
+from app.services import research_jobs, research_service, stage_message_service
+
+
+class RecordingSession:
+    """Records statements; select() calls are answered with a scripted row"""
+
+    def __init__(self, row=None):
+        self.row = row
+        self.statements = []
+        self.added = []
+        self.commits = 0
+
+    async def execute(self, statement, *args, **kwargs):
+        self.statements.append(statement)
+        return self
+
+    def one_or_none(self):
+        return self.row
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    def updates(self):
+        return [s for s in self.statements if isinstance(s, Update)]
+
+
+def compiled(statement):
+    return statement.compile(dialect=postgresql.dialect())
+
+
+def loaded_stage(state):
+    """A stage as a request sees it: loaded from the database, nothing pending"""
+    stage = Stage(id=uuid.uuid4(), account_id=uuid.uuid4(), stage_number=1, status="in_progress", message_count=1)
+    stage.state = state
+    inspect(stage).committed_state.clear()  # Nothing pending, as after a load
+    return stage
+
+
+async def test_save_state_merges_only_the_changed_keys():
+    stage = loaded_stage({"research_status": "pending", "step": 1})
+    db = RecordingSession()
+
+    await stage_message_service.save_state(
+        db, stage,
+        {"research_status": "pending", "step": 2, "messages": [{"role": "assistant", "content": "Hola"}, {"role": "user", "content": "Sí"}]},
+        [{"role": "assistant", "content": "Hola"}]
+    )
+
+    [statement] = db.updates()
+    sql = compiled(statement)
+    assert "||" in str(sql)  # stages.state || :values, so the research job's keys survive
+    assert {"step": 2} in sql.params.values()
+    assert sql.params["message_count"] == 2
+    assert stage.state == {"research_status": "pending", "step": 2}
+    assert stage.message_count == 2
+    assert not inspect(stage).attrs.state.history.has_changes()  # The ORM won't write the copy back at commit
+    assert [m.content for m in db.added] == ["Sí"]
+
+
+async def test_unchanged_state_is_not_written():
+    stage = loaded_stage({"step": 1})
+    db = RecordingSession()
+
+    await stage_message_service.save_state(
+        db, stage, {"step": 1, "messages": [{"role": "assistant", "content": "Hola"}, {"role": "user", "content": "Sí"}]},
+        [{"role": "assistant", "content": "Hola"}]
+    )
+
+    assert db.updates() == []
+    assert stage.message_count == 2
+
+
+async def run_research(monkeypatch, result):
+    db = RecordingSession(row=("Acme", "https://acme.example"))
+    monkeypatch.setattr(research_jobs, "AsyncSessionLocal", lambda: db)
+
+    async def get_company_research(session, client_name, company_website):
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    monkeypatch.setattr(research_service, "get_company_research", get_company_research)
+    await research_jobs._research_account(uuid.uuid4())
+    [statement] = db.updates()
+    return compiled(statement).params
+
+
+async def test_research_with_data_is_ready(monkeypatch):
+    params = await run_research(monkeypatch, {"industria": "SaaS"})
+
+    assert {"research_status": research_jobs.RESEARCH_READY, "research_data": {"industria": "SaaS"}} in params.values()
+
+
+async def test_empty_research_is_failed(monkeypatch):
+    for result in (None, {}):
+        params = await run_research(monkeypatch, result)
+
+        assert {"research_status": research_jobs.RESEARCH_FAILED} in params.values()
+
+
+async def test_research_error_is_failed(monkeypatch):
+    params = await run_research(monkeypatch, RuntimeError("timeout"))
+
+    assert {"research_status": research_jobs.RESEARCH_FAILED} in params.values()
@@ -1,7 +1,7 @@
 import React, { useState, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { accountsAPI } from '../services/api';
-import type { Account } from '../types';
+import type { AccountSummary } from '../types';
 import Loading from '../components/Loading';
 import { Plus, Building2, Globe, Cpu, MoreVertical, Search, Sparkles, X, Trash2, RefreshCw, AlertTriangle } from 'lucide-react';
 import { motion, AnimatePresence } from 'framer-motion';
@@ -9,8 +9,10 @@ import { useAuth } from '../context/AuthContext';
 
 const Dashboard: React.FC = () => {
   const { user } = useAuth();
-  const [accounts, setAccounts] = useState<Account[]>([]);
+  const [accounts, setAccounts] = useState<AccountSummary[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   // Create Account Modal State
   const [showModal, setShowModal] = useState(false);
@@ -43,8 +45,9 @@ const Dashboard: React.FC = () => {
 
   const loadAccounts = async () => {
     try {
-      const data = await accountsAPI.getAll();
-      setAccounts(data);
+      const page = await accountsAPI.getSummaries();
+      setAccounts(page.accounts);
+      setNextCursor(page.next_cursor);
     } catch (error) {
       console.error('Error loading accounts:', error);
     } finally {
@@ -52,6 +55,22 @@ const Dashboard: React.FC = () => {
     }
   };
 
+  // Further pages are fetched on demand
+  const loadMoreAccounts = async () => {
+    if (!nextCursor || loadingMore) return;
+
+    setLoadingMore(true);
+    try {
+      const page = await accountsAPI.getSummaries(nextCursor);
+      setAccounts(prev => [...prev, ...page.accounts]);
+      setNextCursor(page.next_cursor);
+    } catch (error) {
+      console.error('Error loading more accounts:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleCreateAccount = async (e: React.FormEvent) => {
     e.preventDefault();
     try {
@@ -266,6 +285,18 @@ const Dashboard: React.FC = () => {
             </AnimatePresence>
           </div>
         )}
+
+        {nextCursor && (
+          <div className="mt-8 flex justify-center">
+            <button
+              onClick={loadMoreAccounts}
+              disabled={loadingMore}
+              className="px-6 py-3 rounded-xl font-bold bg-secondary text-muted-foreground hover:bg-secondary/80 transition-colors disabled:opacity-70"
+            >
+              {loadingMore ? 'Loading...' : 'Load more'}
+            </button>
+          </div>
+        )}
       </div>
 
       {/* Create Account Modal */}
@@ -43,6 +43,7 @@ const StageChat: React.FC = () => {
   const [loading, setLoading] = useState(true);
   const [isAutoChatting, setIsAutoChatting] = useState(false);
   const [isResetModalOpen, setIsResetModalOpen] = useState(false);
+  const [researchPending, setResearchPending] = useState(false);
 
   // Thought Process State
   const [thoughtSteps, setThoughtSteps] = useState<ThoughtStep[]>([]);
@@ -56,6 +57,56 @@ const StageChat: React.FC = () => {
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [accountId, stageNumber]);
 
+  // Company research runs in the background; poll it and refresh the greeting once it lands
+  useEffect(() => {
+    if (!researchPending || !accountId || !stageNumber) return;
+
+    const interval = setInterval(async () => {
+      try {
+        const research = await agentsAPI.getResearch(accountId);
+        if (research.research_status === 'pending') return;
+
+        setResearchPending(false);
+        const initialData = await agentsAPI.getInitialMessage(accountId, parseInt(stageNumber));
+        // Only replace the greeting if the consultant hasn't answered yet
+        setMessages(prev => prev.length === 1 && prev[0].role === 'assistant'
+          ? [{ role: 'assistant', content: initialData.message, buttons: initialData.buttons }]
+          : prev);
+      } catch (error) {
+        console.error('Error polling research:', error);
+      }
+    }, 3000);
+
+    return () => clearInterval(interval);
+  }, [researchPending, accountId, stageNumber]);
+
+  // Orchestrator validation runs in the background after completion; poll for the verdict
+  useEffect(() => {
+    if (stage?.validation_status !== 'pending' || !accountId || !stageNumber) return;
+
+    const interval = setInterval(async () => {
+      try {
+        const validation = await agentsAPI.getValidation(accountId, parseInt(stageNumber));
+        if (validation.validation_status === 'pending') return;
+
+        setStage(prev => prev ? {
+          ...prev,
+          status: validation.status,
+          validation_status: validation.validation_status,
+          orchestrator_approved: validation.orchestrator_approved ?? undefined,
+          orchestrator_score: validation.orchestrator_score ?? undefined,
+          orchestrator_feedback: validation.orchestrator_feedback ?? undefined,
+          output: validation.output,
+          completed_at: validation.completed_at ?? undefined
+        } : prev);
+      } catch (error) {
+        console.error('Error polling validation:', error);
+      }
+    }, 2000);
+
+    return () => clearInterval(interval);
+  }, [stage?.validation_status, accountId, stageNumber]);
+
   // View Mode State
   const [viewMode, setViewMode] = useState<'chat' | 'deliverables'>('chat');
 
@@ -68,22 +119,27 @@ const StageChat: React.FC = () => {
     if (!accountId || !stageNumber) return;
 
     try {
-      const [stageData, accountData] = await Promise.all([
+      const [stageData, accountData, storedMessages] = await Promise.all([
         stagesAPI.getByNumber(accountId, parseInt(stageNumber)),
-        accountsAPI.getById(accountId)
+        accountsAPI.getById(accountId),
+        stagesAPI.getMessages(accountId, parseInt(stageNumber))
       ]);
       setStage(stageData);
       setAccount(accountData);
 
-      const history: Message[] = stageData.state?.messages || [];
+      const history: Message[] = storedMessages
+        .filter(m => m.role !== 'system')
+        .map(m => ({ role: m.role as Message['role'], content: m.content }));
 
-      if (history.length === 0) {
+      // The greeting is stored server-side; reload it (with its buttons) until the consultant answers
+      if (!history.some(m => m.role === 'user')) {
         const initialData = await agentsAPI.getInitialMessage(accountId, parseInt(stageNumber));
         setMessages([{
           role: 'assistant',
           content: initialData.message,
           buttons: initialData.buttons
         }]);
+        setResearchPending(initialData.research_status === 'pending');
       } else {
         setMessages(history);
       }
@@ -222,18 +278,28 @@ const StageChat: React.FC = () => {
     const newMessages: Message[] = [...messages, { role: 'user', content: textToSend }];
     setMessages(newMessages);
 
-    try {
-      const response = await agentsAPI.chat(accountId, parseInt(stageNumber), {
-        message: textToSend,
-        state: { messages: newMessages },
-      });
-
+    const finishThinking = () => {
       clearInterval(thinkingInterval);
 
       // Complete active steps immediately
       setThoughtSteps(prev => prev.map(s =>
         s.status !== 'completed' ? { ...s, status: 'completed' as const } : s
       ));
+    };
+
+    try {
+      // The server keeps the conversation history; only the new message is sent.
+      // The reply is rendered token by token while the agent writes it.
+      let streamed = '';
+      const response = await agentsAPI.chatStream(accountId, parseInt(stageNumber), {
+        message: textToSend,
+      }, (text) => {
+        if (!streamed) finishThinking();
+        streamed += text;
+        setMessages([...newMessages, { role: 'assistant', content: streamed }]);
+      });
+
+      finishThinking();
 
       setMessages([...newMessages, {
         role: 'assistant',
@@ -248,10 +314,10 @@ const StageChat: React.FC = () => {
 
     } catch (error: any) {
       console.error('Error sending message:', error);
-      clearInterval(thinkingInterval);
+      finishThinking();
       setMessages([...newMessages, {
         role: 'assistant',
-        content: 'Error: ' + (error.response?.data?.detail || 'Failed to send message')
+        content: 'Error: ' + (error.message || 'Failed to send message')
       }]);
     } finally {
       setSending(false);
@@ -369,6 +435,7 @@ const StageChat: React.FC = () => {
         content: initialData.message,
         buttons: initialData.buttons
       }]);
+      setResearchPending(initialData.research_status === 'pending');
       setThoughtSteps([]);
     } catch (error) {
       console.error('Error resetting stage:', error);
@@ -446,6 +513,23 @@ const StageChat: React.FC = () => {
               }`}>
               {stage.status.toUpperCase()}
             </span>
+            {stage.validation_status === 'pending' && (
+              <span className="px-3 py-1.5 rounded-full text-xs font-bold bg-amber-50 text-amber-700">
+                VALIDANDO...
+              </span>
+            )}
+            {stage.validation_status === 'failed' && (
+              <button
+                onClick={async () => {
+                  if (!accountId || !stageNumber) return;
+                  const validation = await agentsAPI.retryValidation(accountId, parseInt(stageNumber));
+                  setStage(prev => prev ? { ...prev, validation_status: validation.validation_status } : prev);
+                }}
+                className="px-3 py-1.5 rounded-full text-xs font-bold bg-red-50 text-red-600 hover:bg-red-100"
+              >
+                Reintentar validación
+              </button>
+            )}
             <button
               onClick={handleResetClick}
               className="flex items-center gap-2 px-3 py-1.5 hover:bg-red-50 text-slate-400 hover:text-red-600 rounded-lg transition-all text-xs font-bold border border-transparent hover:border-red-100"
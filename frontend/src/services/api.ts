@@ -2,6 +2,7 @@ import axios from 'axios';
 import type {
   User,
   Account,
+  AccountSummaryListResponse,
   Stage,
   LoginRequest,
   RegisterRequest,
@@ -9,7 +10,12 @@ import type {
   AccountCreateRequest,
   ChatRequest,
   ChatResponse,
+  ChatStreamEvent,
   InitialMessageResponse,
+  ResearchStatusResponse,
+  StageValidationResponse,
+  StageMessage,
+  StageMessageListResponse,
 } from '../types';
 
 const API_BASE_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
@@ -50,6 +56,13 @@ export const accountsAPI = {
     const response = await api.get('/accounts');
     return response.data;
   },
+  // One page of account summaries; pass next_cursor back to fetch the following page
+  getSummaries: async (cursor?: string | null, limit = 50): Promise<AccountSummaryListResponse> => {
+    const response = await api.get('/accounts/summary', {
+      params: { limit, ...(cursor ? { cursor } : {}) }
+    });
+    return response.data;
+  },
   getById: async (id: string): Promise<Account> => {
     const response = await api.get(`/accounts/${id}`);
     return response.data;
@@ -80,6 +93,19 @@ export const stagesAPI = {
     const response = await api.patch(`/accounts/${accountId}/stages/${stageNumber}`, data);
     return response.data;
   },
+  getMessages: async (accountId: string, stageNumber: number): Promise<StageMessage[]> => {
+    const messages: StageMessage[] = [];
+    let afterSeq: number | null = -1;
+    while (afterSeq !== null) {
+      const response: { data: StageMessageListResponse } = await api.get(
+        `/accounts/${accountId}/stages/${stageNumber}/messages`,
+        { params: { after_seq: afterSeq, limit: 500 } }
+      );
+      messages.push(...response.data.messages);
+      afterSeq = response.data.next_after_seq;
+    }
+    return messages;
+  },
   reset: async (accountId: string, stageNumber: number): Promise<Stage> => {
     const response = await api.post(`/accounts/${accountId}/stages/${stageNumber}/reset`);
     return response.data;
@@ -91,10 +117,74 @@ export const agentsAPI = {
     const response = await api.get(`/agents/accounts/${accountId}/stages/${stageNumber}/init`);
     return response.data;
   },
+  getResearch: async (accountId: string): Promise<ResearchStatusResponse> => {
+    const response = await api.get(`/agents/accounts/${accountId}/research`);
+    return response.data;
+  },
+  getValidation: async (accountId: string, stageNumber: number): Promise<StageValidationResponse> => {
+    const response = await api.get(`/agents/accounts/${accountId}/stages/${stageNumber}/validation`);
+    return response.data;
+  },
+  retryValidation: async (accountId: string, stageNumber: number): Promise<StageValidationResponse> => {
+    const response = await api.post(`/agents/accounts/${accountId}/stages/${stageNumber}/validation/retry`);
+    return response.data;
+  },
   chat: async (accountId: string, stageNumber: number, data: ChatRequest): Promise<ChatResponse> => {
     const response = await api.post(`/agents/accounts/${accountId}/stages/${stageNumber}/chat`, data);
     return response.data;
   },
+  // Streaming chat (server-sent events): onToken gets agent text as it is generated,
+  // the promise resolves with the same payload as chat() once the turn is saved
+  chatStream: async (
+    accountId: string,
+    stageNumber: number,
+    data: ChatRequest,
+    onToken: (text: string) => void
+  ): Promise<ChatResponse> => {
+    const token = localStorage.getItem('token');
+    const response = await fetch(`${API_BASE_URL}/agents/accounts/${accountId}/stages/${stageNumber}/chat/stream`, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+        ...(token ? { Authorization: `Bearer ${token}` } : {})
+      },
+      body: JSON.stringify(data)
+    });
+
+    // Errors raised before the stream starts (locked stage, not found...) come back as plain JSON
+    if (!response.ok || !response.body) {
+      const body = await response.json().catch(() => ({}));
+      throw new Error(body.detail || `Request failed with status ${response.status}`);
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    while (true) {
+      const { done, value } = await reader.read();
+      if (done) break;
+
+      buffer += decoder.decode(value, { stream: true });
+      const frames = buffer.split('\n\n');
+      buffer = frames.pop() || ''; // Keep the incomplete event for the next chunk
+
+      for (const frame of frames) {
+        const payload = frame.split('\n').filter(line => line.startsWith('data: ')).map(line => line.slice(6)).join('\n');
+        if (!payload) continue;
+
+        const event: ChatStreamEvent = JSON.parse(payload);
+        if (event.type === 'token') {
+          onToken(event.content);
+        } else if (event.type === 'complete') {
+          return event;
+        } else if (event.type === 'error') {
+          throw new Error(event.detail);
+        }
+      }
+    }
+    throw new Error('The stream ended before the response was complete');
+  },
 };
 
 export const exportsAPI = {
@@ -25,6 +25,7 @@ export interface Stage {
   state: Record<string, any>;
   output: Record<string, any> | null;
   ai_model_used: string | null;
+  message_count?: number;
   created_at: string;
   updated_at: string;
   completed_at?: string;
@@ -34,6 +35,47 @@ export interface Stage {
     issues: any[];
     suggestions: any[];
   };
+  validation_status?: ValidationStatus | null;
+}
+
+export type ValidationStatus = 'pending' | 'completed' | 'failed';
+
+export interface StageValidationResponse {
+  stage_number: number;
+  status: 'locked' | 'in_progress' | 'completed';
+  validation_status: ValidationStatus | null;
+  orchestrator_approved: boolean | null;
+  orchestrator_score: number | null;
+  orchestrator_feedback: { issues: any[]; suggestions: any[] } | null;
+  output: Record<string, any> | null;
+  completed_at: string | null;
+}
+
+export interface StageSummary {
+  id: string;
+  stage_number: number;
+  status: 'locked' | 'in_progress' | 'completed';
+  orchestrator_approved?: boolean | null;
+  orchestrator_score?: number | null;
+  created_at: string;
+  updated_at: string;
+  completed_at?: string | null;
+}
+
+export interface AccountSummary {
+  id: string;
+  user_id: string;
+  client_name: string;
+  company_website: string | null;
+  ai_model: string;
+  created_at: string;
+  updated_at: string;
+  stages: StageSummary[];
+}
+
+export interface AccountSummaryListResponse {
+  accounts: AccountSummary[];
+  next_cursor: string | null;
 }
 
 export interface LoginRequest {
@@ -54,7 +96,7 @@ export interface TokenResponse {
 
 export interface AccountCreateRequest {
   client_name: string;
-  company_website?: string;
+  company_website: string | null;
   ai_model?: string;
 }
 
@@ -63,6 +105,18 @@ export interface ChatMessage {
   content: string;
 }
 
+export interface StageMessage {
+  seq: number;
+  role: 'system' | 'user' | 'assistant';
+  content: string;
+  created_at: string;
+}
+
+export interface StageMessageListResponse {
+  messages: StageMessage[];
+  next_after_seq: number | null;
+}
+
 export interface ChatRequest {
   message: string;
   state?: Record<string, any>;
@@ -78,9 +132,23 @@ export interface ChatResponse {
   progressStep?: string;
 }
 
+// Events of POST .../chat/stream
+export type ChatStreamEvent =
+  | { type: 'token'; content: string }
+  | ({ type: 'complete' } & ChatResponse)
+  | { type: 'error'; detail: string; retryable?: boolean };
+
 export interface InitialMessageResponse {
   message: string;
   stage_number: number;
   status: string;
   buttons?: string[];
+  research_status?: ResearchStatus | null;
+}
+
+export type ResearchStatus = 'pending' | 'ready' | 'failed';
+
+export interface ResearchStatusResponse {
+  research_status: ResearchStatus | null;
+  research_data: Record<string, any> | null;
 }